@@ -2,8 +2,7 @@
 
 import argparse
 import sys
-from . import commands
-from lixplore.utils.cache import cleanup_cache  # import correctly
+from lixplore.utils import cache
 
 
 def _configure_stdio():
@@ -32,19 +31,53 @@ def _configure_stdio():
         pass
 
 
-def main():
-    # Ensure safe I/O early
-    _configure_stdio()
+def _format_size(num_bytes):
+    for unit in ("B", "KB", "MB", "GB"):
+        if num_bytes < 1024 or unit == "GB":
+            return f"{num_bytes:.0f} {unit}" if unit == "B" else f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
 
-    # run cleanup first
-    cleanup_cache(days=7)
+
+def cache_main(argv):
+    """Handle `lixplore cache ...` maintenance commands."""
+    parser = argparse.ArgumentParser(
+        prog="lixplore cache",
+        description="Manage the Lixplore cache (~/.lixplore_cache)"
+    )
+    subparsers = parser.add_subparsers(dest="action")
+    gc_parser = subparsers.add_parser("gc", help="Remove expired cache files and trim the response cache")
+    gc_parser.add_argument(
+        "--days", type=int, default=cache.CACHE_MAX_AGE_DAYS,
+        help="Remove cache files older than this many days"
+    )
+    args = parser.parse_args(argv)
+
+    if args.action == "gc":
+        removed, freed = cache.gc_cache(days=args.days)
+        print(f"Cache cleanup complete: removed {removed} file(s), freed {_format_size(freed)}")
+    else:
+        parser.print_help()
+
+
+def build_parser():
+    """Build the argument parser for the main command."""
+    from . import commands
 
     parser = argparse.ArgumentParser(
         description="Lixplore Literature CLI Tool",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
     )
     commands.add_commands(parser)
-    args = parser.parse_args()
+    return parser
+
+
+def run(argv):
+    """Parse argv and run the command in this process."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    # Incremental cache housekeeping, off the critical path
+    cache.schedule_cache_sweep()
 
     if hasattr(args, "func"):
         args.func(args)
@@ -52,6 +85,28 @@ def main():
         parser.print_help()
 
 
+def main():
+    # Ensure safe I/O early
+    _configure_stdio()
+    argv = sys.argv[1:]
+
+    # Maintenance subcommands have their own small parser
+    if argv[:1] == ["cache"]:
+        cache_main(argv[1:])
+        return
+
+    from lixplore import daemon
+
+    if argv[:1] == ["serve"]:
+        sys.exit(daemon.serve_main(argv[1:]))
+
+    # Hand the command to a running `lixplore serve`, if there is one
+    code = daemon.forward(argv)
+    if code is not None:
+        sys.exit(code)
+
+    run(argv)
+
+
 if __name__ == "__main__":
     main()
-
@@ -52,6 +52,7 @@ EXPORT FORMATS:
   csv      - CSV format (Excel, Google Sheets)
   xlsx     - Microsoft Excel format with formatting
   json     - JSON structured data
+  jsonl    - JSON Lines (one article per line)
   bibtex   - BibTeX format for LaTeX citations
   ris      - RIS format (Zotero, Mendeley, RefWorks)
   enw      - EndNote Tagged format (recommended for EndNote)
@@ -63,6 +64,7 @@ EXPORT LOCATIONS:
     exports/csv/              - CSV files
     exports/excel/            - Excel files
     exports/json/             - JSON files
+    exports/jsonl/            - JSON Lines files
     exports/bibtex/           - BibTeX files
     exports/ris/              - RIS files
     exports/endnote_tagged/   - EndNote .enw files
@@ -133,6 +135,14 @@ For more information, visit: https://github.com/yourusername/lixplore
         "-m", "--max_results", type=int, default=10, metavar="N",
         help="Maximum number of results to fetch per source (default: 10). Example: -m 50"
     )
+    search_group.add_argument(
+        "--source-timeout", type=float, metavar="SECONDS",
+        help="Seconds to wait for each source before reporting it as slow (default: per-source, 20-30s). Sources are searched concurrently. Example: --source-timeout 15"
+    )
+    search_group.add_argument(
+        "--deadline", type=float, default=dispatcher.SEARCH_DEADLINE, metavar="SECONDS",
+        help="Overall time budget for a multi-source search. Sources that have not answered by then are skipped and partial results are shown. Example: --deadline 30"
+    )
     
     # ===== FILTERING & PROCESSING =====
     filter_group = parser.add_argument_group(
@@ -173,6 +183,10 @@ For more information, visit: https://github.com/yourusername/lixplore
         choices=["crossref", "pubmed", "arxiv", "all"],
         help="Enrich metadata using external APIs. Use without arguments for all, or specify: crossref, pubmed, arxiv. Automatically validates and finds missing DOIs. Example: --enrich or --enrich crossref pubmed"
     )
+    filter_group.add_argument(
+        "--enrich-dry-run", action="store_true",
+        help="Show which enrichment lookups would run and how many requests they need, without sending them. Articles that already have every field an API provides, or that came from that API, are skipped. Uses the APIs given to --enrich (default: all). Example: -P -q 'cancer' -m 50 --enrich --enrich-dry-run"
+    )
 
     # ===== DISPLAY OPTIONS =====
     display_group = parser.add_argument_group(
@@ -226,7 +240,11 @@ For more information, visit: https://github.com/yourusername/lixplore
     export_group.add_argument(
         "-X", "--export", type=str,
         metavar="FORMAT",
-        help="Export results to format(s). Single format: csv, json, bibtex, ris, endnote (XML), enw (EndNote Tagged), xlsx (Excel), xml. Multiple formats (comma-separated): csv,ris,bibtex. Files saved to exports/ folder. Example: -X csv or -X csv,ris,bibtex"
+        help="Export results to format(s). Single format: csv, json, jsonl (JSON Lines), bibtex, ris, endnote (XML), enw (EndNote Tagged), xlsx (Excel), xml. Multiple formats (comma-separated): csv,ris,bibtex. Files saved to exports/ folder. Example: -X csv or -X csv,ris,bibtex"
+    )
+    export_group.add_argument(
+        "--stream", action="store_true",
+        help="Stream results page by page straight into the export file(s) instead of collecting them first. Memory stays flat for very large -m values. Works with csv, jsonl, ris, bibtex and enw; -d, -D and --enrich are applied on the fly (duplicates keep the first occurrence). Results are not displayed, sorted or cached. Example: -A -q 'cancer' -m 50000 -D -X jsonl --stream"
     )
     export_group.add_argument(
         "-o", "--output", type=str, metavar="FILE",
@@ -270,6 +288,14 @@ For more information, visit: https://github.com/yourusername/lixplore
         "--pdf-numbers", type=int, nargs="+", metavar="N",
         help="Download PDFs only for specific article numbers. Example: --pdf-numbers 1 3 5"
     )
+    export_group.add_argument(
+        "--pdf-workers", type=int, default=4, metavar="N",
+        help="Number of PDFs downloaded in parallel (default: 4). At most 2 downloads run against the same host. Interrupted downloads resume on the next run. Example: --download-pdf --pdf-workers 8"
+    )
+    export_group.add_argument(
+        "--pdf-max-rate", type=str, metavar="RATE",
+        help="Overall bandwidth cap for PDF downloads, in bytes per second with optional K/M/G suffix. Example: --download-pdf --pdf-max-rate 2M"
+    )
     export_group.add_argument(
         "--use-scihub", action="store_true",
         help="Use SciHub as fallback for PDF download (requires --set-scihub-mirror configuration). Use at your own discretion."
@@ -297,9 +323,29 @@ For more information, visit: https://github.com/yourusername/lixplore
         "-H", "--history", action="store_true",
         help="Show search history"
     )
+    utility_group.add_argument(
+        "--rerun", type=str, metavar="N|QUERY",
+        help="Re-run search N from -H/--history (or the latest search for QUERY) with the same sources. Served from its saved result session when available; add --refresh to search again"
+    )
+    utility_group.add_argument(
+        "--session", type=str, metavar="NAME",
+        help="Name of the result session. With a search: save the results under NAME. Without one: use session NAME (a name or number from --list-sessions) for -R, -N, -X, --stat and the annotation options. Example: --session review2024"
+    )
+    utility_group.add_argument(
+        "--list-sessions", action="store_true",
+        help="List saved result sessions (every search is kept as a session; the oldest are evicted first)"
+    )
+    utility_group.add_argument(
+        "--delete-session", type=str, metavar="NAME",
+        help="Delete a saved result session"
+    )
     utility_group.add_argument(
         "--refresh", action="store_true",
-        help="Bypass cache and fetch fresh results (ignore cached data)"
+        help="Bypass cache and fetch fresh results (ignore cached data). Fresh responses are still cached for next time"
+    )
+    utility_group.add_argument(
+        "--no-cache", action="store_true",
+        help="Do not read or write the source response cache (~/.lixplore_cache/responses) for this search"
     )
     utility_group.add_argument(
         "--examples", action="store_true",
@@ -411,6 +457,10 @@ For more information, visit: https://github.com/yourusername/lixplore
         "--export-annotations", type=str, choices=['markdown', 'json', 'csv'], metavar="FORMAT",
         help="Export all annotations to file. Formats: markdown, json, csv. Example: --export-annotations markdown"
     )
+    annotation_group.add_argument(
+        "--import-annotations", type=str, metavar="FILE",
+        help="Import annotations from a JSON file (the --export-annotations json format or ~/.lixplore_annotations.json)"
+    )
     annotation_group.add_argument(
         "--annotation-stats", action="store_true",
         help="Show annotation statistics (total, ratings distribution, tags, etc.)"
@@ -423,6 +473,67 @@ For more information, visit: https://github.com/yourusername/lixplore
     parser.set_defaults(func=run_main)
 
 
+def run_stream(args, sources, query, custom_api=None):
+    """
+    Run a search in streaming mode (--stream).
+
+    Articles flow from the source pages through the date filter,
+    deduplication and enrichment into the exporters one at a time.
+
+    Args:
+        args: Parsed CLI arguments
+        sources: List of source names to search
+        query: Search query string
+        custom_api: Optional custom API name
+    """
+    from lixplore.utils.export import STREAM_FORMATS
+
+    if not args.export:
+        print("Error: --stream writes directly to export files, so it needs -X/--export")
+        print(f"Streamable formats: {', '.join(STREAM_FORMATS)}")
+        print("Example: lixplore -A -q \"cancer\" -m 5000 -X jsonl --stream")
+        return
+
+    formats = [f.strip() for f in args.export.split(',')]
+    invalid_formats = [f for f in formats if f not in STREAM_FORMATS]
+    if invalid_formats:
+        print(f"Error: Format(s) cannot be streamed: {', '.join(invalid_formats)}")
+        print(f"Streamable formats: {', '.join(STREAM_FORMATS)}")
+        return
+
+    if args.sort and args.sort != "relevant":
+        print("Note: --sort is ignored with --stream (results are written as they arrive)")
+    if args.select:
+        print("Note: -S/--select is ignored with --stream (all results are exported)")
+
+    print(f"Streaming results to: {', '.join(formats)}")
+
+    articles = dispatcher.iter_search(sources, query, limit=args.max_results, custom_api=custom_api)
+
+    if args.date:
+        articles = dispatcher.filter_stream(articles, args.date)
+
+    dedup_stats = {}
+    if args.deduplicate:
+        articles = dispatcher.dedup_stream(articles, args.deduplicate, args.dedup_threshold, dedup_stats)
+
+    if getattr(args, 'enrich_dry_run', False):
+        print("Note: --enrich-dry-run is ignored with --stream (no enrichment is done)")
+    elif args.enrich is not None:
+        from lixplore.utils.enrichment import enrich_stream
+        articles = enrich_stream(articles, args.enrich if args.enrich else ['all'])
+
+    count, _ = dispatcher.export_stream(articles, formats, args.output, args.export_fields, args.zip)
+
+    if dedup_stats.get('duplicates'):
+        print(f"Deduplication ({args.deduplicate}): removed {dedup_stats['duplicates']} duplicate(s)")
+
+    all_sources = list(sources)
+    if custom_api:
+        all_sources.append(f"custom:{custom_api}")
+    dispatcher.save_to_history(query=query, sources=all_sources, result_count=count)
+
+
 def sort_results(results, sort_order):
     """
     Sort results based on specified order.
@@ -864,6 +975,158 @@ def show_examples():
     print(_examples_text(unicode_ok))
 
 
+def export_results(args, results):
+    """
+    Handle -X/--export (with --select, --output, --export-fields and --zip).
+
+    Args:
+        args: Parsed command-line arguments
+        results: Sequence of article dictionaries
+
+    Returns:
+        False if the requested formats are invalid, True otherwise
+    """
+    # Check if multiple formats specified (comma-separated)
+    formats = [f.strip() for f in args.export.split(',')]
+
+    # Validate formats
+    valid_formats = ["csv", "json", "jsonl", "bibtex", "ris", "endnote", "enw", "xlsx", "xml"]
+    invalid_formats = [f for f in formats if f not in valid_formats]
+    if invalid_formats:
+        print(f"Error: Invalid export format(s): {', '.join(invalid_formats)}")
+        print(f"Valid formats: {', '.join(valid_formats)}")
+        return False
+
+    # Filter results if specific articles selected
+    if args.select:
+        # Parse selection arguments (supports: numbers, ranges, keywords)
+        selected_numbers = parse_selection(args.select, len(results))
+
+        if selected_numbers:
+            selected_results = [results[num - 1] for num in selected_numbers]
+            print(f"Selected articles: {', '.join(f'#{n}' for n in selected_numbers)}")
+            print(f"Exporting {len(selected_results)} selected article(s)...")
+
+            # Use batch export if multiple formats, otherwise single export
+            if len(formats) > 1:
+                # Extract base filename from output (remove extension)
+                output_base = args.output.rsplit('.', 1)[0] if args.output else None
+                dispatcher.batch_export(selected_results, formats, output_base, args.export_fields, args.zip)
+            else:
+                dispatcher.export_to_format(selected_results, formats[0], args.output, args.export_fields, args.zip)
+        else:
+            print("No valid articles selected for export.")
+    else:
+        # Export all results
+        if len(formats) > 1:
+            # Batch export: Extract base filename from output (remove extension)
+            output_base = args.output.rsplit('.', 1)[0] if args.output else None
+            dispatcher.batch_export(results, formats, output_base, args.export_fields, args.zip)
+        else:
+            # Single format export
+            dispatcher.export_to_format(results, formats[0], args.output, args.export_fields, args.zip)
+
+    return True
+
+
+def annotate_results(args, results):
+    """
+    Handle --annotate, --show-annotation and --delete-annotation.
+
+    Args:
+        args: Parsed command-line arguments
+        results: Sequence of article dictionaries (search results or cached results)
+    """
+    from lixplore.utils.annotations import AnnotationManager, display_annotation
+
+    manager = AnnotationManager()
+
+    # Annotate article
+    if args.annotate:
+        article_num = args.annotate
+        if 1 <= article_num <= len(results):
+            article = results[article_num - 1]
+
+            # Collect annotation data
+            tags_list = None
+            if args.tags:
+                tags_list = [t.strip() for t in args.tags.split(',')]
+
+            # Add annotation
+            article_id = manager.annotate(
+                article=article,
+                comment=args.comment if hasattr(args, 'comment') and args.comment else None,
+                rating=args.rating if hasattr(args, 'rating') and args.rating else None,
+                tags=tags_list,
+                read_status=args.read_status if hasattr(args, 'read_status') and args.read_status else None,
+                priority=args.priority if hasattr(args, 'priority') and args.priority else None
+            )
+
+            print(f"\nAnnotation saved for article #{article_num}: {article.get('title', 'No title')[:60]}...")
+
+            # Show the annotation
+            annotation = manager.get_annotation(article_id)
+            if annotation:
+                display_annotation(annotation, article_id)
+        else:
+            print(f"Error: Article #{article_num} is out of range (1-{len(results)})")
+
+    # Show annotation
+    if args.show_annotation:
+        article_num = args.show_annotation
+        if 1 <= article_num <= len(results):
+            article = results[article_num - 1]
+            annotation = manager.get_annotation_for_article(article)
+
+            if annotation:
+                article_id = manager._get_article_id(article)
+                display_annotation(annotation, article_id)
+            else:
+                print(f"\nNo annotation found for article #{article_num}")
+                print(f"Add annotation with: lixplore --annotate {article_num} --rating 5 --tags 'important'")
+        else:
+            print(f"Error: Article #{article_num} is out of range (1-{len(results)})")
+
+    # Delete annotation
+    if args.delete_annotation:
+        article_num = args.delete_annotation
+        if 1 <= article_num <= len(results):
+            article = results[article_num - 1]
+            article_id = manager._get_article_id(article)
+
+            if manager.remove_annotation(article_id):
+                print(f"Annotation deleted for article #{article_num}")
+            else:
+                print(f"No annotation found for article #{article_num}")
+        else:
+            print(f"Error: Article #{article_num} is out of range (1-{len(results)})")
+
+
+def cached_result_actions(args, results):
+    """
+    Handle -N, -X, --stat, -R and the annotation options on cached results.
+
+    Args:
+        args: Parsed command-line arguments
+        results: Cached results (a lazily decoded sequence)
+    """
+    for n in args.number:
+        if 1 <= n <= len(results):
+            print("\n=== Detailed View ===")
+            print(json.dumps(results[n - 1], indent=2, ensure_ascii=False))
+        else:
+            print(f"Selection out of range: {n} (valid 1..{len(results)})")
+    if args.export:
+        export_results(args, list(results))
+    if args.stat:
+        from lixplore.utils.statistics import generate_statistics_report
+        print(generate_statistics_report(list(results), top_n=args.stat_top))
+    if args.review:
+        dispatcher.review_articles(results, args.review)
+    if args.annotate or args.show_annotation or args.delete_annotation:
+        annotate_results(args, results)
+
+
 def run_main(args):
     """Main handler for CLI options."""
 
@@ -905,7 +1168,7 @@ def run_main(args):
 
     # If user only wants history
     # Handle annotation commands
-    from lixplore.utils.annotations import AnnotationManager, display_annotation
+    from lixplore.utils.annotations import AnnotationManager
 
     # Annotation-only commands (don't require search)
     if args.list_annotations:
@@ -1000,6 +1263,12 @@ def run_main(args):
         print(f"Annotations exported to: {output_file}")
         return
 
+    if getattr(args, 'import_annotations', None):
+        manager = AnnotationManager()
+        count = manager.import_json(args.import_annotations)
+        print(f"Imported {count} annotation(s) from: {args.import_annotations}")
+        return
+
     if args.annotation_stats:
         manager = AnnotationManager()
         stats = manager.get_statistics()
@@ -1057,7 +1326,6 @@ def run_main(args):
     # Handle template and profile management commands
     from lixplore.utils import profiles
     from lixplore.utils import template_engine
-    from lixplore.utils import custom_apis
 
     # Handle PDF downloader configuration commands
     from lixplore.utils import pdf_downloader
@@ -1069,10 +1337,15 @@ def run_main(args):
     if args.show_pdf_dir:
         print(f"PDF download directory: {pdf_downloader.PDF_DIR}")
         if os.path.exists(pdf_downloader.PDF_DIR):
-            # Count PDFs
+            # Count PDFs (the library holds the stored copies the names link to)
+            from lixplore.utils import pdf_library
+            library = pdf_library.library_dir()
             pdf_count = sum(1 for root, dirs, files in os.walk(pdf_downloader.PDF_DIR)
+                          if not root.startswith(library)
                           for f in files if f.endswith('.pdf'))
             print(f"Total PDFs downloaded: {pdf_count}")
+            stored, size = pdf_library.stats()
+            print(f"Unique PDFs in library: {stored} ({size / 1024 ** 2:.1f} MB)")
         else:
             print("(Directory does not exist yet - will be created on first download)")
         return
@@ -1091,6 +1364,7 @@ def run_main(args):
 
     # Handle custom API management commands
     if args.list_custom_apis:
+        from lixplore.utils import custom_apis
         api_list = custom_apis.list_custom_apis()
         if api_list:
             print("Configured custom API sources:")
@@ -1108,6 +1382,7 @@ def run_main(args):
         return
 
     if args.create_api_examples:
+        from lixplore.utils import custom_apis
         custom_apis.create_example_configs()
         return
 
@@ -1174,17 +1449,75 @@ def run_main(args):
         dispatcher.show_history()
         return
 
-    # If user only wants to review cached results (no new search)
-    if args.review and not any([args.pubmed, args.crossref, args.doaj, args.europepmc, args.arxiv, args.all, args.sources, args.query]):
-        # Load cached results and review (ignore --refresh flag for standalone review)
-        cached_results = dispatcher.load_cached_results(check_expiry=True, force_refresh=False)
+    if getattr(args, 'list_sessions', False):
+        dispatcher.show_sessions()
+        return
+
+    if getattr(args, 'delete_session', None):
+        from lixplore.utils import sessions
+        if sessions.delete(args.delete_session):
+            print(f"Session '{args.delete_session}' deleted")
+        else:
+            print(f"Error: Session '{args.delete_session}' not found")
+            print("Use --list-sessions to see saved sessions")
+        return
+
+    # Re-run a search from history, from its result session when it still exists
+    if getattr(args, 'rerun', None):
+        from lixplore.utils import history
+        entry = history.get_entry(int(args.rerun)) if args.rerun.isdigit() else history.find(args.rerun)
+        if not entry:
+            print(f"Error: No search '{args.rerun}' in history")
+            print("Use -H to see search history")
+            return
+
+        entry_session = entry.get('session')
+        cached_results = None
+        if entry_session and not args.refresh:
+            cached_results = dispatcher.load_cached_results(check_expiry=True, session=entry_session)
         if cached_results:
+            print(f"Re-running from session '{entry_session}' (use --refresh to search again): {entry.get('query')}")
+            results = list(cached_results)
+            print(f"\nFound {len(results)} results:")
+            dispatcher.show_results(results, args)
+            cached_result_actions(args, cached_results)
+            return
+
+        # Search again with the same query and sources
+        print(f"Re-running search: {entry.get('query')}")
+        args.query = entry.get('query')
+        for src in entry.get('sources', []):
+            if src.startswith('custom:'):
+                args.custom_api = src.split(':', 1)[1]
+            elif src in dispatcher.SOURCE_MODULES:
+                setattr(args, src, True)
+
+    # If user only wants to review, annotate or export cached results (no new search)
+    session = getattr(args, 'session', None)
+    uses_cached = args.review or args.annotate or args.show_annotation or args.delete_annotation
+    if session:
+        uses_cached = uses_cached or args.number or args.export or args.stat
+    if uses_cached and not any([args.pubmed, args.crossref, args.doaj, args.europepmc, args.arxiv, args.all, args.sources, args.query]):
+        # Load cached results (ignore --refresh flag for standalone review).
+        # An explicitly selected session never expires.
+        cached_results = dispatcher.load_cached_results(check_expiry=not session, force_refresh=False, session=session)
+        if session and cached_results is None:
+            print(f"Error: Session '{session}' not found")
+            print("Use --list-sessions to see saved sessions")
+            return
+        if cached_results:
+            # Only the requested articles are read from the cache
             print(f"Loading cached results ({len(cached_results)} articles)...")
-            print("\nCached results:")
-            for i, result in enumerate(cached_results, 1):
-                print(f"[{i}] {result.get('title', 'No title')}")
-            print("")
-            dispatcher.review_articles(cached_results, args.review)
+            requested = list(args.review or []) + list(args.number or []) + [
+                n for n in (args.annotate, args.show_annotation, args.delete_annotation) if n
+            ]
+            if requested:
+                print("\nCached results:")
+                for i in dict.fromkeys(requested):
+                    if 1 <= i <= len(cached_results):
+                        print(f"[{i}] {cached_results[i - 1].get('title', 'No title')}")
+                print("")
+            cached_result_actions(args, cached_results)
         else:
             print("No cached results found. Please run a search first.")
             print("Example: lixplore -P -q \"paracetamol\" -m 5")
@@ -1306,25 +1639,30 @@ def run_main(args):
     if use_custom_api:
         print(f"Custom API: {custom_api_name}")
 
-    #  Execute search on selected sources
-    for src in sources_to_search:
-        print(f"  Searching {source_names[src]}...")
-        src_results = dispatcher.search(
-            source=src,
-            query=query,
-            limit=args.max_results,
-        )
-        results.extend(src_results)
+    #  Streaming mode: articles go from the source pages straight to disk
+    if getattr(args, 'stream', False):
+        run_stream(args, sources_to_search, query, custom_api_name if use_custom_api else None)
+        return
 
-    #  Execute search on custom API if selected
-    if use_custom_api:
-        print(f"  Searching {custom_api_name} (custom API)...")
-        custom_results = custom_apis.call_custom_api(custom_api_name, query, args.max_results)
-        results.extend(custom_results)
+    #  Execute search on all selected sources (and custom API) concurrently
+    results, _ = dispatcher.search_many(
+        sources_to_search,
+        query,
+        limit=args.max_results,
+        custom_api=custom_api_name if use_custom_api else None,
+        source_timeout=getattr(args, 'source_timeout', None),
+        deadline=getattr(args, 'deadline', dispatcher.SEARCH_DEADLINE),
+        use_cache=not getattr(args, 'no_cache', False),
+        refresh=getattr(args, 'refresh', False),
+    )
 
     if (len(sources_to_search) > 1) or (len(sources_to_search) > 0 and use_custom_api):
         print(f"Total results before deduplication: {len(results)}")
 
+    #  Date filter
+    if args.date and results:
+        results = dispatcher.filter_by_date(results, args.date)
+
     #  Post-processing
     if args.deduplicate and results:
         print("Removing duplicates")
@@ -1337,7 +1675,10 @@ def run_main(args):
         )
 
     #  Enrich metadata if requested
-    if args.enrich is not None and results:
+    if getattr(args, 'enrich_dry_run', False) and results:
+        from lixplore.utils.enrichment import print_enrichment_plan
+        print_enrichment_plan(results, args.enrich if args.enrich else ['all'])
+    elif args.enrich is not None and results:
         from lixplore.utils.enrichment import enrich_results
         # If --enrich used without arguments, use all APIs
         apis = args.enrich if args.enrich else ['all']
@@ -1350,46 +1691,9 @@ def run_main(args):
 
     #  Export to file format if requested
     if args.export and results:
-        # Check if multiple formats specified (comma-separated)
-        formats = [f.strip() for f in args.export.split(',')]
-
-        # Validate formats
-        valid_formats = ["csv", "json", "bibtex", "ris", "endnote", "enw", "xlsx", "xml"]
-        invalid_formats = [f for f in formats if f not in valid_formats]
-        if invalid_formats:
-            print(f"Error: Invalid export format(s): {', '.join(invalid_formats)}")
-            print(f"Valid formats: {', '.join(valid_formats)}")
+        if not export_results(args, results):
             return
 
-        # Filter results if specific articles selected
-        if args.select:
-            # Parse selection arguments (supports: numbers, ranges, keywords)
-            selected_numbers = parse_selection(args.select, len(results))
-
-            if selected_numbers:
-                selected_results = [results[num - 1] for num in selected_numbers]
-                print(f"Selected articles: {', '.join(f'#{n}' for n in selected_numbers)}")
-                print(f"Exporting {len(selected_results)} selected article(s)...")
-
-                # Use batch export if multiple formats, otherwise single export
-                if len(formats) > 1:
-                    # Extract base filename from output (remove extension)
-                    output_base = args.output.rsplit('.', 1)[0] if args.output else None
-                    dispatcher.batch_export(selected_results, formats, output_base, args.export_fields, args.zip)
-                else:
-                    dispatcher.export_to_format(selected_results, formats[0], args.output, args.export_fields, args.zip)
-            else:
-                print("No valid articles selected for export.")
-        else:
-            # Export all results
-            if len(formats) > 1:
-                # Batch export: Extract base filename from output (remove extension)
-                output_base = args.output.rsplit('.', 1)[0] if args.output else None
-                dispatcher.batch_export(results, formats, output_base, args.export_fields, args.zip)
-            else:
-                # Single format export
-                dispatcher.export_to_format(results, formats[0], args.output, args.export_fields, args.zip)
-
     #  Export as formatted citations if requested
     if args.citations and results:
         from lixplore.utils.export import export_to_citations, compress_export
@@ -1420,10 +1724,13 @@ def run_main(args):
         all_sources = sources_to_search.copy()
         if use_custom_api:
             all_sources.append(f"custom:{custom_api_name}")
-        dispatcher.save_results(results, query=query, sources=all_sources)
+        session_name = dispatcher.save_results(results, query=query, sources=all_sources,
+                                               session=getattr(args, 'session', None))
+        if session_name:
+            print(f"Results saved as session '{session_name}' (lixplore --session {session_name} -R 1)")
 
         # Save to search history
-        dispatcher.save_to_history(query=query, sources=all_sources, result_count=len(results))
+        dispatcher.save_to_history(query=query, sources=all_sources, result_count=len(results), session=session_name)
 
         # If user requested detailed view(s) via -N, print them inline
         if args.number:
@@ -1442,11 +1749,18 @@ def run_main(args):
         #  Download PDFs if requested
         if args.download_pdf:
             pdf_numbers = args.pdf_numbers if args.pdf_numbers else None
-            pdf_downloader.download_multiple_pdfs(
-                results,
-                article_numbers=pdf_numbers,
-                use_scihub=args.use_scihub
-            )
+            rate_text = getattr(args, 'pdf_max_rate', None)
+            max_rate = pdf_downloader.parse_rate(rate_text) if rate_text else None
+            if rate_text and max_rate is None:
+                print(f"Error: Invalid --pdf-max-rate '{rate_text}'. Examples: 500K, 2M")
+            else:
+                pdf_downloader.download_multiple_pdfs(
+                    results,
+                    article_numbers=pdf_numbers,
+                    use_scihub=args.use_scihub,
+                    workers=getattr(args, 'pdf_workers', None) or pdf_downloader.PDF_WORKERS,
+                    max_rate=max_rate
+                )
 
         #  Add to Zotero if requested
         if args.add_to_zotero:
@@ -1476,67 +1790,7 @@ def run_main(args):
 
         #  Handle annotations for articles from search results
         if args.annotate or args.show_annotation or args.delete_annotation:
-            manager = AnnotationManager()
-
-            # Annotate article
-            if args.annotate:
-                article_num = args.annotate
-                if 1 <= article_num <= len(results):
-                    article = results[article_num - 1]
-
-                    # Collect annotation data
-                    tags_list = None
-                    if args.tags:
-                        tags_list = [t.strip() for t in args.tags.split(',')]
-
-                    # Add annotation
-                    article_id = manager.annotate(
-                        article=article,
-                        comment=args.comment if hasattr(args, 'comment') and args.comment else None,
-                        rating=args.rating if hasattr(args, 'rating') and args.rating else None,
-                        tags=tags_list,
-                        read_status=args.read_status if hasattr(args, 'read_status') and args.read_status else None,
-                        priority=args.priority if hasattr(args, 'priority') and args.priority else None
-                    )
-
-                    print(f"\nAnnotation saved for article #{article_num}: {article.get('title', 'No title')[:60]}...")
-
-                    # Show the annotation
-                    annotation = manager.get_annotation(article_id)
-                    if annotation:
-                        display_annotation(annotation, article_id)
-                else:
-                    print(f"Error: Article #{article_num} is out of range (1-{len(results)})")
-
-            # Show annotation
-            if args.show_annotation:
-                article_num = args.show_annotation
-                if 1 <= article_num <= len(results):
-                    article = results[article_num - 1]
-                    annotation = manager.get_annotation_for_article(article)
-
-                    if annotation:
-                        article_id = manager._get_article_id(article)
-                        display_annotation(annotation, article_id)
-                    else:
-                        print(f"\nNo annotation found for article #{article_num}")
-                        print(f"Add annotation with: lixplore --annotate {article_num} --rating 5 --tags 'important'")
-                else:
-                    print(f"Error: Article #{article_num} is out of range (1-{len(results)})")
-
-            # Delete annotation
-            if args.delete_annotation:
-                article_num = args.delete_annotation
-                if 1 <= article_num <= len(results):
-                    article = results[article_num - 1]
-                    article_id = manager._get_article_id(article)
-
-                    if manager.remove_annotation(article_id):
-                        print(f"Annotation deleted for article #{article_num}")
-                    else:
-                        print(f"No annotation found for article #{article_num}")
-                else:
-                    print(f"Error: Article #{article_num} is out of range (1-{len(results)})")
+            annotate_results(args, results)
 
     else:
         print("No results found.")
@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Optional background daemon for the Lixplore CLI.
+
+`lixplore serve` keeps one Python process running on a Unix domain socket
+(~/.lixplore_cache/daemon.sock). It has already imported the source
+connectors and holds the pooled HTTP connections, the metadata store, the
+response cache and the result sessions open. While it runs, the `lixplore`
+command forwards its arguments to it and prints the output it streams back,
+so each call skips interpreter start-up, imports and TLS handshakes.
+
+Forwarding is transparent:
+
+* If no daemon is running, or the platform has no Unix sockets, the
+  command runs in-process as usual.
+* Commands that need the terminal (-i, --tui, --shell, --wizard, -R) are
+  handed back by the daemon and run locally.
+* Set LIXPLORE_NO_DAEMON=1 to never forward; LIXPLORE_SOCKET overrides the
+  socket path.
+
+Requests are handled one at a time, each with the client's working
+directory, LIXPLORE_* and PUBMED_* environment variables and terminal size.
+Output printed by threads that outlive a request goes to the daemon's own
+log, never to another client.
+
+Protocol: one JSON request line from the client; JSON reply lines
+{"out": text}, {"err": text}, then {"exit": code} or {"local": true}.
+"""
+
+import io
+import json
+import os
+import socket
+import sys
+import threading
+from typing import Dict, List, Optional
+
+from lixplore.utils.cache import CACHE_DIR
+
+DEFAULT_SOCKET = os.path.join(CACHE_DIR, "daemon.sock")
+
+CONNECT_TIMEOUT = 0.5  # seconds to wait for a running daemon to accept
+
+# Environment variables passed from the client to the daemon for one request
+FORWARDED_ENV_PREFIXES = ("LIXPLORE_", "PUBMED_")
+
+# Output is sent in chunks of at most this many characters
+OUTPUT_CHUNK = 8192
+
+
+def socket_path() -> str:
+    """Socket the daemon listens on (LIXPLORE_SOCKET overrides the default)."""
+    return os.environ.get("LIXPLORE_SOCKET") or DEFAULT_SOCKET
+
+
+def _connect(path: str) -> Optional[socket.socket]:
+    """Connect to a running daemon, or return None."""
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    sock.settimeout(None)
+    return sock
+
+
+def _send(sock: socket.socket, message: Dict):
+    sock.sendall(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+
+
+# ===== Client =====
+
+def forward(argv: List[str]) -> Optional[int]:
+    """
+    Run a CLI invocation in the daemon, if one is running.
+
+    Args:
+        argv: Command-line arguments (without the program name)
+
+    Returns:
+        The command's exit code, or None if it should run in this process
+    """
+    if os.environ.get("LIXPLORE_NO_DAEMON"):
+        return None
+    sock = _connect(socket_path())
+    if sock is None:
+        return None
+
+    import shutil
+    size = shutil.get_terminal_size()
+    env = {key: value for key, value in os.environ.items() if key.startswith(FORWARDED_ENV_PREFIXES)}
+    env.update({"COLUMNS": str(size.columns), "LINES": str(size.lines)})
+    request = {
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "env": env,
+        "tty": sys.stdout.isatty(),
+    }
+
+    try:
+        _send(sock, request)
+        with sock.makefile("r", encoding="utf-8") as replies:
+            for line in replies:
+                reply = json.loads(line)
+                if "out" in reply:
+                    sys.stdout.write(reply["out"])
+                    sys.stdout.flush()
+                elif "err" in reply:
+                    sys.stderr.write(reply["err"])
+                    sys.stderr.flush()
+                elif reply.get("local"):
+                    return None
+                elif "exit" in reply:
+                    return reply["exit"]
+    except (OSError, ValueError) as e:
+        print(f"[Daemon] Connection lost: {e}", file=sys.stderr)
+        return 1
+    finally:
+        sock.close()
+
+    print("[Daemon] Connection closed before the command finished", file=sys.stderr)
+    return 1
+
+
+def request(command: str, path: str = None) -> Optional[Dict]:
+    """Send a control command ('ping' or 'stop') to the daemon."""
+    sock = _connect(path or socket_path())
+    if sock is None:
+        return None
+    try:
+        _send(sock, {"command": command})
+        with sock.makefile("r", encoding="utf-8") as replies:
+            line = replies.readline()
+        return json.loads(line) if line else None
+    except (OSError, ValueError):
+        return None
+    finally:
+        sock.close()
+
+
+# ===== Server =====
+
+class _Reply:
+    """
+    Reply channel to one client.
+
+    Messages are sent under a lock, so output from several threads never
+    interleaves on the socket. Once the final message has been sent (or the
+    client has gone away) the channel is closed and nothing more is sent.
+    """
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.lock = threading.RLock()
+        self.closed = False
+        # Threads already running belong to earlier requests or the daemon
+        self._foreign = set(threading.enumerate()) - {threading.current_thread()}
+
+    def accepts_current_thread(self) -> bool:
+        """True unless the calling thread was started before this request."""
+        return threading.current_thread() not in self._foreign
+
+    def send(self, message: Dict, final: bool = False) -> bool:
+        """Send a message; returns False if the channel is closed."""
+        with self.lock:
+            if self.closed:
+                return False
+            try:
+                _send(self.sock, message)
+            except OSError:
+                self.closed = True
+                return False
+            if final:
+                self.closed = True
+            return True
+
+
+class _ReplyStream(io.TextIOBase):
+    """
+    File-like object that sends everything written to it to the client.
+
+    Writes from threads of earlier requests, and writes after the request has
+    finished, go to the daemon's own stream (`log`) instead.
+    """
+
+    def __init__(self, reply: _Reply, key: str, tty: bool, log):
+        self._reply = reply
+        self._key = key
+        self._tty = tty
+        self._log = log
+        self._buffer = []
+        self._size = 0
+
+    @property
+    def encoding(self):
+        return "utf-8"
+
+    def isatty(self):
+        return self._tty
+
+    def writable(self):
+        return True
+
+    def _to_log(self, text):
+        try:
+            self._log.write(text)
+            self._log.flush()
+        except (OSError, ValueError):
+            pass
+
+    def write(self, text):
+        if not self._reply.accepts_current_thread():
+            self._to_log(text)
+            return len(text)
+        with self._reply.lock:
+            if self._reply.closed:
+                self._to_log(text)
+                return len(text)
+            self._buffer.append(text)
+            self._size += len(text)
+            if "\n" in text or self._size >= OUTPUT_CHUNK:
+                self.flush()
+        return len(text)
+
+    def flush(self):
+        with self._reply.lock:
+            if not self._buffer:
+                return
+            text = "".join(self._buffer)
+            self._buffer, self._size = [], 0
+            if not self._reply.send({self._key: text}):
+                self._to_log(text)
+
+
+def _needs_terminal(args) -> bool:
+    """Commands that interact with the user's terminal run in the client."""
+    return bool(
+        getattr(args, "interactive", False) or getattr(args, "tui", False)
+        or getattr(args, "shell", False) or getattr(args, "wizard", False)
+        or getattr(args, "review", None)
+    )
+
+
+def _run_request(conn: socket.socket, message: Dict):
+    """Run one forwarded CLI invocation with the client's context."""
+    from lixplore import cli
+    from lixplore.utils import cache
+
+    saved_streams = sys.stdout, sys.stderr, sys.stdin
+    reply = _Reply(conn)
+    out = _ReplyStream(reply, "out", message.get("tty", False), saved_streams[0])
+    err = _ReplyStream(reply, "err", message.get("tty", False), saved_streams[1])
+    saved_cwd = os.getcwd()
+    saved_env = {key: value for key, value in os.environ.items()
+                 if key.startswith(FORWARDED_ENV_PREFIXES) or key in ("COLUMNS", "LINES")}
+
+    code = 0
+    try:
+        for key in saved_env:
+            del os.environ[key]
+        os.environ.update(message.get("env", {}))
+        os.chdir(message.get("cwd") or saved_cwd)
+        sys.stdout, sys.stderr, sys.stdin = out, err, io.StringIO("")
+
+        parser = cli.build_parser()
+        try:
+            args = parser.parse_args(message.get("argv", []))
+            if _needs_terminal(args):
+                reply.send({"local": True}, final=True)
+                return
+            cache.schedule_cache_sweep()
+            if hasattr(args, "func"):
+                args.func(args)
+            else:
+                parser.print_help()
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except Exception:
+            import traceback
+            traceback.print_exc()
+            code = 1
+        out.flush()
+        err.flush()
+        # Anything printed from now on goes to the daemon's log
+        reply.send({"exit": code}, final=True)
+    finally:
+        sys.stdout, sys.stderr, sys.stdin = saved_streams
+        os.chdir(saved_cwd)
+        for key in [key for key in os.environ if key.startswith(FORWARDED_ENV_PREFIXES) or key in ("COLUMNS", "LINES")]:
+            del os.environ[key]
+        os.environ.update(saved_env)
+
+
+def _warm_up():
+    """Import everything a search needs and open the shared connections."""
+    from lixplore import commands  # noqa: F401  (imports dispatcher and helpers)
+    from lixplore.service import SearchService
+    from lixplore.utils import metadata_store
+
+    SearchService(warm_up=False).warm_up()
+    metadata_store._connect()
+
+
+def serve(path: str = None):
+    """
+    Run the daemon in the foreground until stopped.
+
+    Args:
+        path: Socket path (default: socket_path())
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        print("Error: lixplore serve needs Unix domain sockets, which this platform does not support")
+        return 1
+
+    path = path or socket_path()
+    if request("ping", path):
+        print(f"A Lixplore daemon is already running on {path}")
+        return 1
+    if os.path.exists(path):
+        os.remove(path)  # left behind by a daemon that did not shut down cleanly
+
+    print("Loading Lixplore...")
+    _warm_up()
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)  # socket readable and writable by this user only
+    try:
+        server.bind(path)
+    finally:
+        os.umask(old_umask)
+    server.listen(16)
+    print(f"Lixplore daemon listening on {path} (pid {os.getpid()}). Stop with: lixplore serve --stop")
+    sys.stdout.flush()
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                try:
+                    with conn.makefile("r", encoding="utf-8") as requests:
+                        line = requests.readline()
+                    if not line:
+                        continue
+                    message = json.loads(line)
+                    if message.get("command") == "ping":
+                        _send(conn, {"pong": os.getpid()})
+                    elif message.get("command") == "stop":
+                        _send(conn, {"exit": 0})
+                        break
+                    else:
+                        _run_request(conn, message)
+                except (OSError, ValueError):
+                    # Client went away or sent garbage; keep serving others
+                    continue
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    print("Lixplore daemon stopped")
+    return 0
+
+
+def serve_main(argv: List[str]) -> int:
+    """Handle `lixplore serve ...`."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="lixplore serve",
+        description="Run a background Lixplore process that other lixplore commands forward to"
+    )
+    parser.add_argument("--socket", metavar="PATH", help=f"Unix socket path (default: {DEFAULT_SOCKET})")
+    parser.add_argument("--stop", action="store_true", help="Stop the running daemon")
+    parser.add_argument("--status", action="store_true", help="Show whether a daemon is running")
+    args = parser.parse_args(argv)
+    path = args.socket or socket_path()
+
+    if args.stop:
+        if request("stop", path) is None:
+            print(f"No Lixplore daemon running on {path}")
+            return 1
+        print("Lixplore daemon stopped")
+        return 0
+
+    if args.status:
+        reply = request("ping", path)
+        if reply is None:
+            print(f"No Lixplore daemon running on {path}")
+            return 1
+        print(f"Lixplore daemon running on {path} (pid {reply.get('pong')})")
+        return 0
+
+    return serve(path)
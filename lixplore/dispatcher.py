@@ -1,17 +1,49 @@
 #!/usr/bin/env python3
 
-from lixplore.sources import pubmed, crossref, doaj, europepmc, arxiv
 from lixplore.utils.terminal import open_in_new_terminal, open_article_in_terminal
-from lixplore.utils.export import export_results
+from lixplore.utils.cache import get_cached_response, store_response
+from lixplore.utils.dedup import DedupIndex, author_key, fingerprint, fingerprints_match, normalize_text
+from lixplore.utils.metadata import METADATA_FIELDS, missing_metadata
+import importlib
 import json
 import os
+import queue
+import threading
+import time
 from difflib import SequenceMatcher
 from datetime import datetime, timedelta
 
 CACHE_FILE = os.path.expanduser("~/.lixplore_cache.json")
 CACHE_EXPIRY_DAYS = 7  # Default cache expiration in days
-HISTORY_FILE = os.path.expanduser("~/.lixplore_history.json")
-MAX_HISTORY_ENTRIES = 100  # Maximum number of history entries to keep
+
+# Concurrent search settings (seconds)
+SOURCE_TIMEOUTS = {
+    "pubmed": 30,
+    "crossref": 20,
+    "doaj": 20,
+    "europepmc": 20,
+    "arxiv": 30,
+}
+DEFAULT_SOURCE_TIMEOUT = 30  # Used for custom APIs and unknown sources
+SEARCH_DEADLINE = 60  # Global wall-clock budget for one multi-source search
+
+# Source modules are imported on first use, so commands that never search
+# (--help, --history, --list-profiles, ...) don't load Biopython or requests
+SOURCE_MODULES = {
+    "pubmed": "lixplore.sources.pubmed",
+    "crossref": "lixplore.sources.crossref",
+    "doaj": "lixplore.sources.doaj",
+    "europepmc": "lixplore.sources.europepmc",
+    "arxiv": "lixplore.sources.arxiv",
+}
+
+SOURCE_NAMES = {
+    "pubmed": "PubMed",
+    "crossref": "Crossref",
+    "doaj": "DOAJ",
+    "europepmc": "EuropePMC",
+    "arxiv": "arXiv"
+}
 
 
 # ===== Extra helpers =====
@@ -53,25 +85,358 @@ def handle(args):
 
 
 # ===== Logic functions =====
-def search(source, query, limit=10):
-    if source == "pubmed":
-        return pubmed.search(query, limit)
-    elif source == "crossref":
-        return crossref.search(query, limit)
-    elif source == "doaj":
-        return doaj.search(query, limit)
-    elif source == "europepmc":
-        return europepmc.search(query, limit)
-    elif source == "arxiv":
-        return arxiv.search(query, limit)
-    return []
+def search(source, query, limit=10, use_cache=True, refresh=False, partial=None):
+    """
+    Search a single source, serving repeated queries from the response cache.
+
+    Args:
+        source: Source name ('pubmed', 'crossref', 'doaj', 'europepmc', 'arxiv')
+        query: Search query string
+        limit: Maximum number of results
+        use_cache: Read from and write to the response cache
+        refresh: Skip cached entries but store the fresh response
+        partial: Optional list that receives each page as it arrives, so a
+            caller that stops waiting still has the pages fetched so far
+
+    Returns:
+        List of article dictionaries
+    """
+    if use_cache and not refresh:
+        cached = get_cached_response(source, query, limit)
+        if cached is not None:
+            return cached
+
+    results = _search_source(source, query, limit, partial)
+
+    # Empty lists are not cached: sources return [] on network errors too
+    if use_cache and results:
+        store_response(source, query, limit, results)
+
+    return results
+
+
+def _source_module(source):
+    """Import and return the connector module for a source (None if unknown)."""
+    module_name = SOURCE_MODULES.get(source)
+    if module_name is None:
+        return None
+    return importlib.import_module(module_name)
+
+
+def _search_source(source, query, limit=10, partial=None):
+    module = _source_module(source)
+    if module is None:
+        return []
+    if partial is None:
+        return module.search(query, limit)
+
+    # Same pages as module.search(), collected where search_many can see them
+    pages = module.iter_pages(query, limit)
+    try:
+        for page in pages:
+            partial.extend(page[:limit - len(partial)])
+            if len(partial) >= limit:
+                break
+    finally:
+        close = getattr(pages, "close", None)
+        if close:
+            close()
+    return list(partial)
+
+
+def _run_search_job(key, func, out):
+    """Run one source search in a worker thread and report back on the queue."""
+    started = time.monotonic()
+    try:
+        results = func()
+        out.put((key, results or [], None, time.monotonic() - started))
+    except Exception as e:
+        out.put((key, [], e, time.monotonic() - started))
+
+
+def search_many(sources, query, limit=10, custom_api=None, source_timeout=None,
+                deadline=SEARCH_DEADLINE, show_progress=True, use_cache=True, refresh=False):
+    """
+    Query several sources concurrently and merge their results.
+
+    Every source runs in its own worker thread, so the wall-clock time of a
+    multi-source search is close to that of the slowest single source.
+    Results are merged in the order the sources were given (custom API last),
+    regardless of which source answers first. A source that runs out of time
+    contributes the pages it had already received.
+
+    Args:
+        sources: List of source names ('pubmed', 'crossref', ...)
+        query: Search query string
+        limit: Maximum results per source
+        custom_api: Optional custom API name (searched alongside the sources)
+        source_timeout: Seconds to wait for each source. None uses SOURCE_TIMEOUTS.
+        deadline: Global wall-clock budget in seconds for the whole search
+        show_progress: Print per-source progress lines
+        use_cache: Read from and write to the response cache
+        refresh: Skip cached entries but store fresh responses
+
+    Returns:
+        Tuple of (merged_results, timed_out_sources)
+    """
+    jobs = []
+    partial = {}
+    for src in sources:
+        partial[src] = []
+        jobs.append((src, SOURCE_NAMES.get(src, src),
+                     lambda src=src: search(src, query, limit, use_cache, refresh, partial=partial[src])))
+
+    if custom_api:
+        def call_custom():
+            from lixplore.utils import custom_apis
+            key = f"custom:{custom_api}"
+            if use_cache and not refresh:
+                cached = get_cached_response(key, query, limit)
+                if cached is not None:
+                    return cached
+            results = custom_apis.call_custom_api(custom_api, query, limit)
+            if use_cache and results:
+                store_response(key, query, limit, results)
+            return results
+        jobs.append((f"custom:{custom_api}", f"{custom_api} (custom API)", call_custom))
+
+    if not jobs:
+        return [], []
+
+    out = queue.Queue()
+    start = time.monotonic()
+    expiry = {}
+
+    for key, label, func in jobs:
+        if source_timeout is not None:
+            timeout = source_timeout
+        else:
+            timeout = SOURCE_TIMEOUTS.get(key, DEFAULT_SOURCE_TIMEOUT)
+        if deadline is not None:
+            timeout = min(timeout, deadline)
+        expiry[key] = start + timeout
+
+        if show_progress:
+            print(f"  Searching {label}...")
+
+        # Daemon threads: a source that hangs past its timeout never blocks exit
+        worker = threading.Thread(target=_run_search_job, args=(key, func, out), daemon=True)
+        worker.start()
+
+    labels = {key: label for key, label, _ in jobs}
+    collected = {}
+    pending = set(labels)
+    timed_out = []
+
+    while pending:
+        now = time.monotonic()
+        for key in [k for k in pending if expiry[k] <= now]:
+            pending.discard(key)
+            timed_out.append(key)
+            # Keep the pages received so far (not cached: they are incomplete)
+            collected[key] = list(partial.get(key, []))
+        if not pending:
+            break
+
+        wait = min(expiry[k] for k in pending) - now
+        try:
+            key, results, error, elapsed = out.get(timeout=max(wait, 0))
+        except queue.Empty:
+            continue
+
+        if key not in pending:
+            # Arrived after its timeout was already reported
+            continue
+
+        pending.discard(key)
+        collected[key] = results
+
+        if show_progress:
+            if error is not None:
+                print(f"  [{labels[key]} Error] {error}")
+            else:
+                print(f"  {labels[key]}: {len(results)} result(s) in {elapsed:.1f}s")
+
+    timed_out = [key for key, _, _ in jobs if key in timed_out]
+
+    if timed_out and show_progress:
+        silent = [labels[k] for k in timed_out if not collected.get(k)]
+        incomplete = [f"{labels[k]} ({len(collected[k])} result(s))" for k in timed_out if collected.get(k)]
+        if silent:
+            print(f"Warning: No response from {', '.join(silent)} in time - showing partial results")
+        if incomplete:
+            print(f"Warning: {', '.join(incomplete)} did not finish in time - showing the results received so far")
+
+    merged = []
+    for key, _, _ in jobs:
+        merged.extend(collected.get(key, []))
+
+    return merged, timed_out
+
+
+# ===== Streaming pipeline =====
+# Generator stages for --stream: articles flow from the source pages through
+# filtering, deduplication and enrichment into the exporters one at a time,
+# so memory stays flat and rows reach disk while later pages are still fetched.
+
+def _run_page_job(key, label, make_pages, out, stop):
+    """Feed one source's pages into the shared queue until done or stopped."""
+    def _put(item):
+        while not stop.is_set():
+            try:
+                out.put(item, timeout=0.2)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    try:
+        for page in make_pages():
+            if not _put((key, page)):
+                break
+    except Exception as e:
+        print(f"  [{label} Error] {e}")
+    finally:
+        _put((key, None))
+
+
+def iter_search(sources, query, limit=10, custom_api=None, stop_event=None):
+    """
+    Stream articles from several sources as their pages arrive.
+
+    Sources are paged concurrently (one worker thread each) and articles are
+    yielded in arrival order. Responses are not cached in this mode.
+
+    Args:
+        sources: List of source names ('pubmed', 'crossref', ...)
+        query: Search query string
+        limit: Maximum results per source
+        custom_api: Optional custom API name (returned as a single page)
+        stop_event: Optional threading.Event that stops all sources
+
+    Yields:
+        Article dictionaries
+    """
+    jobs = []
+    for src in sources:
+        module = _source_module(src)
+        if module is not None:
+            jobs.append((src, SOURCE_NAMES.get(src, src),
+                         lambda module=module: module.iter_pages(query, limit)))
+
+    if custom_api:
+        def custom_pages():
+            from lixplore.utils import custom_apis
+            return [custom_apis.call_custom_api(custom_api, query, limit) or []]
+        jobs.append((f"custom:{custom_api}", f"{custom_api} (custom API)", custom_pages))
+
+    if not jobs:
+        return
+
+    stop = stop_event or threading.Event()
+    # A few pages of slack per source; workers wait when the consumer falls behind
+    out = queue.Queue(maxsize=2 * len(jobs))
+
+    for key, label, make_pages in jobs:
+        worker = threading.Thread(target=_run_page_job, args=(key, label, make_pages, out, stop), daemon=True)
+        worker.start()
+
+    active = len(jobs)
+    try:
+        while active and not stop.is_set():
+            try:
+                key, page = out.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            if page is None:
+                active -= 1
+                continue
+            for article in page:
+                yield article
+    finally:
+        stop.set()
+
+
+def filter_stream(articles, date_range=None):
+    """Yield only the articles inside date_range (see in_date_range)."""
+    for article in articles:
+        if in_date_range(article, date_range):
+            yield article
+
+
+def dedup_stream(articles, strategy='auto', title_threshold=0.85, stats=None):
+    """
+    Yield each article unless it duplicates one already yielded.
+
+    Articles are already on their way to disk when a later duplicate shows
+    up, so the first occurrence is always kept (--dedup-keep first). Only
+    comparison fingerprints are retained, not the articles themselves.
+
+    Args:
+        articles: Iterable of article dictionaries
+        strategy: Deduplication strategy ('auto', 'doi_only', 'title_only', 'strict', 'loose')
+        title_threshold: Similarity threshold for title matching
+        stats: Optional dict; stats['duplicates'] is incremented per skipped article
+    """
+    index = DedupIndex(strategy, title_threshold, keep_articles=False)
+    for article in articles:
+        if index.find(article) is None:
+            index.add(article)
+            yield article
+        elif stats is not None:
+            stats['duplicates'] = stats.get('duplicates', 0) + 1
+
+
+def export_stream(articles, formats, output=None, fields=None, compress=False, show_progress=True):
+    """
+    Write articles to one or more streamable formats as they arrive.
+
+    Args:
+        articles: Iterable of article dictionaries
+        formats: List of formats from export.STREAM_FORMATS
+        output: Optional output filename (base name when several formats are given)
+        fields: Optional list of field names to export
+        compress: If True, compress each exported file to ZIP
+        show_progress: Print a progress line every 500 articles
+
+    Returns:
+        Tuple of (article_count, exported_paths)
+    """
+    from lixplore.utils.export import EXPORT_EXTENSIONS, StreamExporter, compress_export
+
+    output_base = output.rsplit('.', 1)[0] if output and len(formats) > 1 else None
+    exporters = []
+    count = 0
+    try:
+        for format in formats:
+            filename = f"{output_base}.{EXPORT_EXTENSIONS[format]}" if output_base else output
+            exporters.append(StreamExporter(format, filename, fields))
+
+        for article in articles:
+            for exporter in exporters:
+                exporter.write(article)
+            count += 1
+            if show_progress and count % 500 == 0:
+                print(f"  Streamed {count} results...")
+    except KeyboardInterrupt:
+        print(f"\nStopped - keeping the {count} result(s) written so far")
+    finally:
+        paths = [exporter.close() for exporter in exporters]
+        close = getattr(articles, "close", None)
+        if close:
+            close()
+
+    for path in paths:
+        print(f"Exported {count} results to: {path}")
+        if compress:
+            compress_export(path, remove_original=False)
+
+    return count, paths
 
 
 def normalize_string(s):
     """Normalize string for comparison (lowercase, strip whitespace)."""
-    if not s:
-        return ""
-    return " ".join(s.lower().strip().split())
+    return normalize_text(s)
 
 
 def title_similarity(title1, title2, threshold=0.85):
@@ -97,15 +462,7 @@ def normalize_author_name(name):
     Normalize author name for comparison.
     Handles formats like: 'Smith J', 'J Smith', 'Smith, John', 'John Smith'
     """
-    if not name:
-        return ""
-
-    # Remove common punctuation and normalize whitespace
-    name = name.replace(",", " ").replace(".", " ")
-    parts = [p.strip() for p in name.split() if p.strip()]
-
-    # Convert to lowercase and sort to handle different name orders
-    return " ".join(sorted([p.lower() for p in parts]))
+    return author_key(name)
 
 
 def authors_match(authors1, authors2, min_common=2):
@@ -139,46 +496,7 @@ def is_duplicate(article1, article2):
     2. Secondary: Title similarity (if no DOI)
     3. Tertiary: Author name matching (as additional confirmation)
     """
-    # Level 1: DOI matching (most reliable)
-    doi1 = article1.get("doi", "").strip()
-    doi2 = article2.get("doi", "").strip()
-
-    if doi1 and doi2:
-        # Both have DOIs - compare them
-        return normalize_string(doi1) == normalize_string(doi2)
-
-    # Level 2: Title similarity (for articles without DOI or with only one DOI)
-    title1 = article1.get("title", "")
-    title2 = article2.get("title", "")
-
-    if title_similarity(title1, title2):
-        # Titles are very similar, check authors for additional confirmation
-        authors1 = article1.get("authors", [])
-        authors2 = article2.get("authors", [])
-
-        # If we have author info, use it to confirm; otherwise trust title similarity
-        if authors1 and authors2:
-            # Require at least some author overlap
-            return authors_match(authors1, authors2, min_common=1)
-        else:
-            # No author info available, rely on title similarity
-            return True
-
-    # Level 3: Strong author matching with similar (but not identical) titles
-    # This catches cases where titles differ slightly (e.g., preprint vs published)
-    authors1 = article1.get("authors", [])
-    authors2 = article2.get("authors", [])
-
-    if authors1 and authors2 and len(authors1) >= 2 and len(authors2) >= 2:
-        # Check if many authors match AND titles are somewhat similar
-        if authors_match(authors1, authors2, min_common=min(3, min(len(authors1), len(authors2)))):
-            # Also check if titles are at least somewhat similar (lower threshold)
-            if title1 and title2:
-                similarity = SequenceMatcher(None, normalize_string(title1), normalize_string(title2)).ratio()
-                if similarity >= 0.7:  # Lower threshold for author-confirmed matches
-                    return True
-
-    return False
+    return fingerprints_match(fingerprint(article1), fingerprint(article2))
 
 
 def deduplicate(results):
@@ -191,18 +509,14 @@ def deduplicate(results):
     if not results:
         return []
 
-    unique = []
+    # The index only compares pairs that can match, same result as a pairwise scan
+    index = DedupIndex('auto', 0.85)
 
     for article in results:
-        is_dup = False
-
-        for unique_article in unique:
-            if is_duplicate(article, unique_article):
-                is_dup = True
-                break
+        if index.find(article) is None:
+            index.add(article)
 
-        if not is_dup:
-            unique.append(article)
+    unique = index.articles
 
     duplicate_count = len(results) - len(unique)
     if duplicate_count > 0:
@@ -216,16 +530,7 @@ def get_completeness_score(article):
     Calculate how complete an article's metadata is.
     Returns a score based on number of filled fields.
     """
-    score = 0
-    fields = ['title', 'authors', 'abstract', 'journal', 'year', 'doi', 'url', 'source']
-
-    for field in fields:
-        value = article.get(field)
-        if value:
-            if isinstance(value, str) and value.strip():
-                score += 1
-            elif isinstance(value, list) and len(value) > 0:
-                score += 1
+    score = len(METADATA_FIELDS) - len(missing_metadata(article))
 
     # Bonus for having DOI (most valuable field)
     if article.get('doi', '').strip():
@@ -283,59 +588,7 @@ def is_duplicate_with_strategy(article1, article2, strategy='auto', threshold=0.
     Returns:
         True if articles are duplicates
     """
-    if strategy == 'doi_only':
-        # Only match by DOI
-        doi1 = article1.get("doi", "").strip()
-        doi2 = article2.get("doi", "").strip()
-        if doi1 and doi2:
-            return normalize_string(doi1) == normalize_string(doi2)
-        return False
-
-    elif strategy == 'title_only':
-        # Only match by title similarity
-        title1 = article1.get("title", "")
-        title2 = article2.get("title", "")
-        return title_similarity(title1, title2, threshold=threshold)
-
-    elif strategy == 'strict':
-        # Higher thresholds for stricter matching
-        return is_duplicate_with_strategy(article1, article2, strategy='auto', threshold=0.95)
-
-    elif strategy == 'loose':
-        # Lower thresholds for looser matching
-        return is_duplicate_with_strategy(article1, article2, strategy='auto', threshold=0.75)
-
-    else:  # 'auto' or default
-        # Use existing multi-level logic with custom threshold
-        doi1 = article1.get("doi", "").strip()
-        doi2 = article2.get("doi", "").strip()
-
-        if doi1 and doi2:
-            return normalize_string(doi1) == normalize_string(doi2)
-
-        title1 = article1.get("title", "")
-        title2 = article2.get("title", "")
-
-        if title_similarity(title1, title2, threshold=threshold):
-            authors1 = article1.get("authors", [])
-            authors2 = article2.get("authors", [])
-
-            if authors1 and authors2:
-                return authors_match(authors1, authors2, min_common=1)
-            else:
-                return True
-
-        authors1 = article1.get("authors", [])
-        authors2 = article2.get("authors", [])
-
-        if authors1 and authors2 and len(authors1) >= 2 and len(authors2) >= 2:
-            if authors_match(authors1, authors2, min_common=min(3, min(len(authors1), len(authors2)))):
-                if title1 and title2:
-                    similarity = SequenceMatcher(None, normalize_string(title1), normalize_string(title2)).ratio()
-                    if similarity >= (threshold - 0.15):  # Slightly lower for author-confirmed
-                        return True
-
-        return False
+    return fingerprints_match(fingerprint(article1), fingerprint(article2), strategy, threshold)
 
 
 def deduplicate_advanced(results, strategy='auto', title_threshold=0.85, keep_preference='most_complete', merge_metadata=False):
@@ -355,21 +608,16 @@ def deduplicate_advanced(results, strategy='auto', title_threshold=0.85, keep_pr
     if not results:
         return []
 
-    unique = []
+    index = DedupIndex(strategy, title_threshold)
+    unique = index.articles
     duplicates_found = []
 
     for article in results:
-        is_dup = False
-        dup_index = -1
-
-        for idx, unique_article in enumerate(unique):
-            if is_duplicate_with_strategy(article, unique_article, strategy, title_threshold):
-                is_dup = True
-                dup_index = idx
-                break
+        dup_index = index.find(article)
 
-        if is_dup:
+        if dup_index is not None:
             duplicates_found.append((article, dup_index))
+            kept = unique[dup_index]
 
             if merge_metadata:
                 # Merge metadata from duplicate into existing unique entry
@@ -383,8 +631,11 @@ def deduplicate_advanced(results, strategy='auto', title_threshold=0.85, keep_pr
                 if article.get('doi', '').strip() and not unique[dup_index].get('doi', '').strip():
                     unique[dup_index] = article
             # For 'first', do nothing (keep existing)
+
+            if unique[dup_index] is not kept:
+                index.replace(dup_index, unique[dup_index])
         else:
-            unique.append(article)
+            index.add(article)
 
     duplicate_count = len(duplicates_found)
     if duplicate_count > 0:
@@ -394,9 +645,34 @@ def deduplicate_advanced(results, strategy='auto', title_threshold=0.85, keep_pr
     return unique
 
 
+def in_date_range(article, date_range):
+    """
+    Check an article's year against a (FROM, TO) pair of YYYY-MM-DD dates.
+
+    Sources only report publication years reliably, so the comparison is by
+    year. Articles without a usable year are kept.
+    """
+    if not date_range:
+        return True
+
+    year = str(article.get("year") or "")[:4]
+    if not year.isdigit():
+        return True
+
+    try:
+        start = int(str(date_range[0])[:4])
+        end = int(str(date_range[1])[:4])
+    except (TypeError, ValueError, IndexError):
+        return True
+
+    return start <= int(year) <= end
+
+
 def filter_by_date(results, date_range):
-    # TODO: implement date filtering
-    return results
+    """Keep the results published within date_range (FROM, TO)."""
+    if not date_range:
+        return results
+    return [article for article in results if in_date_range(article, date_range)]
 
 
 def paginate_results(results, page=1, page_size=20):
@@ -454,12 +730,17 @@ def show_results(results, args):
     page_size = getattr(args, 'page_size', 20)
     show_pdf_links = getattr(args, 'show_pdf_links', False)
 
-    # Fetch PDF links if requested
+    # Fetch PDF links if requested: the displayed page now, the rest in the background
     pdf_links = {}
     if show_pdf_links:
         print("\nChecking for open access PDFs...")
-        from lixplore.utils.pdf_downloader import get_pdf_links_batch
-        pdf_links = get_pdf_links_batch(results)
+        from lixplore.utils.pdf_downloader import get_pdf_links_batch, prefetch_pdf_links
+        if total_results > page_size:
+            _, _, start_idx, end_idx = paginate_results(results, page, page_size)
+        else:
+            start_idx, end_idx = 0, total_results
+        pdf_links = get_pdf_links_batch(results, list(range(start_idx, end_idx)))
+        prefetch_pdf_links(results, [i for i in range(total_results) if not start_idx <= i < end_idx])
         if pdf_links:
             print(f"Found {len(pdf_links)} PDF(s) available\n")
         else:
@@ -519,62 +800,72 @@ def show_results(results, args):
                 print(f"Invalid selection: {n}")
 
 
-def save_to_history(query, sources, result_count):
+def save_to_history(query, sources, result_count, session=None):
     """
-    Save search to history file.
+    Append search to the history log.
 
     Args:
         query: Search query string
         sources: List of sources searched
         result_count: Number of results found
+        session: Result session holding the results (optional)
     """
-    history_entry = {
-        "timestamp": datetime.now().isoformat(),
-        "query": query,
-        "sources": sources if sources else [],
-        "result_count": result_count
-    }
-
-    # Load existing history
-    history = []
-    if os.path.exists(HISTORY_FILE):
-        try:
-            with open(HISTORY_FILE, "r", encoding="utf-8") as f:
-                history = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            history = []
-
-    # Add new entry at the beginning (most recent first)
-    history.insert(0, history_entry)
+    from lixplore.utils import history
 
-    # Keep only the most recent MAX_HISTORY_ENTRIES
-    history = history[:MAX_HISTORY_ENTRIES]
-
-    # Save updated history
     try:
-        with open(HISTORY_FILE, "w", encoding="utf-8") as f:
-            json.dump(history, f, ensure_ascii=False, indent=2)
-    except IOError as e:
+        history.record(query, sources, result_count, session=session)
+    except (IOError, OSError):
         # Silently fail if we can't write history (not critical)
         pass
 
 
+def _format_time(timestamp):
+    """Return (timestamp for display, how long ago) for an ISO timestamp."""
+    try:
+        dt = datetime.fromisoformat(timestamp)
+        time_str = dt.strftime("%Y-%m-%d %H:%M:%S")
+
+        # Calculate how long ago
+        now = datetime.now()
+        delta = now - dt
+        if delta.days > 0:
+            ago = f"{delta.days} day{'s' if delta.days != 1 else ''} ago"
+        elif delta.seconds >= 3600:
+            hours = delta.seconds // 3600
+            ago = f"{hours} hour{'s' if hours != 1 else ''} ago"
+        elif delta.seconds >= 60:
+            minutes = delta.seconds // 60
+            ago = f"{minutes} minute{'s' if minutes != 1 else ''} ago"
+        else:
+            ago = "just now"
+    except (ValueError, TypeError, AttributeError):
+        time_str = timestamp
+        ago = ""
+    return time_str, ago
+
+
+def _format_sources(sources):
+    """Display names for a list of searched sources."""
+    sources_display = []
+    for src in sources or []:
+        # Handle custom API format "custom:springer"
+        if src.startswith("custom:"):
+            api_name = src.split(":", 1)[1]
+            sources_display.append(f"{api_name} (custom)")
+        else:
+            sources_display.append(SOURCE_NAMES.get(src, src))
+
+    return ", ".join(sources_display) if sources_display else "Unknown"
+
+
 def show_history():
     """Display search history."""
-    if not os.path.exists(HISTORY_FILE):
-        print("No search history found.")
-        print("Run a search to start building history (e.g., lixplore -P -q \"cancer\" -m 10)")
-        return
-
-    try:
-        with open(HISTORY_FILE, "r", encoding="utf-8") as f:
-            history = json.load(f)
-    except (json.JSONDecodeError, IOError):
-        print("Error reading history file.")
-        return
+    from lixplore.utils import history as search_history
 
+    history = search_history.entries()
     if not history:
         print("No search history found.")
+        print("Run a search to start building history (e.g., lixplore -P -q \"cancer\" -m 10)")
         return
 
     print(f"\n{'='*80}")
@@ -587,57 +878,21 @@ def show_history():
         sources = entry.get("sources", [])
         result_count = entry.get("result_count", 0)
 
-        # Parse timestamp for display
-        try:
-            dt = datetime.fromisoformat(timestamp)
-            time_str = dt.strftime("%Y-%m-%d %H:%M:%S")
-
-            # Calculate how long ago
-            now = datetime.now()
-            delta = now - dt
-            if delta.days > 0:
-                ago = f"{delta.days} day{'s' if delta.days != 1 else ''} ago"
-            elif delta.seconds >= 3600:
-                hours = delta.seconds // 3600
-                ago = f"{hours} hour{'s' if hours != 1 else ''} ago"
-            elif delta.seconds >= 60:
-                minutes = delta.seconds // 60
-                ago = f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-            else:
-                ago = "just now"
-        except (ValueError, AttributeError):
-            time_str = timestamp
-            ago = ""
-
-        # Format sources
-        source_names = {
-            "pubmed": "PubMed",
-            "crossref": "Crossref",
-            "doaj": "DOAJ",
-            "europepmc": "EuropePMC",
-            "arxiv": "arXiv"
-        }
-
-        sources_display = []
-        for src in sources:
-            # Handle custom API format "custom:springer"
-            if src.startswith("custom:"):
-                api_name = src.split(":", 1)[1]
-                sources_display.append(f"{api_name} (custom)")
-            else:
-                sources_display.append(source_names.get(src, src))
-
-        sources_str = ", ".join(sources_display) if sources_display else "Unknown"
+        time_str, ago = _format_time(timestamp)
+        sources_str = _format_sources(sources)
 
         print(f"[{i}] {time_str} ({ago})")
         print(f"    Query: {query}")
         print(f"    Sources: {sources_str}")
         print(f"    Results: {result_count}")
+        if entry.get("session"):
+            print(f"    Session: {entry['session']}")
         print()
 
     print(f"{'='*80}")
-    print(f"History file: {HISTORY_FILE}")
-    print(f"Showing {len(history)} most recent searches (max: {MAX_HISTORY_ENTRIES})")
+    print(f"History file: {search_history.HISTORY_LOG}")
+    print(f"Showing {len(history)} most recent searches (max: {search_history.max_entries()}, set LIXPLORE_HISTORY_MAX to change)")
+    print("Re-run a search with: lixplore --rerun N")
     print(f"{'='*80}\n")
 
 
@@ -652,7 +907,7 @@ def export_to_format(results, format, filename=None, fields=None, compress=False
         fields: Optional list of field names to export
         compress: If True, compress exported file to ZIP
     """
-    from lixplore.utils.export import compress_export
+    from lixplore.utils.export import compress_export, export_results
     exported_path = export_results(results, format, filename, fields)
 
     # Compress if requested
@@ -694,6 +949,7 @@ def batch_export(results, formats, output_base=None, fields=None, compress=False
             ext_map = {
                 'csv': 'csv',
                 'json': 'json',
+                'jsonl': 'jsonl',
                 'bibtex': 'bib',
                 'ris': 'ris',
                 'endnote': 'xml',
@@ -736,55 +992,82 @@ def review_articles(results, article_numbers):
             print(f"Warning: Article #{num} is out of range (1-{len(results)})")
 
 
-def save_results(results, query=None, sources=None):
+def save_results(results, query=None, sources=None, session=None):
     """
     Save search results to cache with timestamp and metadata.
 
+    Each search is kept as a result session (see lixplore.utils.sessions),
+    written as JSON Lines with an offset index so later commands can read
+    single articles without parsing the whole set.
+
     Args:
         results: List of article dictionaries
         query: Search query string (optional)
         sources: List of sources searched (optional)
+        session: Session name (optional; default: the next session number)
+
+    Returns:
+        Name of the saved session, or None if it could not be saved
     """
-    cache_data = {
-        "timestamp": datetime.now().isoformat(),
-        "query": query,
-        "sources": sources,
-        "count": len(results),
-        "results": results
-    }
-    with open(CACHE_FILE, "w", encoding="utf-8") as f:
-        json.dump(cache_data, f, ensure_ascii=False, indent=2)
+    from lixplore.utils import sessions
+
+    try:
+        return sessions.save(results, query=query, sources=sources, name=session)
+    except OSError as e:
+        print(f"Warning: Could not cache results: {e}")
+        return None
+
+
+def _load_legacy_cache():
+    """Read results cached by older versions in CACHE_FILE (one JSON document)."""
+    if not os.path.exists(CACHE_FILE):
+        return None
 
+    with open(CACHE_FILE, "r", encoding="utf-8") as f:
+        cache_data = json.load(f)
 
-def load_cached_results(check_expiry=True, force_refresh=False):
+    # Handle old cache format (just array of results)
+    if isinstance(cache_data, list):
+        print("Cache format outdated, will refresh...")
+        return None
+
+    return cache_data
+
+
+def load_cached_results(check_expiry=True, force_refresh=False, session=None):
     """
     Load previously cached search results with expiration checking.
 
     Args:
         check_expiry: If True, check if cache has expired (default: True)
         force_refresh: If True, ignore cache and return None (default: False)
+        session: Session name or number (default: the most recent search)
 
     Returns:
-        List of article dictionaries or None if no cache/expired
+        Sequence of article dictionaries or None if no cache/expired. Articles
+        are decoded from disk only when they are accessed.
     """
-    if force_refresh:
-        return None
+    from lixplore.utils import sessions
 
-    if not os.path.exists(CACHE_FILE):
+    if force_refresh:
         return None
 
     try:
-        with open(CACHE_FILE, "r", encoding="utf-8") as f:
-            cache_data = json.load(f)
-
-        # Handle old cache format (just array of results)
-        if isinstance(cache_data, list):
-            print("Cache format outdated, will refresh...")
+        _, cached = sessions.load(session)
+        if cached is not None:
+            meta, results = cached.meta, cached
+        elif session or os.path.exists(sessions.SESSIONS_FILE):
+            # Pre-session caches are only read until the first session exists
             return None
+        else:
+            meta = _load_legacy_cache()
+            if meta is None:
+                return None
+            results = meta.get("results", [])
 
         # Check expiration if enabled
-        if check_expiry and "timestamp" in cache_data:
-            cached_time = datetime.fromisoformat(cache_data["timestamp"])
+        if check_expiry and meta.get("timestamp"):
+            cached_time = datetime.fromisoformat(meta["timestamp"])
             expiry_time = cached_time + timedelta(days=CACHE_EXPIRY_DAYS)
 
             if datetime.now() > expiry_time:
@@ -799,14 +1082,41 @@ def load_cached_results(check_expiry=True, force_refresh=False):
                 hours = age.seconds // 3600
                 print(f"Using cached results ({hours} hour(s) old)")
 
-        # Return just the results array
-        return cache_data.get("results", [])
+        return results
 
     except Exception as e:
         print(f"Error loading cached results: {e}")
         return None
 
 
+def show_sessions():
+    """Display saved result sessions."""
+    from lixplore.utils import sessions
+
+    current, saved = sessions.list_sessions()
+    if not saved:
+        print("No saved sessions found.")
+        print("Run a search to create one (e.g., lixplore -P -q \"cancer\" -m 10 --session cancer)")
+        return
+
+    print(f"\n{'='*80}")
+    print(f"RESULT SESSIONS ({len(saved)})")
+    print(f"{'='*80}\n")
+
+    for name, entry in saved:
+        time_str, ago = _format_time(entry.get("timestamp", "Unknown time"))
+        marker = " (current)" if name == current else ""
+        print(f"[{name}]{marker} {time_str} ({ago})")
+        print(f"    Query: {entry.get('query') or 'Unknown query'}")
+        print(f"    Sources: {_format_sources(entry.get('sources'))}")
+        print(f"    Results: {entry.get('count', 0)}")
+        print()
+
+    print(f"{'='*80}")
+    print(f"Use a session with: lixplore --session NAME -R 1  (max: {sessions.MAX_SESSIONS} sessions)")
+    print(f"{'='*80}\n")
+
+
 def load_results():
     """Legacy function for backward compatibility."""
     cached = load_cached_results(check_expiry=False)
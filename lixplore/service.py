@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+In-process search service.
+
+One SearchService is shared by everything that searches repeatedly inside a
+single long-lived process: the interactive shell, the TUIs and the wizard.
+It keeps what is expensive to rebuild alive between calls:
+
+* the pooled HTTP session (lixplore.utils.http_session) and the imported
+  source modules, warmed up in the background when the service starts
+* an in-memory LRU of recent searches on top of the on-disk response cache
+* a dedup index of every article returned so far, so follow-up searches can
+  leave out articles that were already shown (only_new=True)
+
+Use get_service() rather than creating instances, so all callers share the
+same warm state.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from lixplore import dispatcher
+from lixplore.utils.cache import normalize_query
+from lixplore.utils.dedup import DedupIndex
+
+DEFAULT_SOURCES = ["pubmed"]
+ALL_SOURCES = ["pubmed", "crossref", "doaj", "europepmc", "arxiv"]
+
+# Number of recent searches kept in memory
+MEMORY_CACHE_ENTRIES = 32
+
+_service = None
+_service_lock = threading.Lock()
+
+
+class SearchService:
+    """
+    Reusable search entry point with warm connections and caches.
+
+    Args:
+        memory_cache_entries: Number of recent searches kept in memory
+        warm_up: Import source modules and open the HTTP session in the background
+    """
+
+    def __init__(self, memory_cache_entries: int = MEMORY_CACHE_ENTRIES, warm_up: bool = True):
+        self._memory: "OrderedDict[Tuple, List[Dict]]" = OrderedDict()
+        self._memory_entries = memory_cache_entries
+        self._seen = DedupIndex("auto", 0.85, keep_articles=False)
+        self._lock = threading.RLock()
+        self.last_results: List[Dict] = []
+        self.last_session: Optional[str] = None
+
+        if warm_up:
+            threading.Thread(target=self.warm_up, daemon=True).start()
+
+    def warm_up(self, sources: List[str] = None):
+        """Import source connectors and open the HTTP connection pool."""
+        from lixplore.utils import http_session
+
+        # Anything with a missing dependency fails again, with a message,
+        # when it is actually used
+        try:
+            http_session.get_session()
+        except ImportError:
+            pass
+        for source in sources or ALL_SOURCES:
+            try:
+                dispatcher._source_module(source)
+            except Exception:
+                pass
+
+    def _fetch(self, sources: List[str], query: str, limit: int, custom_api: Optional[str],
+               refresh: bool, show_progress: bool) -> List[Dict]:
+        """Raw merged results, from memory when this search was run recently."""
+        key = (tuple(sources), custom_api, normalize_query(query), limit)
+        with self._lock:
+            if not refresh and key in self._memory:
+                self._memory.move_to_end(key)
+                if show_progress:
+                    print("  Using results from this session's cache")
+                return [dict(article) for article in self._memory[key]]
+
+        results, timed_out = dispatcher.search_many(
+            sources, query, limit=limit, custom_api=custom_api,
+            show_progress=show_progress, refresh=refresh
+        )
+
+        # Results cut short by a timeout are not kept, so the search is retried
+        if results and not timed_out:
+            with self._lock:
+                self._memory[key] = [dict(article) for article in results]
+                self._memory.move_to_end(key)
+                while len(self._memory) > self._memory_entries:
+                    self._memory.popitem(last=False)
+        return results
+
+    def search(self, query: str, sources: List[str] = None, limit: int = 10,
+               custom_api: str = None, date: Tuple[str, str] = None,
+               dedup: Optional[str] = None, dedup_threshold: float = 0.85,
+               dedup_keep: str = "first", dedup_merge: bool = False,
+               only_new: bool = False, refresh: bool = False,
+               show_progress: bool = True, save: bool = True) -> List[Dict]:
+        """
+        Search one or more sources.
+
+        Args:
+            query: Search query string
+            sources: Source names (default: PubMed); 'all' searches every source
+            limit: Maximum results per source
+            custom_api: Custom API name to search as well (optional)
+            date: (FROM, TO) date range, as accepted by -d (optional)
+            dedup: Deduplication strategy ('auto', 'doi_only', ...) or None
+            dedup_threshold: Title similarity threshold for deduplication
+            dedup_keep: Which duplicate to keep ('first', 'most_complete', 'prefer_doi')
+            dedup_merge: Merge metadata from duplicates
+            only_new: Leave out articles already returned by this service
+            refresh: Ignore cached responses
+            show_progress: Print per-source progress lines
+            save: Save the results as a session and in the search history
+
+        Returns:
+            List of article dictionaries
+        """
+        sources = list(sources) if sources else ([] if custom_api else list(DEFAULT_SOURCES))
+        if "all" in sources:
+            sources = list(ALL_SOURCES)
+
+        results = self._fetch(sources, query, limit, custom_api, refresh, show_progress)
+
+        if date and results:
+            results = dispatcher.filter_by_date(results, date)
+
+        if dedup and results:
+            results = dispatcher.deduplicate_advanced(
+                results,
+                strategy=dedup,
+                title_threshold=dedup_threshold,
+                keep_preference=dedup_keep,
+                merge_metadata=dedup_merge
+            )
+
+        with self._lock:
+            if only_new:
+                results = [article for article in results if self._seen.find(article) is None]
+            for article in results:
+                if self._seen.find(article) is None:
+                    self._seen.add(article)
+
+        if results and save:
+            all_sources = sources + ([f"custom:{custom_api}"] if custom_api else [])
+            self.last_session = dispatcher.save_results(results, query=query, sources=all_sources)
+            dispatcher.save_to_history(query=query, sources=all_sources,
+                                       result_count=len(results), session=self.last_session)
+
+        self.last_results = results
+        return results
+
+    def clear(self):
+        """Forget cached searches and the articles seen so far."""
+        with self._lock:
+            self._memory.clear()
+            self._seen = DedupIndex("auto", 0.85, keep_articles=False)
+
+
+def get_service() -> SearchService:
+    """Return the process-wide search service, creating it on first use."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = SearchService()
+        return _service
@@ -6,8 +6,11 @@ API Documentation: https://arxiv.org/help/api/user-manual
 No authentication required
 """
 
-from typing import List, Dict
+from typing import Iterator, List, Dict
 import requests
+from lixplore.utils import http_session, metadata_store
+from lixplore.utils.paging import collect_pages, page_size_for, prefetch_pages
+from lixplore.utils.ratelimit import get_limiter
 import xml.etree.ElementTree as ET
 
 
@@ -16,43 +19,70 @@ class ArxivSource:
     arXiv search source for preprints and scientific papers
     """
 
+    # arXiv recommends modest slices and a pause between consecutive calls
+    PAGE_SIZE = 200
+    PAGE_DELAY = 3.0  # seconds
+
     def __init__(self):
         self.base_url = "http://export.arxiv.org/api/query"
 
     def search(self, query: str, max_results: int = 10) -> List[Dict]:
-        results = []
-        try:
-            params = {
-                "search_query": f"all:{query}",
-                "start": 0,
-                "max_results": max_results
-            }
-
-            response = requests.get(self.base_url, params=params, timeout=10)
-            response.raise_for_status()
-
-            # Parse XML response
-            root = ET.fromstring(response.content)
-
-            # Define namespace
-            ns = {
-                'atom': 'http://www.w3.org/2005/Atom',
-                'arxiv': 'http://arxiv.org/schemas/atom'
-            }
+        return collect_pages(prefetch_pages(self.iter_pages(query, max_results)), max_results)
+
+    def iter_pages(self, query: str, max_results: int = 10) -> Iterator[List[Dict]]:
+        """
+        Yield result pages using arXiv start offsets.
+
+        Args:
+            query: Search query
+            max_results: Total number of articles to fetch across all pages
+
+        Yields:
+            One list of articles per request
+        """
+        # Define namespace
+        ns = {
+            'atom': 'http://www.w3.org/2005/Atom',
+            'arxiv': 'http://arxiv.org/schemas/atom',
+            'opensearch': 'http://a9.com/-/spec/opensearch/1.1/'
+        }
 
-            entries = root.findall('atom:entry', ns)
+        # One limiter per process, so searches and enrichment lookups share the pause
+        limiter = get_limiter("arxiv", 1.0 / self.PAGE_DELAY, capacity=1)
 
-            for entry in entries:
-                article_data = self.parse_article(entry, ns)
-                results.append(article_data)
+        start = 0
+        try:
+            while start < max_results:
+                params = {
+                    "search_query": f"all:{query}",
+                    "start": start,
+                    "max_results": page_size_for(max_results - start, self.PAGE_SIZE)
+                }
+
+                limiter.acquire()
+                response = http_session.get(self.base_url, params=params, timeout=10)
+                response.raise_for_status()
+
+                # Parse XML response
+                root = ET.fromstring(response.content)
+                entries = root.findall('atom:entry', ns)
+                if not entries:
+                    break
+
+                page = [self.parse_article(entry, ns) for entry in entries]
+                start += len(page)
+                metadata_store.save_articles(page, ["arxiv"])
+                yield page
+
+                total_elem = root.find('opensearch:totalResults', ns)
+                if total_elem is not None and total_elem.text and start >= int(total_elem.text):
+                    break
 
         except requests.exceptions.RequestException as e:
             print(f"[arXiv Error] {e}")
         except Exception as e:
             print(f"[arXiv Error] {e}")
 
-        return results
-
     def parse_article(self, entry, ns: Dict) -> Dict:
         # Title
         title_elem = entry.find('atom:title', ns)
@@ -106,3 +136,8 @@ class ArxivSource:
 # Wrapper function for dispatcher
 def search(query: str, max_results: int = 10) -> List[Dict]:
     return ArxivSource().search(query, max_results)
+
+
+def iter_pages(query: str, max_results: int = 10, prefetch: bool = True) -> Iterator[List[Dict]]:
+    pages = ArxivSource().iter_pages(query, max_results)
+    return prefetch_pages(pages) if prefetch else pages
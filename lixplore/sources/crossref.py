@@ -6,8 +6,10 @@ API Documentation: https://api.crossref.org/swagger-ui/index.html
 No authentication required
 """
 
-from typing import List, Dict
+from typing import Iterator, List, Dict
 import requests
+from lixplore.utils import http_session, metadata_store
+from lixplore.utils.paging import collect_pages, page_size_for, prefetch_pages
 
 
 class CrossrefSource:
@@ -15,35 +17,60 @@ class CrossrefSource:
     Crossref search source for literature
     """
 
+    # Crossref accepts up to 1000 rows, but smaller pages arrive sooner
+    PAGE_SIZE = 200
+
     def __init__(self):
         self.base_url = "https://api.crossref.org/works"
 
     def search(self, query: str, max_results: int = 10) -> List[Dict]:
-        results = []
-        try:
-            params = {
-                "query": query,
-                "rows": max_results,
-                "select": "DOI,title,author,abstract,container-title,published,URL"
-            }
+        return collect_pages(prefetch_pages(self.iter_pages(query, max_results)), max_results)
 
-            response = requests.get(self.base_url, params=params, timeout=10)
-            response.raise_for_status()
+    def iter_pages(self, query: str, max_results: int = 10) -> Iterator[List[Dict]]:
+        """
+        Yield result pages using Crossref deep paging (cursor=*).
 
-            data = response.json()
-            items = data.get("message", {}).get("items", [])
+        Args:
+            query: Search query
+            max_results: Total number of articles to fetch across all pages
 
-            for item in items:
-                article_data = self.parse_article(item)
-                results.append(article_data)
+        Yields:
+            One list of articles per request
+        """
+        fetched = 0
+        cursor = "*"
+        try:
+            while fetched < max_results:
+                params = {
+                    "query": query,
+                    "rows": page_size_for(max_results - fetched, self.PAGE_SIZE),
+                    "cursor": cursor,
+                    "select": "DOI,title,author,abstract,container-title,published,URL"
+                }
+
+                response = http_session.get(self.base_url, params=params, timeout=10)
+                response.raise_for_status()
+
+                message = response.json().get("message", {})
+                items = message.get("items", [])
+                if not items:
+                    break
+
+                page = [self.parse_article(item) for item in items]
+                fetched += len(page)
+                metadata_store.save_articles(page, ["crossref"])
+                yield page
+
+                cursor = message.get("next-cursor")
+                total = message.get("total-results", 0)
+                if not cursor or fetched >= total:
+                    break
 
         except requests.exceptions.RequestException as e:
             print(f"[Crossref Error] {e}")
         except Exception as e:
             print(f"[Crossref Error] {e}")
 
-        return results
-
     def parse_article(self, item: Dict) -> Dict:
         # Title
         title = ""
@@ -100,3 +127,8 @@ class CrossrefSource:
 # Wrapper function for dispatcher
 def search(query: str, max_results: int = 10) -> List[Dict]:
     return CrossrefSource().search(query, max_results)
+
+
+def iter_pages(query: str, max_results: int = 10, prefetch: bool = True) -> Iterator[List[Dict]]:
+    pages = CrossrefSource().iter_pages(query, max_results)
+    return prefetch_pages(pages) if prefetch else pages
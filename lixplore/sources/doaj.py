@@ -6,8 +6,10 @@ API Documentation: https://doaj.org/api/docs
 No authentication required
 """
 
-from typing import List, Dict
+from typing import Iterator, List, Dict
 import requests
+from lixplore.utils import http_session, metadata_store
+from lixplore.utils.paging import collect_pages, page_size_for, prefetch_pages
 
 
 class DOAJSource:
@@ -15,36 +17,63 @@ class DOAJSource:
     DOAJ search source for open access literature
     """
 
+    # DOAJ caps pageSize at 100
+    PAGE_SIZE = 100
+
     def __init__(self):
         self.base_url = "https://doaj.org/api/v3/search/articles"
 
     def search(self, query: str, max_results: int = 10) -> List[Dict]:
-        results = []
+        return collect_pages(prefetch_pages(self.iter_pages(query, max_results)), max_results)
+
+    def iter_pages(self, query: str, max_results: int = 10) -> Iterator[List[Dict]]:
+        """
+        Yield result pages using DOAJ page numbers.
+
+        Args:
+            query: Search query
+            max_results: Total number of articles to fetch across all pages
+
+        Yields:
+            One list of articles per request
+        """
+        fetched = 0
+        page_number = 1
+        # Keep one page size for every request so page numbers line up
+        page_size = page_size_for(max_results, self.PAGE_SIZE)
         try:
             # DOAJ API v3 - query is part of the URL path
             url = f"{self.base_url}/{query}"
-            params = {
-                "pageSize": max_results,
-                "page": 1
-            }
 
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            while fetched < max_results:
+                params = {
+                    "pageSize": page_size,
+                    "page": page_number
+                }
+
+                response = http_session.get(url, params=params, timeout=10)
+                response.raise_for_status()
+
+                data = response.json()
+                items = data.get("results", [])
+                if not items:
+                    break
 
-            data = response.json()
-            items = data.get("results", [])
+                page = [self.parse_article(item) for item in items[:max_results - fetched]]
+                fetched += len(page)
+                metadata_store.save_articles(page, ["doaj"])
+                yield page
 
-            for item in items:
-                article_data = self.parse_article(item)
-                results.append(article_data)
+                total = data.get("total", 0)
+                if len(items) < page_size or page_number * page_size >= total:
+                    break
+                page_number += 1
 
         except requests.exceptions.RequestException as e:
             print(f"[DOAJ Error] {e}")
         except Exception as e:
             print(f"[DOAJ Error] {e}")
 
-        return results
-
     def parse_article(self, item: Dict) -> Dict:
         bibjson = item.get("bibjson", {})
 
@@ -106,3 +135,8 @@ class DOAJSource:
 # Wrapper function for dispatcher
 def search(query: str, max_results: int = 10) -> List[Dict]:
     return DOAJSource().search(query, max_results)
+
+
+def iter_pages(query: str, max_results: int = 10, prefetch: bool = True) -> Iterator[List[Dict]]:
+    pages = DOAJSource().iter_pages(query, max_results)
+    return prefetch_pages(pages) if prefetch else pages
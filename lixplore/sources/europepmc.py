@@ -6,8 +6,10 @@ API Documentation: https://europepmc.org/RestfulWebService
 No authentication required
 """
 
-from typing import List, Dict
+from typing import Iterator, List, Dict
 import requests
+from lixplore.utils import http_session, metadata_store
+from lixplore.utils.paging import collect_pages, page_size_for, prefetch_pages
 
 
 class EuropePMCSource:
@@ -15,35 +17,61 @@ class EuropePMCSource:
     Europe PMC search source for life sciences literature
     """
 
+    # Europe PMC accepts up to 1000 results per page
+    PAGE_SIZE = 500
+
     def __init__(self):
         self.base_url = "https://www.ebi.ac.uk/europepmc/webservices/rest/search"
 
     def search(self, query: str, max_results: int = 10) -> List[Dict]:
-        results = []
-        try:
-            params = {
-                "query": query,
-                "pageSize": max_results,
-                "format": "json"
-            }
+        return collect_pages(prefetch_pages(self.iter_pages(query, max_results)), max_results)
 
-            response = requests.get(self.base_url, params=params, timeout=10)
-            response.raise_for_status()
+    def iter_pages(self, query: str, max_results: int = 10) -> Iterator[List[Dict]]:
+        """
+        Yield result pages using Europe PMC cursorMark paging.
 
-            data = response.json()
-            items = data.get("resultList", {}).get("result", [])
+        Args:
+            query: Search query
+            max_results: Total number of articles to fetch across all pages
 
-            for item in items:
-                article_data = self.parse_article(item)
-                results.append(article_data)
+        Yields:
+            One list of articles per request
+        """
+        fetched = 0
+        cursor = "*"
+        try:
+            while fetched < max_results:
+                params = {
+                    "query": query,
+                    "pageSize": page_size_for(max_results - fetched, self.PAGE_SIZE),
+                    "cursorMark": cursor,
+                    "format": "json"
+                }
+
+                response = http_session.get(self.base_url, params=params, timeout=10)
+                response.raise_for_status()
+
+                data = response.json()
+                items = data.get("resultList", {}).get("result", [])
+                if not items:
+                    break
+
+                page = [self.parse_article(item) for item in items]
+                fetched += len(page)
+                metadata_store.save_articles(page, ["europepmc"])
+                yield page
+
+                # The last page returns the cursor it was given
+                next_cursor = data.get("nextCursorMark")
+                if not next_cursor or next_cursor == cursor:
+                    break
+                cursor = next_cursor
 
         except requests.exceptions.RequestException as e:
             print(f"[EuropePMC Error] {e}")
         except Exception as e:
             print(f"[EuropePMC Error] {e}")
 
-        return results
-
     def parse_article(self, item: Dict) -> Dict:
         # Title
         title = item.get("title", "")
@@ -94,3 +122,8 @@ class EuropePMCSource:
 # Wrapper function for dispatcher
 def search(query: str, max_results: int = 10) -> List[Dict]:
     return EuropePMCSource().search(query, max_results)
+
+
+def iter_pages(query: str, max_results: int = 10, prefetch: bool = True) -> Iterator[List[Dict]]:
+    pages = EuropePMCSource().iter_pages(query, max_results)
+    return prefetch_pages(pages) if prefetch else pages
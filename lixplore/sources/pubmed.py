@@ -4,10 +4,15 @@
 PubMed search source using NCBI Entrez API
 """
 
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Dict
 from Bio import Entrez
+from lixplore.utils import metadata_store
+from lixplore.utils.paging import collect_pages, prefetch_pages
+from lixplore.utils.ratelimit import get_limiter
 import os
 import json
+import threading
 
 # Load configuration
 def _load_config():
@@ -28,11 +33,42 @@ def _load_config():
     api_key = os.environ.get("PUBMED_API_KEY", "")
     return email, api_key
 
-# Configure Entrez
-_email, _api_key = _load_config()
-Entrez.email = _email
-if _api_key:
-    Entrez.api_key = _api_key
+# NCBI E-utilities allow 3 requests/second, or 10 with an API key
+NCBI_RATE = 3
+NCBI_RATE_WITH_KEY = 10
+
+# PUBMED_EMAIL / PUBMED_API_KEY values Entrez was last configured with
+_configured = None
+_config_lock = threading.Lock()
+
+
+def _config_env():
+    return os.environ.get("PUBMED_EMAIL"), os.environ.get("PUBMED_API_KEY")
+
+
+def _configure_entrez():
+    """
+    Configure Entrez from config.json on the first PubMed request, not at import.
+
+    Configures it again when the PUBMED_* environment has changed since, as
+    it does between callers of a `lixplore serve` daemon.
+    """
+    global _configured
+    env = _config_env()
+    if _configured == env:
+        return
+    with _config_lock:
+        if _configured == env:
+            return
+        email, api_key = _load_config()
+        Entrez.email = email
+        Entrez.api_key = api_key or None
+        _ncbi_limiter().set_rate(NCBI_RATE_WITH_KEY if api_key else NCBI_RATE)
+        _configured = env
+
+
+def _ncbi_limiter():
+    return get_limiter("ncbi", NCBI_RATE)
 
 
 class PubMedSource:
@@ -46,29 +82,140 @@ class PubMedSource:
       #  if api_key:
        #     Entrez.api_key = api_key
 
+    # PMIDs per efetch request, and efetch requests in flight at once
+    BATCH_SIZE = 200
+    FETCH_WORKERS = 3
+
+    # esearch lists at most this many PMIDs; later results are read by offset only
+    MAX_ID_LIST = 10000
+
+    # Records fetched less than this long ago are read from the metadata store
+    RECORD_TTL = 7 * 24 * 3600
+
     def search(self, query: str, max_results: int = 10) -> List[Dict]:
-        results = []
+        return collect_pages(prefetch_pages(self.iter_pages(query, max_results)), max_results)
+
+    def iter_pages(self, query: str, max_results: int = 10) -> Iterator[List[Dict]]:
+        """
+        Yield result pages fetched in batches from the NCBI history server.
+
+        One esearch call (usehistory=y) stores the matching PMIDs on the
+        server; efetch batches then read them by WebEnv/query_key and
+        retstart. Up to FETCH_WORKERS batches are fetched concurrently within
+        the NCBI rate limit, each parsed incrementally, and pages are yielded
+        in result order. Records already in the metadata store are not
+        fetched again.
+
+        Args:
+            query: Search query
+            max_results: Total number of articles to fetch across all batches
+
+        Yields:
+            One list of articles per efetch batch
+        """
+        executor = None
+        pending = []
         try:
-            # Step 1: Search IDs
-            handle = Entrez.esearch(db="pubmed", term=query, retmax=max_results)
+            _configure_entrez()
+
+            # Step 1: Search IDs (kept on the history server)
+            _ncbi_limiter().acquire()
+            handle = Entrez.esearch(db="pubmed", term=query, retmax=min(max_results, self.MAX_ID_LIST),
+                                    usehistory="y")
             record = Entrez.read(handle)
             handle.close()
-            id_list = record.get("IdList", [])
 
-            # Step 2: Fetch details
-            if id_list:
-                handle = Entrez.efetch(db="pubmed", id=",".join(id_list), retmode="xml")
-                records = Entrez.read(handle)
-                handle.close()
+            total = min(int(record.get("Count", 0)), max_results)
+            pmids = [str(pmid) for pmid in record.get("IdList", [])]
+            webenv = record.get("WebEnv")
+            query_key = record.get("QueryKey")
+            if not total or not webenv:
+                return
+
+            # Step 2: Fetch details in batches, keeping a few requests in flight
+            starts = list(range(0, total, self.BATCH_SIZE))
+            executor = ThreadPoolExecutor(max_workers=self.FETCH_WORKERS)
+            next_start = 0
+
+            while next_start < len(starts) or pending:
+                while next_start < len(starts) and len(pending) < self.FETCH_WORKERS:
+                    retstart = starts[next_start]
+                    retmax = min(self.BATCH_SIZE, total - retstart)
+                    pending.append(executor.submit(self._fetch_batch, webenv, query_key, retstart, retmax,
+                                                   pmids[retstart:retstart + retmax]))
+                    next_start += 1
 
-                for article in records["PubmedArticle"]:
-                    article_data = self.parse_article(article)
-                    results.append(article_data)
+                yield pending.pop(0).result()
 
         except Exception as e:
             print(f"[PubMed Error] {e}")
+        finally:
+            for future in pending:
+                future.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def _fetch_batch(self, webenv: str, query_key: str, retstart: int, retmax: int,
+                     pmids: List[str]) -> List[Dict]:
+        """
+        Fetch and parse one batch of records.
+
+        Records recently stored in the metadata store are reused; if none
+        are, the batch is read from the history server, otherwise only the
+        missing PMIDs are fetched by ID.
+        """
+        stored = {}
+        if len(pmids) == retmax:
+            records = metadata_store.find_articles(f"pmid:{pmid}" for pmid in pmids)
+            for pmid in pmids:
+                record = records.get(f"pmid:{pmid}")
+                own = metadata_store.source_record(record, "pubmed")
+                if own is not None and metadata_store.fetched_within(record, "pubmed", self.RECORD_TTL):
+                    stored[pmid] = self._from_record(own, pmid)
+
+        missing = [pmid for pmid in pmids if pmid not in stored]
+        if stored and not missing:
+            return [stored[pmid] for pmid in pmids]
+
+        _ncbi_limiter().acquire()
+        if stored:
+            handle = Entrez.efetch(db="pubmed", id=",".join(missing), retmode="xml")
+        else:
+            handle = Entrez.efetch(
+                db="pubmed", webenv=webenv, query_key=query_key,
+                retstart=retstart, retmax=retmax, retmode="xml"
+            )
+        try:
+            # Entrez.parse yields one record at a time instead of building the whole set
+            fetched = [
+                self.parse_article(article)
+                for article in Entrez.parse(handle)
+                if "MedlineCitation" in article
+            ]
+        finally:
+            handle.close()
+
+        metadata_store.save_articles(fetched, ["pubmed"], source="pubmed")
+        if not stored:
+            return fetched
+
+        # Put stored and fetched records back in result order
+        by_pmid = {metadata_store.article_ids(article).get("pmid"): article for article in fetched}
+        by_pmid.update(stored)
+        return [by_pmid[pmid] for pmid in pmids if pmid in by_pmid]
 
-        return results
+    def _from_record(self, record: Dict, pmid: str) -> Dict:
+        """Rebuild a search result from PubMed's own stored copy of a record."""
+        return {
+            "title": record.get("title", ""),
+            "authors": record.get("authors", []),
+            "abstract": record.get("abstract", ""),
+            "journal": record.get("journal", ""),
+            "year": record.get("year", ""),
+            "doi": record.get("doi", ""),
+            "url": f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
+            "source": "pubmed"
+        }
 
     def parse_article(self, article) -> Dict:
         medline = article["MedlineCitation"]
@@ -129,3 +276,7 @@ class PubMedSource:
 def search(query: str, max_results: int = 10) -> List[Dict]:
     return PubMedSource().search(query, max_results)
 
+
+def iter_pages(query: str, max_results: int = 10, prefetch: bool = True) -> Iterator[List[Dict]]:
+    pages = PubMedSource().iter_pages(query, max_results)
+    return prefetch_pages(pages) if prefetch else pages
@@ -13,35 +13,293 @@ Allows users to:
 
 import json
 import os
+import re
+import sqlite3
+import threading
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
+# Legacy store: one JSON document, rewritten on every change. It is imported
+# into the database the first time the database is opened.
 ANNOTATIONS_FILE = os.path.expanduser("~/.lixplore_annotations.json")
 
+# Indexed store: one row per annotated article
+ANNOTATIONS_DB = os.path.expanduser("~/.lixplore_annotations.db")
 
-class AnnotationManager:
-    """Manage article annotations and metadata."""
+READ_STATUSES = ['unread', 'reading', 'read']
+PRIORITIES = ['low', 'medium', 'high']
+
+# Relative weight of a match in each searchable field when ranking results
+SEARCH_WEIGHTS = {'title': 3.0, 'comments': 1.0, 'tags': 2.0}
+
+_TERM = re.compile(r'\w+', re.UNICODE)
+
+
+def _terms(text: str) -> List[str]:
+    """Split text into lowercase search terms."""
+    return _TERM.findall(text.lower())
 
-    def __init__(self):
-        self.annotations = self._load_annotations()
 
-    def _load_annotations(self) -> Dict:
-        """Load existing annotations from file."""
-        if os.path.exists(ANNOTATIONS_FILE):
+class AnnotationManager:
+    """
+    Manage article annotations and metadata.
+
+    Annotations live in a SQLite database (ANNOTATIONS_DB). Each annotation
+    is one row holding the full record as JSON, next to indexed columns for
+    rating, read status and priority and a tag table, so updating one
+    article writes one row and filters run as indexed queries.
+
+    Titles, comments and tags are kept in a full-text index (SQLite FTS5,
+    or a plain term table where FTS5 is not compiled in) that is updated
+    together with each row.
+    """
+
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path or ANNOTATIONS_DB
+        self._lock = threading.RLock()
+        self._conn = self._connect()
+        self._migrate_json()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open (and create) the annotation database."""
+        try:
+            conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.Error as e:
+            print(f"Warning: Could not open annotations database ({e}); changes will not be saved")
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS annotations ("
+            " seq INTEGER PRIMARY KEY,"
+            " article_id TEXT NOT NULL UNIQUE,"
+            " record TEXT NOT NULL,"
+            " rating INTEGER,"
+            " read_status TEXT,"
+            " priority TEXT,"
+            " comment_count INTEGER NOT NULL DEFAULT 0,"
+            " updated_at TEXT)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS annotation_tags ("
+            " article_id TEXT NOT NULL,"
+            " tag TEXT NOT NULL,"
+            " PRIMARY KEY (article_id, tag))"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS store_info ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS annotations_rating ON annotations (rating)")
+        conn.execute("CREATE INDEX IF NOT EXISTS annotations_read_status ON annotations (read_status)")
+        conn.execute("CREATE INDEX IF NOT EXISTS annotations_priority ON annotations (priority)")
+        conn.execute("CREATE INDEX IF NOT EXISTS annotation_tags_tag ON annotation_tags (tag)")
+
+        try:
+            conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS annotation_fts USING fts5("
+                " article_id UNINDEXED, title, comments, tags,"
+                " tokenize = 'unicode61', prefix = '2 3')"
+            )
+            self._fts = True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5: keep our own inverted index
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS annotation_terms ("
+                " term TEXT NOT NULL,"
+                " article_id TEXT NOT NULL,"
+                " field TEXT NOT NULL,"
+                " PRIMARY KEY (term, article_id, field))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS annotation_terms_article ON annotation_terms (article_id)")
+            self._fts = False
+        conn.commit()
+        return conn
+
+    def _migrate_json(self):
+        """Import the legacy JSON file once, the first time the database is used."""
+        self._build_search_index()
+        with self._lock:
+            done = self._conn.execute(
+                "SELECT value FROM store_info WHERE key = 'json_imported'"
+            ).fetchone()
+            if done:
+                return
+            if os.path.exists(ANNOTATIONS_FILE):
+                count = self.import_json(ANNOTATIONS_FILE, replace=False)
+                if count:
+                    print(f"Imported {count} annotation(s) from {ANNOTATIONS_FILE}")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO store_info (key, value) VALUES ('json_imported', ?)",
+                (datetime.now().isoformat(),)
+            )
+            self._conn.commit()
+
+    def _build_search_index(self):
+        """Index annotations stored before the search index existed."""
+        # FTS rows are keyed by the annotation's seq; older indexes were not
+        key = 'search_index_fts5_seq' if self._fts else 'search_index_terms'
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM store_info WHERE key = ?", (key,)).fetchone():
+                return
             try:
-                with open(ANNOTATIONS_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                return {}
-        return {}
-
-    def _save_annotations(self):
-        """Save annotations to file."""
+                table = 'annotation_fts' if self._fts else 'annotation_terms'
+                self._conn.execute(f"DELETE FROM {table}")
+                for article_id, annotation in self._iter_all():
+                    self._index(article_id, annotation, replace=False)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO store_info (key, value) VALUES (?, ?)",
+                    (key, datetime.now().isoformat())
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._conn.rollback()
+                print(f"Warning: Could not build annotation search index: {e}")
+
+    def import_json(self, path: str, replace: bool = True) -> int:
+        """
+        Import annotations from a JSON file in the legacy format.
+
+        This is the format of ~/.lixplore_annotations.json and of
+        export_annotations(format='json'): an object mapping article IDs to
+        annotation records.
+
+        Args:
+            path: JSON file to import
+            replace: Overwrite annotations that already exist
+
+        Returns:
+            Number of annotations imported
+        """
         try:
-            with open(ANNOTATIONS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.annotations, f, indent=2, ensure_ascii=False)
-        except IOError as e:
-            print(f"Warning: Could not save annotations: {e}")
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Warning: Could not read annotations from {path}: {e}")
+            return 0
+        if not isinstance(data, dict):
+            return 0
+
+        count = 0
+        with self._lock:
+            try:
+                for article_id, annotation in data.items():
+                    if not isinstance(annotation, dict):
+                        continue
+                    if not replace and self._get(article_id) is not None:
+                        continue
+                    self._write(article_id, annotation)
+                    count += 1
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._conn.rollback()
+                print(f"Warning: Could not import annotations: {e}")
+                return 0
+        return count
+
+    def _write(self, article_id: str, annotation: Dict):
+        """Insert or update one annotation row and its tags (caller commits)."""
+        values = (
+            json.dumps(annotation, ensure_ascii=False),
+            annotation.get('rating'),
+            annotation.get('read_status', 'unread'),
+            annotation.get('priority', 'medium'),
+            len(annotation.get('comments', [])),
+            annotation.get('updated_at'),
+            article_id,
+        )
+        updated = self._conn.execute(
+            "UPDATE annotations SET record = ?, rating = ?, read_status = ?, priority = ?,"
+            " comment_count = ?, updated_at = ? WHERE article_id = ?",
+            values
+        ).rowcount
+        if not updated:
+            self._conn.execute(
+                "INSERT INTO annotations (record, rating, read_status, priority,"
+                " comment_count, updated_at, article_id) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                values
+            )
+        self._conn.execute("DELETE FROM annotation_tags WHERE article_id = ?", (article_id,))
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO annotation_tags (article_id, tag) VALUES (?, ?)",
+            [(article_id, tag) for tag in annotation.get('tags', [])]
+        )
+        self._index(article_id, annotation)
+
+    @staticmethod
+    def _search_fields(annotation: Dict) -> Dict[str, str]:
+        """Searchable text of an annotation, by field."""
+        return {
+            'title': annotation.get('article_info', {}).get('title') or '',
+            'comments': '\n'.join(c.get('text', '') for c in annotation.get('comments', [])),
+            'tags': ' '.join(annotation.get('tags', [])),
+        }
+
+    def _unindex(self, article_id: str):
+        """Drop an annotation from the search index (caller commits; row must still exist)."""
+        if self._fts:
+            # The FTS rowid is the annotation's seq, so this is a key lookup
+            self._conn.execute(
+                "DELETE FROM annotation_fts WHERE rowid = (SELECT seq FROM annotations WHERE article_id = ?)",
+                (article_id,)
+            )
+        else:
+            self._conn.execute("DELETE FROM annotation_terms WHERE article_id = ?", (article_id,))
+
+    def _index(self, article_id: str, annotation: Dict, replace: bool = True):
+        """(Re)index one annotation for search (caller commits)."""
+        if replace:
+            self._unindex(article_id)
+        fields = self._search_fields(annotation)
+        if self._fts:
+            self._conn.execute(
+                "INSERT INTO annotation_fts (rowid, article_id, title, comments, tags)"
+                " SELECT seq, ?, ?, ?, ? FROM annotations WHERE article_id = ?",
+                (article_id, fields['title'], fields['comments'], fields['tags'], article_id)
+            )
+        else:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO annotation_terms (term, article_id, field) VALUES (?, ?, ?)",
+                [(term, article_id, field) for field, text in fields.items() for term in set(_terms(text))]
+            )
+
+    def _save_annotation(self, article_id: str, annotation: Dict):
+        """Save a single annotation."""
+        with self._lock:
+            try:
+                self._write(article_id, annotation)
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._conn.rollback()
+                print(f"Warning: Could not save annotations: {e}")
+
+    def _get(self, article_id: str) -> Optional[Dict]:
+        """Read one annotation record."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT record FROM annotations WHERE article_id = ?", (article_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _iter_all(self, where: str = "", params: Tuple = ()) -> Iterator[Tuple[str, Dict]]:
+        """Yield (article_id, annotation) pairs in the order they were created."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT article_id, record FROM annotations {where} ORDER BY seq", params
+            ).fetchall()
+        for article_id, record in rows:
+            yield article_id, json.loads(record)
+
+    def count(self) -> int:
+        """Number of annotated articles."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM annotations").fetchone()[0]
+
+    @property
+    def annotations(self) -> Dict:
+        """All annotations as a dictionary keyed by article ID (loads every record)."""
+        return dict(self._iter_all())
 
     def _get_article_id(self, article: Dict) -> str:
         """Get unique identifier for article (DOI or title hash)."""
@@ -74,65 +332,66 @@ class AnnotationManager:
         """
         article_id = self._get_article_id(article)
 
-        # Initialize annotation if doesn't exist
-        if article_id not in self.annotations:
-            self.annotations[article_id] = {
-                'article_info': {
-                    'title': article.get('title', 'No title'),
-                    'authors': article.get('authors', []),
-                    'year': article.get('year'),
-                    'doi': article.get('doi'),
-                    'source': article.get('source'),
-                },
-                'comments': [],
-                'tags': [],
-                'rating': None,
-                'read_status': 'unread',
-                'priority': 'medium',
-                'created_at': datetime.now().isoformat(),
-                'updated_at': datetime.now().isoformat()
-            }
-
-        # Update annotation
-        annotation = self.annotations[article_id]
-
-        if comment:
-            annotation['comments'].append({
-                'timestamp': datetime.now().isoformat(),
-                'text': comment
-            })
+        with self._lock:
+            annotation = self._get(article_id)
+
+            # Initialize annotation if doesn't exist
+            if annotation is None:
+                annotation = {
+                    'article_info': {
+                        'title': article.get('title', 'No title'),
+                        'authors': article.get('authors', []),
+                        'year': article.get('year'),
+                        'doi': article.get('doi'),
+                        'source': article.get('source'),
+                    },
+                    'comments': [],
+                    'tags': [],
+                    'rating': None,
+                    'read_status': 'unread',
+                    'priority': 'medium',
+                    'created_at': datetime.now().isoformat(),
+                    'updated_at': datetime.now().isoformat()
+                }
+
+            # Update annotation
+            if comment:
+                annotation['comments'].append({
+                    'timestamp': datetime.now().isoformat(),
+                    'text': comment
+                })
 
-        if rating is not None:
-            if 1 <= rating <= 5:
-                annotation['rating'] = rating
-            else:
-                print(f"Warning: Rating must be 1-5, got {rating}")
+            if rating is not None:
+                if 1 <= rating <= 5:
+                    annotation['rating'] = rating
+                else:
+                    print(f"Warning: Rating must be 1-5, got {rating}")
 
-        if tags:
-            existing_tags = set(annotation['tags'])
-            existing_tags.update(tags)
-            annotation['tags'] = sorted(list(existing_tags))
+            if tags:
+                existing_tags = set(annotation['tags'])
+                existing_tags.update(tags)
+                annotation['tags'] = sorted(list(existing_tags))
 
-        if read_status:
-            if read_status in ['unread', 'reading', 'read']:
-                annotation['read_status'] = read_status
-            else:
-                print(f"Warning: Invalid read_status '{read_status}'")
+            if read_status:
+                if read_status in READ_STATUSES:
+                    annotation['read_status'] = read_status
+                else:
+                    print(f"Warning: Invalid read_status '{read_status}'")
 
-        if priority:
-            if priority in ['low', 'medium', 'high']:
-                annotation['priority'] = priority
-            else:
-                print(f"Warning: Invalid priority '{priority}'")
+            if priority:
+                if priority in PRIORITIES:
+                    annotation['priority'] = priority
+                else:
+                    print(f"Warning: Invalid priority '{priority}'")
 
-        annotation['updated_at'] = datetime.now().isoformat()
+            annotation['updated_at'] = datetime.now().isoformat()
 
-        self._save_annotations()
+            self._save_annotation(article_id, annotation)
         return article_id
 
     def get_annotation(self, article_id: str) -> Optional[Dict]:
         """Get annotation for an article."""
-        return self.annotations.get(article_id)
+        return self._get(article_id)
 
     def get_annotation_for_article(self, article: Dict) -> Optional[Dict]:
         """Get annotation using article object."""
@@ -141,11 +400,19 @@ class AnnotationManager:
 
     def remove_annotation(self, article_id: str) -> bool:
         """Remove annotation for an article."""
-        if article_id in self.annotations:
-            del self.annotations[article_id]
-            self._save_annotations()
-            return True
-        return False
+        with self._lock:
+            try:
+                self._unindex(article_id)
+                removed = self._conn.execute(
+                    "DELETE FROM annotations WHERE article_id = ?", (article_id,)
+                ).rowcount
+                self._conn.execute("DELETE FROM annotation_tags WHERE article_id = ?", (article_id,))
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._conn.rollback()
+                print(f"Warning: Could not save annotations: {e}")
+                return False
+        return removed > 0
 
     def list_all(self, filter_params: Dict = None) -> List[Dict]:
         """
@@ -164,91 +431,138 @@ class AnnotationManager:
         Returns:
             List of annotations
         """
-        results = []
-
-        for article_id, annotation in self.annotations.items():
-            # Apply filters
-            if filter_params:
-                if 'min_rating' in filter_params:
-                    if not annotation.get('rating') or annotation['rating'] < filter_params['min_rating']:
-                        continue
-
-                if 'max_rating' in filter_params:
-                    if not annotation.get('rating') or annotation['rating'] > filter_params['max_rating']:
-                        continue
-
-                if 'tags' in filter_params:
-                    required_tags = filter_params['tags']
-                    if not any(tag in annotation.get('tags', []) for tag in required_tags):
-                        continue
-
-                if 'read_status' in filter_params:
-                    if annotation.get('read_status') != filter_params['read_status']:
-                        continue
-
-                if 'priority' in filter_params:
-                    if annotation.get('priority') != filter_params['priority']:
-                        continue
-
-                if 'has_comments' in filter_params:
-                    has_comments = len(annotation.get('comments', [])) > 0
-                    if has_comments != filter_params['has_comments']:
-                        continue
-
-            results.append({
-                'article_id': article_id,
-                'annotation': annotation
-            })
-
-        return results
-
-    def search_annotations(self, query: str) -> List[Dict]:
+        conditions = []
+        params = []
+
+        if filter_params:
+            if 'min_rating' in filter_params:
+                conditions.append("rating >= ?")
+                params.append(filter_params['min_rating'])
+
+            if 'max_rating' in filter_params:
+                conditions.append("rating <= ?")
+                params.append(filter_params['max_rating'])
+
+            if 'tags' in filter_params:
+                required_tags = list(filter_params['tags'])
+                conditions.append(
+                    "article_id IN (SELECT article_id FROM annotation_tags"
+                    f" WHERE tag IN ({','.join('?' * len(required_tags))}))"
+                )
+                params.extend(required_tags)
+
+            if 'read_status' in filter_params:
+                conditions.append("read_status = ?")
+                params.append(filter_params['read_status'])
+
+            if 'priority' in filter_params:
+                conditions.append("priority = ?")
+                params.append(filter_params['priority'])
+
+            if 'has_comments' in filter_params:
+                conditions.append("comment_count > 0" if filter_params['has_comments'] else "comment_count = 0")
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return [
+            {'article_id': article_id, 'annotation': annotation}
+            for article_id, annotation in self._iter_all(where, tuple(params))
+        ]
+
+    def search_annotations(self, query: str, limit: int = None) -> List[Dict]:
         """
         Search annotations by keyword in comments, tags, or title.
 
+        Every word of the query must match the start of a word in the title,
+        a comment or a tag ("prot" finds "protein"). Results are ranked by
+        relevance, with title and tag matches counting more than comments.
+
         Args:
             query: Search query string
+            limit: Maximum number of results (None = all)
 
         Returns:
-            List of matching annotations
+            List of matching annotations, best match first
         """
-        results = []
-        query_lower = query.lower()
-
-        for article_id, annotation in self.annotations.items():
-            # Search in title
-            title = annotation.get('article_info', {}).get('title', '')
-            if query_lower in title.lower():
-                results.append({
-                    'article_id': article_id,
-                    'annotation': annotation,
-                    'match_type': 'title',
-                    'match_text': title
-                })
-                continue
+        terms = list(dict.fromkeys(_terms(query)))
+        if not terms:
+            return []
 
-            # Search in comments
-            for comment in annotation.get('comments', []):
-                if query_lower in comment['text'].lower():
-                    results.append({
-                        'article_id': article_id,
-                        'annotation': annotation,
-                        'match_type': 'comment',
-                        'match_text': comment['text']
-                    })
-                    break
-
-            # Search in tags
-            if any(query_lower in tag.lower() for tag in annotation.get('tags', [])):
-                results.append({
-                    'article_id': article_id,
-                    'annotation': annotation,
-                    'match_type': 'tag',
-                    'match_text': ', '.join(annotation['tags'])
-                })
+        with self._lock:
+            if self._fts:
+                ranked = self._search_fts(terms, limit)
+            else:
+                ranked = self._search_terms(terms, limit)
 
+            if not ranked:
+                return []
+            placeholders = ','.join('?' * len(ranked))
+            records = dict(self._conn.execute(
+                f"SELECT article_id, record FROM annotations WHERE article_id IN ({placeholders})", ranked
+            ).fetchall())
+
+        results = []
+        for article_id in ranked:
+            if article_id not in records:
+                continue
+            annotation = json.loads(records[article_id])
+            match_type, match_text = self._match_context(annotation, terms)
+            results.append({
+                'article_id': article_id,
+                'annotation': annotation,
+                'match_type': match_type,
+                'match_text': match_text
+            })
         return results
 
+    def _search_fts(self, terms: List[str], limit: Optional[int]) -> List[str]:
+        """Ranked article IDs from the FTS5 index."""
+        match = ' '.join(f'"{term}"*' for term in terms)
+        weights = ', '.join(str(SEARCH_WEIGHTS[field]) for field in ('title', 'comments', 'tags'))
+        sql = (
+            "SELECT article_id FROM annotation_fts WHERE annotation_fts MATCH ?"
+            f" ORDER BY bm25(annotation_fts, 0, {weights})"
+        )
+        params = [match]
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [row[0] for row in self._conn.execute(sql, params)]
+
+    def _search_terms(self, terms: List[str], limit: Optional[int]) -> List[str]:
+        """Ranked article IDs from the fallback inverted index."""
+        scores = None
+        for term in terms:
+            term_scores = {}
+            for article_id, field in self._conn.execute(
+                "SELECT article_id, field FROM annotation_terms WHERE term >= ? AND term < ?",
+                (term, term + '\U0010ffff')
+            ):
+                term_scores[article_id] = term_scores.get(article_id, 0) + SEARCH_WEIGHTS[field]
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {aid: score + term_scores[aid] for aid, score in scores.items() if aid in term_scores}
+            if not scores:
+                return []
+        ranked = sorted(scores, key=scores.get, reverse=True)
+        return ranked[:limit] if limit else ranked
+
+    def _match_context(self, annotation: Dict, terms: List[str]) -> Tuple[str, str]:
+        """Which field of a search result matched, and its text."""
+        def matches(text):
+            words = _terms(text)
+            return any(word.startswith(term) for term in terms for word in words)
+
+        fields = self._search_fields(annotation)
+        if matches(fields['title']):
+            return 'title', fields['title']
+        for comment in annotation.get('comments', []):
+            if matches(comment.get('text', '')):
+                return 'comment', comment['text']
+        if matches(fields['tags']):
+            return 'tag', ', '.join(annotation.get('tags', []))
+        return 'title', fields['title']
+
     def export_annotations(self, format: str = 'markdown', output_file: str = None) -> str:
         """
         Export all annotations to a file.
@@ -278,10 +592,10 @@ class AnnotationManager:
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write("# Lixplore Annotations\n\n")
             f.write(f"*Exported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
-            f.write(f"**Total Annotated Articles:** {len(self.annotations)}\n\n")
+            f.write(f"**Total Annotated Articles:** {self.count()}\n\n")
             f.write("---\n\n")
 
-            for i, (article_id, annotation) in enumerate(self.annotations.items(), 1):
+            for i, (article_id, annotation) in enumerate(self._iter_all(), 1):
                 info = annotation.get('article_info', {})
 
                 f.write(f"## {i}. {info.get('title', 'No title')}\n\n")
@@ -347,7 +661,7 @@ class AnnotationManager:
             ])
 
             # Data
-            for article_id, annotation in self.annotations.items():
+            for article_id, annotation in self._iter_all():
                 info = annotation.get('article_info', {})
                 comments = annotation.get('comments', [])
 
@@ -371,7 +685,7 @@ class AnnotationManager:
 
     def get_statistics(self) -> Dict:
         """Get statistics about annotations."""
-        total = len(self.annotations)
+        total = self.count()
 
         if total == 0:
             return {
@@ -384,35 +698,23 @@ class AnnotationManager:
                 'total_tags': 0
             }
 
-        by_rating = {}
-        by_status = {}
-        by_priority = {}
-        with_comments = 0
-        total_comments = 0
-        all_tags = set()
-
-        for annotation in self.annotations.values():
-            # Rating stats
-            rating = annotation.get('rating')
-            if rating:
-                by_rating[rating] = by_rating.get(rating, 0) + 1
-
-            # Status stats
-            status = annotation.get('read_status', 'unread')
-            by_status[status] = by_status.get(status, 0) + 1
-
-            # Priority stats
-            priority = annotation.get('priority', 'medium')
-            by_priority[priority] = by_priority.get(priority, 0) + 1
-
-            # Comment stats
-            comments = annotation.get('comments', [])
-            if comments:
-                with_comments += 1
-                total_comments += len(comments)
-
-            # Tag stats
-            all_tags.update(annotation.get('tags', []))
+        with self._lock:
+            def grouped(column):
+                return dict(self._conn.execute(
+                    f"SELECT {column}, COUNT(*) FROM annotations"
+                    f" WHERE {column} IS NOT NULL GROUP BY {column}"
+                ).fetchall())
+
+            by_rating = {rating: n for rating, n in grouped('rating').items() if rating}
+            by_status = grouped('read_status')
+            by_priority = grouped('priority')
+            with_comments, total_comments = self._conn.execute(
+                "SELECT COUNT(CASE WHEN comment_count > 0 THEN 1 END), COALESCE(SUM(comment_count), 0)"
+                " FROM annotations"
+            ).fetchone()
+            all_tags = [row[0] for row in self._conn.execute(
+                "SELECT DISTINCT tag FROM annotation_tags ORDER BY tag"
+            )]
 
         return {
             'total': total,
@@ -422,7 +724,7 @@ class AnnotationManager:
             'with_comments': with_comments,
             'total_comments': total_comments,
             'total_tags': len(all_tags),
-            'unique_tags': sorted(list(all_tags))
+            'unique_tags': all_tags
         }
 
 
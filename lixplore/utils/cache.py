@@ -1,20 +1,359 @@
 #!/usr/bin/env python3
 
+import hashlib
+import json
 import os
-from datetime import datetime, timedelta
+import threading
+import time
 
 CACHE_DIR = os.path.expanduser("~/.lixplore_cache")
+RESPONSE_CACHE_DIR = os.path.join(CACHE_DIR, "responses")
+
+# How long a cached source response stays fresh (seconds)
+RESPONSE_TTLS = {
+    "pubmed": 24 * 3600,
+    "crossref": 24 * 3600,
+    "doaj": 3 * 24 * 3600,
+    "europepmc": 24 * 3600,
+    "arxiv": 12 * 3600,
+}
+DEFAULT_RESPONSE_TTL = 24 * 3600  # Custom APIs and unknown sources
+
+# Size cap for the response cache; least recently used entries are evicted first
+MAX_RESPONSE_CACHE_BYTES = 50 * 1024 * 1024
+
+# Running total of the response cache size, so storing a response does not
+# have to scan the directory. Removals outside evict_responses() are not
+# subtracted: the total can only overestimate, and the scan it then triggers
+# writes the exact figure back.
+RESPONSE_SIZE_FILE = os.path.join(RESPONSE_CACHE_DIR, ".size")
+
 
 def ensure_cache_dir():
     os.makedirs(CACHE_DIR, exist_ok=True)
 
 def cleanup_cache(days=7):
-    ensure_cache_dir()
-    now = datetime.now()
-    for f in os.listdir(CACHE_DIR):
-        path = os.path.join(CACHE_DIR, f)
-        if os.path.isfile(path):
-            mtime = datetime.fromtimestamp(os.path.getmtime(path))
-            if now - mtime > timedelta(days=days):
-                os.remove(path)
+    """Remove every expired cache file now (same as `lixplore cache gc`)."""
+    return gc_cache(days=days)
+
+
+# ===== Incremental housekeeping =====
+# Instead of scanning the whole cache on every run, each invocation checks one
+# small state file. When a sweep is due, a background thread examines at most
+# SWEEP_BATCH entries and records where it stopped; the next invocation picks
+# up from there until a full pass is done.
+
+SWEEP_STATE_FILE = os.path.join(CACHE_DIR, ".sweep_state.json")
+SWEEP_INTERVAL = 24 * 3600  # seconds between full passes
+SWEEP_BATCH = 200  # entries examined per invocation
+CACHE_MAX_AGE_DAYS = 7
+
+# Long-lived stores that manage their own contents
+_SWEEP_SKIP_SUFFIXES = (".db", ".sqlite", ".sqlite3", "-wal", "-shm", "-journal")
+
+
+def _load_sweep_state():
+    try:
+        with open(SWEEP_STATE_FILE, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        return {"last_sweep": float(state.get("last_sweep", 0)),
+                "position": int(state.get("position", 0))}
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {"last_sweep": 0.0, "position": 0}
+
+
+def _save_sweep_state(state):
+    try:
+        ensure_cache_dir()
+        tmp_path = f"{SWEEP_STATE_FILE}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, SWEEP_STATE_FILE)
+    except OSError:
+        pass
+
+
+def _iter_cache_entries(days):
+    """Yield (path, max_age_seconds) for every sweepable cache file."""
+    # Responses are refreshed on every hit, so an entry untouched for longer
+    # than the longest TTL is certainly expired
+    response_max_age = max(list(RESPONSE_TTLS.values()) + [DEFAULT_RESPONSE_TTL])
+
+    for directory, max_age in ((CACHE_DIR, days * 24 * 3600),
+                               (RESPONSE_CACHE_DIR, response_max_age)):
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith(".") or name.endswith(_SWEEP_SKIP_SUFFIXES):
+                        continue
+                    yield entry, max_age
+        except OSError:
+            continue
+
+
+def sweep_cache(days=CACHE_MAX_AGE_DAYS, start=0, limit=None):
+    """
+    Remove expired cache files, examining at most `limit` entries.
+
+    Args:
+        days: Age in days after which top-level cache files are removed
+        start: Number of entries to skip (where the previous sweep stopped)
+        limit: Maximum entries to examine (None = all)
+
+    Returns:
+        Tuple of (entries_examined, files_removed, bytes_freed, finished)
+    """
+    now = time.time()
+    examined = removed = freed = 0
+    position = 0
+
+    for entry, max_age in _iter_cache_entries(days):
+        if position < start:
+            position += 1
+            continue
+        if limit is not None and examined >= limit:
+            return examined, removed, freed, False
+        position += 1
+        examined += 1
+
+        try:
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            st = entry.stat()
+            if now - st.st_mtime > max_age:
+                os.remove(entry.path)
+                removed += 1
+                freed += st.st_size
+        except OSError:
+            continue
+
+    return examined, removed, freed, True
+
+
+def _sweep_step(days, batch):
+    state = _load_sweep_state()
+    examined, removed, _, finished = sweep_cache(days, start=state["position"], limit=batch)
+    if finished:
+        state = {"last_sweep": time.time(), "position": 0}
+    else:
+        # Removed files drop out of the listing, so only survivors are skipped next time
+        state["position"] += examined - removed
+    _save_sweep_state(state)
+
+
+def schedule_cache_sweep(days=CACHE_MAX_AGE_DAYS, batch=SWEEP_BATCH):
+    """
+    Run a bounded cache sweep in the background if one is due.
+
+    Costs one small file read when nothing is due. The sweep runs in a
+    daemon thread, so it never delays the command itself; if the process
+    exits first, the next invocation simply continues the pass.
+
+    Returns:
+        The sweep thread, or None if no sweep was due
+    """
+    state = _load_sweep_state()
+    if state["position"] == 0 and time.time() - state["last_sweep"] < SWEEP_INTERVAL:
+        return None
+
+    worker = threading.Thread(target=_sweep_step, args=(days, batch), daemon=True)
+    worker.start()
+    return worker
+
+
+def gc_cache(days=CACHE_MAX_AGE_DAYS, max_bytes=MAX_RESPONSE_CACHE_BYTES):
+    """
+    Full cache garbage collection (`lixplore cache gc`).
+
+    Removes expired files, trims the response cache to its size cap and
+    resets the incremental sweep state.
+
+    Returns:
+        Tuple of (files_removed, bytes_freed)
+    """
+    _, removed, freed, _ = sweep_cache(days)
+    evict_responses(max_bytes)
+    _save_sweep_state({"last_sweep": time.time(), "position": 0})
+    return removed, freed
+
+
+# ===== Source response cache =====
+
+def normalize_query(query):
+    """Collapse whitespace so trivially different spellings share a cache entry.
+
+    Case is preserved because Boolean operators (AND/OR/NOT) are case-sensitive
+    for some sources.
+    """
+    return " ".join((query or "").split())
+
+
+def response_cache_key(source, query, max_results, filters=None):
+    """
+    Build the content address of a source response.
+
+    Args:
+        source: Source name ('pubmed', 'custom:springer', ...)
+        query: Search query string
+        max_results: Maximum number of results requested
+        filters: Optional dict of extra search parameters
+
+    Returns:
+        Hex digest identifying the request
+    """
+    payload = json.dumps({
+        "source": source,
+        "query": normalize_query(query),
+        "max_results": max_results,
+        "filters": filters or {},
+    }, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _response_path(key):
+    return os.path.join(RESPONSE_CACHE_DIR, f"{key}.json")
+
+
+_size_lock = threading.Lock()
+
+
+def _read_response_size():
+    """Recorded response cache size in bytes, or None if unknown."""
+    try:
+        with open(RESPONSE_SIZE_FILE, "r", encoding="utf-8") as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_response_size(total):
+    try:
+        tmp_path = f"{RESPONSE_SIZE_FILE}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(str(max(0, total)))
+        os.replace(tmp_path, RESPONSE_SIZE_FILE)
+    except OSError:
+        pass
+
+
+def get_cached_response(source, query, max_results, filters=None):
+    """
+    Return cached results for a source query, or None on a miss.
+
+    Expired entries are removed. A hit refreshes the entry's mtime, which is
+    what the LRU eviction in store_response() orders by.
+    """
+    path = _response_path(response_cache_key(source, query, max_results, filters))
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    ttl = RESPONSE_TTLS.get(source, DEFAULT_RESPONSE_TTL)
+    if time.time() - entry.get("created_at", 0) > ttl:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+
+    try:
+        os.utime(path, None)
+    except OSError:
+        pass
+
+    return entry.get("results", [])
+
+
+def store_response(source, query, max_results, results, filters=None):
+    """
+    Save results for a source query and enforce the cache size cap.
+
+    Args:
+        source: Source name
+        query: Search query string
+        max_results: Maximum number of results requested
+        results: List of article dictionaries
+        filters: Optional dict of extra search parameters
+    """
+    key = response_cache_key(source, query, max_results, filters)
+    entry = {
+        "source": source,
+        "query": normalize_query(query),
+        "max_results": max_results,
+        "filters": filters or {},
+        "created_at": time.time(),
+        "results": results,
+    }
+
+    try:
+        os.makedirs(RESPONSE_CACHE_DIR, exist_ok=True)
+        path = _response_path(key)
+        try:
+            replaced = os.path.getsize(path)
+        except OSError:
+            replaced = 0
+        # Write to a temp file first so concurrent readers never see a partial entry
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        added = os.path.getsize(tmp_path) - replaced
+        os.replace(tmp_path, path)
+    except OSError:
+        # Caching is best-effort
+        return
+
+    # Only scan the directory when the running total says the cap may be exceeded
+    with _size_lock:
+        total = _read_response_size()
+        if total is not None and total + added <= MAX_RESPONSE_CACHE_BYTES:
+            _write_response_size(total + added)
+            return
+    evict_responses()
+
+
+def evict_responses(max_bytes=MAX_RESPONSE_CACHE_BYTES):
+    """
+    Delete least recently used responses until the cache fits in max_bytes.
+
+    Scans the whole response directory and records the exact size.
+    """
+    with _size_lock:
+        _write_response_size(_evict_responses(max_bytes))
+
+
+def _evict_responses(max_bytes):
+    entries = []
+    total = 0
+
+    try:
+        with os.scandir(RESPONSE_CACHE_DIR) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+    except OSError:
+        return 0
+
+    if total <= max_bytes:
+        return total
+
+    entries.sort()
+    for _, size, path in entries:
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        if total <= max_bytes:
+            break
+    return total
 
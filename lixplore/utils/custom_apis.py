@@ -9,6 +9,7 @@ Supports Springer, BASE, and any other API with minimal setup.
 import json
 import os
 import requests
+from lixplore.utils import http_session
 from typing import List, Dict, Optional
 
 # Directory for custom API configurations
@@ -223,7 +224,7 @@ def call_custom_api(api_name: str, query: str, limit: int = 10) -> List[Dict]:
 
     # Make request
     try:
-        response = requests.get(base_url, params=params, timeout=30)
+        response = http_session.get(base_url, params=params, timeout=30)
         response.raise_for_status()
 
         # Parse response
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+
+"""
+Indexed duplicate detection for Lixplore.
+
+Pairwise deduplication compares every new article with every article kept so
+far, running difflib's SequenceMatcher on each pair and re-normalizing both
+articles every time. Here each article is normalized once into a Fingerprint,
+and DedupIndex keeps hash indexes over the kept fingerprints (DOI, exact
+title, author keys, title length) so only the pairs that can possibly match
+reach the expensive comparison.
+
+Candidate generation never drops a pair that the pairwise strategies would
+accept: it only uses exact lookups and upper bounds on the SequenceMatcher
+ratio (title length and character counts, the same bounds difflib uses for
+real_quick_ratio() and quick_ratio()). The final decision is made by
+fingerprints_match(), which applies the same rules as the dispatcher
+strategies, so results are identical.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Dict, List, Optional, Set
+
+# Guards the ratio bounds against float rounding (e.g. 0.85 - 0.15)
+_EPSILON = 1e-9
+
+# Titles and author names repeat across sources, so normalized forms are memoized
+_NORMALIZE_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def normalize_text(s) -> str:
+    """Normalize string for comparison (lowercase, collapse whitespace)."""
+    if not s:
+        return ""
+    return " ".join(s.lower().strip().split())
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def author_key(name) -> str:
+    """
+    Normalize author name for comparison.
+    Handles formats like: 'Smith J', 'J Smith', 'Smith, John', 'John Smith'
+    """
+    if not name:
+        return ""
+    name = name.replace(",", " ").replace(".", " ")
+    parts = [p.strip() for p in name.split() if p.strip()]
+    return " ".join(sorted([p.lower() for p in parts]))
+
+
+class Fingerprint:
+    """
+    Comparison record for one article, built once per deduplication run.
+
+    Attributes:
+        doi: Normalized DOI ('' if missing)
+        has_title: Whether the raw title is non-empty
+        title: Normalized title
+        length: Length of the normalized title
+        authors: Set of normalized author keys
+        author_count: Number of raw author entries
+        year: Publication year as given by the source
+    """
+
+    __slots__ = ("doi", "has_title", "title", "length", "_chars",
+                 "authors", "author_count", "year", "_matcher")
+
+    def __init__(self, article: Dict):
+        self.doi = normalize_text((article.get("doi") or "").strip())
+
+        title = article.get("title") or ""
+        self.has_title = bool(title)
+        self.title = normalize_text(title)
+        self.length = len(self.title)
+        self._chars = None
+
+        authors = article.get("authors") or []
+        self.author_count = len(authors)
+        keys = set(author_key(a) for a in authors)
+        keys.discard("")
+        self.authors = keys
+
+        self.year = article.get("year")
+        self._matcher = None
+
+    @property
+    def chars(self) -> Counter:
+        """Character counts of the normalized title (for ratio upper bounds)."""
+        if self._chars is None:
+            self._chars = Counter(self.title)
+        return self._chars
+
+    def ratio_to(self, other: "Fingerprint") -> float:
+        """
+        SequenceMatcher(None, other.title, self.title).ratio().
+
+        The matcher indexes self.title once and is reused for every article
+        compared against this one.
+        """
+        if self._matcher is None:
+            self._matcher = SequenceMatcher(None, "", self.title)
+        self._matcher.set_seq1(other.title)
+        return self._matcher.ratio()
+
+
+def fingerprint(article: Dict) -> Fingerprint:
+    """Build the comparison record for an article."""
+    return Fingerprint(article)
+
+
+def resolve_strategy(strategy: str, threshold: float):
+    """Map 'strict'/'loose' onto 'auto' with their fixed title thresholds."""
+    if strategy == "strict":
+        return "auto", 0.95
+    if strategy == "loose":
+        return "auto", 0.75
+    return strategy, threshold
+
+
+def fingerprints_match(new: Fingerprint, kept: Fingerprint,
+                       strategy: str = "auto", threshold: float = 0.85) -> bool:
+    """
+    Decide whether two articles are duplicates.
+
+    Args:
+        new, kept: Fingerprints of the articles to compare
+        strategy: 'auto', 'doi_only', 'title_only', 'strict', 'loose'
+        threshold: Similarity threshold for title matching
+
+    Returns:
+        True if articles are duplicates
+    """
+    strategy, threshold = resolve_strategy(strategy, threshold)
+
+    if strategy == "doi_only":
+        return bool(new.doi and kept.doi) and new.doi == kept.doi
+
+    if strategy == "title_only":
+        if not new.title or not kept.title:
+            return False
+        return kept.ratio_to(new) >= threshold
+
+    # 'auto' or default
+    # Level 1: both have DOIs - they decide alone
+    if new.doi and kept.doi:
+        return new.doi == kept.doi
+
+    # Level 2: title similarity, confirmed by authors when both have them
+    if new.title and kept.title and kept.ratio_to(new) >= threshold:
+        if new.author_count and kept.author_count:
+            return bool(new.authors & kept.authors)
+        return True
+
+    # Level 3: strong author overlap with a somewhat similar title
+    if new.author_count >= 2 and kept.author_count >= 2:
+        min_common = min(3, min(new.author_count, kept.author_count))
+        if new.authors and kept.authors and len(new.authors & kept.authors) >= min_common:
+            if new.has_title and kept.has_title:
+                if _title_ratio(new, kept) >= (threshold - 0.15):  # Slightly lower for author-confirmed
+                    return True
+
+    return False
+
+
+def _title_ratio(new: Fingerprint, kept: Fingerprint) -> float:
+    """Title ratio that, like SequenceMatcher, treats two empty titles as equal."""
+    if not new.title or not kept.title:
+        return 1.0 if new.title == kept.title else 0.0
+    return kept.ratio_to(new)
+
+
+def _ratio_upper_bound(a: Fingerprint, b: Fingerprint) -> float:
+    """Upper bound of SequenceMatcher(None, a.title, b.title).ratio()."""
+    total = a.length + b.length
+    if total == 0:
+        return 1.0
+    if not a.length or not b.length:
+        return 0.0
+    common = sum((a.chars & b.chars).values())
+    return 2.0 * common / total
+
+
+class DedupIndex:
+    """
+    Incremental index of unique articles for one deduplication strategy.
+
+    Usage:
+        index = DedupIndex('auto', 0.85)
+        for article in results:
+            idx = index.find(article)
+            if idx is None:
+                index.add(article)
+
+    Args:
+        strategy: 'auto', 'doi_only', 'title_only', 'strict' or 'loose'
+        threshold: Title similarity threshold (ignored by strict/loose, as in
+            dispatcher.is_duplicate_with_strategy)
+        keep_articles: Keep the article dicts in .articles. Streaming callers
+            pass False and only the fingerprints are retained.
+    """
+
+    def __init__(self, strategy: str = "auto", threshold: float = 0.85, keep_articles: bool = True):
+        strategy, threshold = resolve_strategy(strategy, threshold)
+        self.strategy = strategy
+
+        if strategy == "doi_only":
+            self.mode = "doi"
+        elif strategy == "title_only":
+            self.mode = "title"
+        else:
+            self.mode = "auto"
+
+        self.threshold = threshold
+        # Author-confirmed matches accept titles 0.15 below the threshold
+        self.author_threshold = threshold - 0.15
+        self.keep_articles = keep_articles
+
+        self.articles: List[Dict] = []
+        self._entries: List[Fingerprint] = []
+        self._by_doi: Dict[str, Set[int]] = {}
+        self._by_title: Dict[str, Set[int]] = {}
+        self._by_author: Dict[str, Set[int]] = {}
+        self._by_length: Dict[int, Set[int]] = {}
+        self._lengths: List[int] = []
+        self._no_doi: Set[int] = set()
+        self._no_authors: Set[int] = set()
+
+    def __len__(self):
+        return len(self.articles)
+
+    # ----- maintenance -----
+
+    def add(self, article: Dict) -> int:
+        """Append a unique article and return its position."""
+        idx = len(self.articles)
+        self.articles.append(article if self.keep_articles else None)
+        self._entries.append(None)
+        self._insert(idx, fingerprint(article))
+        return idx
+
+    def replace(self, idx: int, article: Dict):
+        """Swap the kept article at idx (e.g. for a more complete duplicate)."""
+        self._remove(idx)
+        self.articles[idx] = article if self.keep_articles else None
+        self._insert(idx, fingerprint(article))
+
+    def _insert(self, idx: int, entry: Fingerprint):
+        self._entries[idx] = entry
+
+        if entry.doi:
+            self._by_doi.setdefault(entry.doi, set()).add(idx)
+        else:
+            self._no_doi.add(idx)
+
+        self._by_title.setdefault(entry.title, set()).add(idx)
+
+        if entry.author_count:
+            for key in entry.authors:
+                self._by_author.setdefault(key, set()).add(idx)
+        else:
+            self._no_authors.add(idx)
+
+        bucket = self._by_length.get(entry.length)
+        if bucket is None:
+            bucket = self._by_length[entry.length] = set()
+            insort(self._lengths, entry.length)
+        bucket.add(idx)
+
+    def _remove(self, idx: int):
+        entry = self._entries[idx]
+
+        if entry.doi:
+            self._discard(self._by_doi, entry.doi, idx)
+        else:
+            self._no_doi.discard(idx)
+
+        self._discard(self._by_title, entry.title, idx)
+
+        if entry.author_count:
+            for key in entry.authors:
+                self._discard(self._by_author, key, idx)
+        else:
+            self._no_authors.discard(idx)
+
+        bucket = self._by_length[entry.length]
+        bucket.discard(idx)
+        if not bucket:
+            del self._by_length[entry.length]
+            del self._lengths[bisect_left(self._lengths, entry.length)]
+
+    @staticmethod
+    def _discard(mapping: Dict[str, Set[int]], key: str, idx: int):
+        bucket = mapping.get(key)
+        if bucket is not None:
+            bucket.discard(idx)
+            if not bucket:
+                del mapping[key]
+
+    # ----- lookup -----
+
+    def find(self, article: Dict) -> Optional[int]:
+        """
+        Return the position of the first kept article that article duplicates.
+
+        "First" means lowest position, which is what a pairwise scan over the
+        kept list would return.
+        """
+        if not self.articles:
+            return None
+
+        entry = fingerprint(article)
+        candidates = self._candidates(entry)
+
+        for idx in sorted(candidates):
+            if fingerprints_match(entry, self._entries[idx], self.strategy, self.threshold):
+                return idx
+        return None
+
+    def _candidates(self, entry: Fingerprint) -> Set[int]:
+        if self.mode == "doi":
+            if not entry.doi:
+                return set()
+            return set(self._by_doi.get(entry.doi, ()))
+
+        if self.mode == "title":
+            return self._title_candidates(entry, self.threshold)
+
+        # auto / strict / loose
+        candidates = set()
+        within = None
+
+        # Both have DOIs: decided by DOI equality alone, titles are never compared
+        if entry.doi:
+            candidates |= self._by_doi.get(entry.doi, set())
+            within = self._no_doi
+
+        if entry.author_count:
+            # A title match is trusted alone only when one side has no authors
+            trusted = self._no_authors if within is None else self._no_authors & within
+            candidates |= self._title_candidates(entry, self.threshold, trusted)
+
+            # Otherwise at least one shared author is required
+            shared = set()
+            for key in entry.authors:
+                shared |= self._by_author.get(key, set())
+            if within is not None:
+                shared &= within
+            candidates |= self._filter_by_ratio(entry, shared, self.author_threshold)
+        else:
+            candidates |= self._title_candidates(entry, self.threshold, within)
+
+        return candidates
+
+    def _title_candidates(self, entry: Fingerprint, threshold: float,
+                          within: Optional[Set[int]] = None) -> Set[int]:
+        """Kept articles whose title similarity to entry can reach threshold."""
+        if threshold - _EPSILON <= 0:
+            pool = set(range(len(self.articles)))
+            return pool & within if within is not None else pool
+
+        # An identical title is a guaranteed match, so nothing after it matters
+        limit = None
+        exact = self._by_title.get(entry.title)
+        if exact and entry.title and threshold <= 1:
+            usable = exact & within if within is not None else exact
+            if usable:
+                limit = min(usable)
+
+        # SequenceMatcher ratio <= 2 * min(la, lb) / (la + lb)
+        r = min(threshold - _EPSILON, 1.0)
+        lo = entry.length * r / (2.0 - r)
+        hi = entry.length * (2.0 - r) / r
+
+        if within is not None and len(within) < len(self.articles) // 4:
+            pool = set(i for i in within if lo <= self._entries[i].length <= hi)
+        else:
+            pool = set()
+            start = bisect_left(self._lengths, lo)
+            stop = bisect_right(self._lengths, hi)
+            for length in self._lengths[start:stop]:
+                pool |= self._by_length[length]
+            if within is not None:
+                pool &= within
+
+        if limit is not None:
+            pool = set(i for i in pool if i <= limit)
+
+        return self._filter_by_ratio(entry, pool, threshold)
+
+    def _filter_by_ratio(self, entry: Fingerprint, pool: Set[int], threshold: float) -> Set[int]:
+        if threshold - _EPSILON <= 0:
+            return pool
+        return set(
+            i for i in pool
+            if _ratio_upper_bound(entry, self._entries[i]) >= threshold - _EPSILON
+        )
@@ -178,7 +178,7 @@ and managing your research literature.[/dim]
         self.console.print(f"\n[cyan]Searching for: '{query}'...[/cyan]\n")
 
         try:
-            from lixplore import dispatcher
+            from lixplore.service import get_service
 
             # Determine which sources to search
             if source_flag == "A":
@@ -192,40 +192,14 @@ and managing your research literature.[/dim]
                 }
                 sources = [source_map[source_flag]]
 
-            # Search each source
-            all_results = []
-            for source in sources:
-                source_names = {
-                    "pubmed": "PubMed",
-                    "crossref": "Crossref",
-                    "doaj": "DOAJ",
-                    "europepmc": "EuropePMC",
-                    "arxiv": "arXiv"
-                }
-                self.console.print(f"  Searching {source_names[source]}...")
-
-                try:
-                    results = dispatcher.search(
-                        source=source,
-                        query=query,
-                        limit=max_results
-                    )
-                    if results:
-                        all_results.extend(results)
-                        self.console.print(f"    Found {len(results)} articles")
-                except Exception as e:
-                    self.console.print(f"    [yellow]Error: {e}[/yellow]")
-
-            # Deduplicate if searching multiple sources
-            if dedup and len(sources) > 1 and all_results:
-                self.console.print("\n  Removing duplicates...")
-                all_results = dispatcher.deduplicate_advanced(
-                    all_results,
-                    strategy="auto",
-                    title_threshold=0.85,
-                    keep_preference="first",
-                    merge_metadata=False
-                )
+            # Sources are searched concurrently; the shared service keeps
+            # connections and recent results warm between searches
+            all_results = get_service().search(
+                query,
+                sources=sources,
+                limit=max_results,
+                dedup="auto" if dedup and len(sources) > 1 else None
+            )
 
             if all_results:
                 self.current_results = all_results
@@ -4,46 +4,411 @@
 Metadata enrichment utilities for Lixplore - enrich articles using external APIs
 """
 
-import time
-import requests
-from typing import Dict, List
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from lixplore.utils import http_session, metadata_store
+from lixplore.utils.metadata import has_value, missing_metadata
+from lixplore.utils.ratelimit import get_limiter
+from typing import Dict, Iterable, Iterator, List, Optional
 
 
-# Rate limiting settings
-RATE_LIMIT_DELAY = 0.5  # seconds between API calls
+# Requests per second per upstream host, shared by all worker threads.
+# PubMed and arXiv lookups go through their source modules, which apply the
+# NCBI (3/s, 10/s with key) and arXiv (1 per 3s) limits themselves.
+API_RATES = {
+    'doi': 10,       # doi.org content negotiation / validation
+    'crossref': 10,  # api.crossref.org title search
+}
+
+# Lookups in flight at once per enrichment API
+API_CONCURRENCY = {
+    'crossref': 8,
+    'pubmed': 3,
+    'arxiv': 1,
+}
+
+# Worker threads enriching articles concurrently
+ENRICH_WORKERS = 8
+
+# Fields the enrichment APIs can fill
+ENRICHABLE_FIELDS = ['doi', 'abstract', 'journal', 'year', 'authors']
+
+# Fields each API can fill in
+API_FIELDS = {
+    'crossref': ['doi', 'abstract', 'journal', 'year', 'authors'],
+    'pubmed': ['doi', 'abstract', 'journal', 'year', 'authors'],
+    'arxiv': ['abstract', 'journal', 'year', 'authors'],
+}
+
+ALL_APIS = ['crossref', 'pubmed', 'arxiv']
+
+# DOIs per Crossref filter=doi:... query
+DOI_BATCH_SIZE = 50
+
+# How long resolved DOIs, and DOIs that failed to resolve, stay in the metadata store
+DOI_TTL = 30 * 24 * 3600
+NOT_FOUND_TTL = 7 * 24 * 3600
+
+# An API that already returned an article (in a search or an earlier
+# enrichment) is not asked about it again for this long
+LOOKUP_TTL = 30 * 24 * 3600
+
+# Crossref work fields needed for enrichment
+CROSSREF_SELECT = 'DOI,title,author,container-title,published-print,published-online,issued,abstract'
+
+_api_slots = {api: threading.BoundedSemaphore(n) for api, n in API_CONCURRENCY.items()}
+
+
+def _limit(api: str):
+    """Wait for a request token for an upstream API."""
+    get_limiter(api, API_RATES[api]).acquire()
+
+
+def missing_fields(article: Dict) -> List[str]:
+    """Return the enrichable fields an article lacks."""
+    return missing_metadata(article, ENRICHABLE_FIELDS)
+
+
+def _expand_apis(apis: List[str] = None) -> List[str]:
+    if not apis or 'all' in apis:
+        return list(ALL_APIS)
+    return [api for api in apis if api in API_FIELDS]
+
+
+def needs_lookup(article: Dict, api: str, record: Optional[Dict] = None) -> bool:
+    """
+    Decide whether an API lookup can fill a gap in an article.
+
+    A lookup is skipped when the article already has every field the API
+    provides, when the article came from that API (a title search would
+    return the same record), when the metadata store shows the API was
+    asked about it recently, or when there is nothing to search by.
+
+    Args:
+        article: Article dictionary
+        api: 'crossref', 'pubmed' or 'arxiv'
+        record: The article's record in the metadata store, if any
+
+    Returns:
+        True if the lookup is worth a request
+    """
+    if article.get('source') == api:
+        return False
+    if metadata_store.fetched_within(record, api, LOOKUP_TTL):
+        return False
+    if not missing_metadata(article, API_FIELDS[api]):
+        return False
+    if api == 'crossref':
+        return has_value(article.get('doi')) or has_value(article.get('title'))
+    return has_value(article.get('title'))
+
+
+def lookup_cost(article: Dict, api: str) -> int:
+    """
+    Number of HTTP requests one lookup makes on its own.
+
+    Crossref lookups by DOI are batched up front (see fetch_doi_metadata)
+    and cost nothing here; a title search returns the full record. PubMed
+    needs an esearch and an efetch.
+    """
+    if api == 'crossref':
+        return 0 if has_value(article.get('doi')) else 1
+    if api == 'pubmed':
+        return 2
+    return 1
+
+
+def plan_enrichment(results: List[Dict], apis: List[str] = None,
+                    records: List[Optional[Dict]] = None) -> List[List[str]]:
+    """
+    Choose the lookups to run for each article.
+
+    Args:
+        results: List of article dictionaries
+        apis: APIs to use ('crossref', 'pubmed', 'arxiv', 'all')
+        records: Metadata store records, one per article (see _with_stored)
+
+    Returns:
+        One list of API names per article, in the order they will run
+    """
+    apis = _expand_apis(apis)
+    records = records or [None] * len(results)
+    return [[api for api in apis if needs_lookup(article, api, record)]
+            for article, record in zip(results, records)]
+
+
+def _with_stored(results: List[Dict]):
+    """
+    Fill articles from their metadata store records.
+
+    Returns:
+        Tuple of (filled articles, records)
+    """
+    records = [metadata_store.find_article(article) for article in results]
+    filled = [metadata_store.fill_from_record(article, record)
+              for article, record in zip(results, records)]
+    return filled, records
+
+
+def _remember(articles: List[Dict], plan: List[List[str]]):
+    """Save enriched articles, recording which APIs were asked."""
+    groups = {}
+    for article, steps in zip(articles, plan):
+        groups.setdefault(tuple(steps), []).append(article)
+    for steps, group in groups.items():
+        metadata_store.save_articles(group, list(steps))
+
+
+def _planned_dois(results: List[Dict], plan: List[List[str]]) -> List[str]:
+    """DOIs the plan resolves through Crossref."""
+    return [article['doi'] for article, steps in zip(results, plan)
+            if 'crossref' in steps and has_value(article.get('doi'))]
+
+
+def _doi_batches(dois: List[str]) -> int:
+    """Crossref batch requests needed for DOIs not yet in the metadata store."""
+    keys = {_doi_key(doi) for doi in dois}
+    cached = metadata_store.get_many(keys, max_age=DOI_TTL)
+    return -(-len(keys - cached.keys()) // DOI_BATCH_SIZE)
+
+
+def planned_requests(results: List[Dict], plan: List[List[str]]) -> int:
+    """
+    Estimate the HTTP requests a plan makes.
+
+    DOIs Crossref does not know cost one extra doi.org request each, which
+    cannot be known in advance.
+    """
+    return (_doi_batches(_planned_dois(results, plan)) +
+            sum(lookup_cost(article, api) for article, steps in zip(results, plan) for api in steps))
+
+
+def print_enrichment_plan(results: List[Dict], apis: List[str] = None):
+    """
+    Print what enrichment would do without sending any requests (--enrich-dry-run).
+
+    Args:
+        results: List of article dictionaries
+        apis: APIs to use ('crossref', 'pubmed', 'arxiv', 'all')
+    """
+    apis = _expand_apis(apis)
+    filled, records = _with_stored(results)
+    plan = plan_enrichment(filled, apis, records)
+
+    print(f"Enrichment plan for {len(results)} article(s) using: {', '.join(apis)}")
+    stored = sum(1 for article, before in zip(filled, results) if article != before)
+    if stored:
+        print(f"  - metadata store: fills gaps in {stored} article(s) without any request")
+    results = filled
+    for api in apis:
+        planned = [article for article, steps in zip(results, plan) if api in steps]
+        requests_needed = sum(lookup_cost(article, api) for article in planned)
+        if api == 'crossref':
+            requests_needed += _doi_batches(_planned_dois(results, plan))
+        print(f"  - {api}: {len(planned)} lookup(s), about {requests_needed} request(s), "
+              f"{len(results) - len(planned)} skipped")
+
+    complete = sum(1 for steps in plan if not steps)
+    print(f"  Articles needing no lookups: {complete}")
+    print(f"  Total: about {planned_requests(results, plan)} request(s)")
+    print("Dry run: no requests were sent")
+
+
+normalize_doi = metadata_store.normalize_doi
+
+
+def _doi_key(doi: str) -> str:
+    # DOIs are case-insensitive
+    return f"doi:{normalize_doi(doi).lower()}"
+
+
+def _date_year(data: Dict) -> str:
+    for field in ('published-print', 'published-online', 'issued', 'published'):
+        parts = (data.get(field) or {}).get('date-parts') or [[None]]
+        if parts[0] and parts[0][0]:
+            return str(parts[0][0])
+    return ''
+
+
+def _first(value) -> str:
+    if isinstance(value, list):
+        return value[0] if value else ''
+    return value or ''
+
+
+def _work_metadata(data: Dict, doi: str = '') -> Dict:
+    """Convert a Crossref work or CSL JSON record to enrichment metadata."""
+    return {
+        'title': _first(data.get('title', '')),
+        'authors': [f"{a.get('given', '')} {a.get('family', '')}".strip()
+                   for a in data.get('author', [])],
+        'journal': _first(data.get('container-title', '')),
+        'year': _date_year(data),
+        'doi': data.get('DOI') or doi,
+        'abstract': data.get('abstract', '')
+    }
+
+
+def _fetch_crossref_batch(dois: List[str]) -> Dict[str, Dict]:
+    """
+    Look up a batch of DOIs with a single Crossref filter query.
+
+    Returns:
+        Dictionary of store key -> metadata for the DOIs Crossref knows
+    """
+    params = {
+        'filter': ','.join(f'doi:{doi}' for doi in dois),
+        'rows': len(dois),
+        'select': CROSSREF_SELECT
+    }
+    _limit('crossref')
+    response = http_session.get('https://api.crossref.org/works', params=params, timeout=20)
+    response.raise_for_status()
+
+    found = {}
+    for item in response.json().get('message', {}).get('items', []):
+        if item.get('DOI'):
+            found[_doi_key(item['DOI'])] = _work_metadata(item)
+    return found
+
+
+def _fetch_doi_org(doi: str):
+    """
+    Resolve one DOI via doi.org content negotiation (DataCite, mEDRA, ...).
+
+    Returns:
+        Metadata dictionary, None if the DOI does not exist, or raises on
+        network errors so the miss is not recorded
+    """
+    headers = {'Accept': 'application/vnd.citationstyles.csl+json'}
+    _limit('doi')
+    response = http_session.get(f'https://doi.org/{doi}', headers=headers, timeout=10,
+                                allow_redirects=True)
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    return _work_metadata(response.json(), doi)
+
+
+def fetch_doi_metadata(dois: Iterable[str]) -> Dict[str, Dict]:
+    """
+    Resolve many DOIs with as few requests as possible.
+
+    DOIs already in the metadata store cost nothing. The rest are looked up
+    in Crossref DOI_BATCH_SIZE at a time; DOIs Crossref does not know (e.g.
+    DataCite DOIs) fall back to one doi.org request each. Results, including
+    DOIs that do not resolve, are saved to the store.
+
+    Args:
+        dois: DOI strings (prefixes such as https://doi.org/ are accepted)
+
+    Returns:
+        Dictionary of lower-cased DOI -> metadata dictionary, or None if the
+        DOI does not resolve. DOIs that could not be looked up because of a
+        network error are left out.
+    """
+    wanted = {}
+    for doi in dois:
+        doi = normalize_doi(doi)
+        if doi.startswith('10.'):
+            wanted.setdefault(_doi_key(doi), doi)
+    if not wanted:
+        return {}
+
+    cached = metadata_store.get_many(wanted, max_age=DOI_TTL)
+    # Negative entries expire sooner, in case the DOI was registered since
+    misses = metadata_store.get_many([key for key, value in cached.items() if value is None],
+                                     max_age=NOT_FOUND_TTL)
+    found = {key: value for key, value in cached.items() if value is not None or key in misses}
+
+    todo = [doi for key, doi in wanted.items() if key not in found]
+    # Commas separate Crossref filters, so such DOIs can only go to doi.org
+    batchable = [doi for doi in todo if ',' not in doi]
+    batches = [batchable[i:i + DOI_BATCH_SIZE] for i in range(0, len(batchable), DOI_BATCH_SIZE)]
+
+    fetched = {}
+    failed = set()
+    with ThreadPoolExecutor(max_workers=API_CONCURRENCY['crossref']) as executor:
+        futures = {executor.submit(_fetch_crossref_batch, batch): batch for batch in batches}
+        for future in as_completed(futures):
+            try:
+                fetched.update(future.result())
+            except Exception as e:
+                print(f"[Crossref Error] DOI batch lookup failed: {e}")
+                failed.update(_doi_key(doi) for doi in futures[future])
+
+    fallback = [doi for doi in todo if _doi_key(doi) not in fetched and _doi_key(doi) not in failed]
+    with ThreadPoolExecutor(max_workers=API_CONCURRENCY['crossref']) as executor:
+        futures = {executor.submit(_fetch_doi_org, doi): doi for doi in fallback}
+        for future in as_completed(futures):
+            try:
+                fetched[_doi_key(futures[future])] = future.result()
+            except Exception:
+                pass
+
+    metadata_store.put_many(fetched)
+    found.update(fetched)
+    return {key[len('doi:'):]: value for key, value in found.items()}
 
 
 def validate_doi(doi: str) -> bool:
     """
     Validate DOI format and check if it resolves.
 
+    Known DOIs are answered from the metadata store. Otherwise doi.org is
+    asked without following the redirect to the publisher site.
+
     Args:
         doi: DOI string
 
     Returns:
         True if valid and resolvable
     """
-    if not doi:
-        return False
-
-    # Clean DOI (remove https://doi.org/ prefix if present)
-    doi = doi.replace('https://doi.org/', '').replace('http://doi.org/', '')
+    doi = normalize_doi(doi)
 
     # Basic format validation (10.xxxx/yyyy pattern)
     if not doi.startswith('10.'):
         return False
 
-    # Try to resolve DOI
+    if metadata_store.get(_doi_key(doi), max_age=DOI_TTL):
+        return True
+
+    # doi.org answers a registered DOI with a redirect and an unknown one with 404
     try:
-        response = requests.head(f'https://doi.org/{doi}', timeout=5, allow_redirects=True)
-        return response.status_code == 200
+        _limit('doi')
+        response = http_session.head(f'https://doi.org/{doi}', timeout=5, allow_redirects=False)
+        return response.status_code in (200, 301, 302, 303, 307, 308)
     except:
         return False
 
 
+def validate_dois(dois: Iterable[str]) -> Dict[str, bool]:
+    """
+    Validate many DOIs using batched lookups.
+
+    Args:
+        dois: DOI strings
+
+    Returns:
+        Dictionary of DOI (as given) -> True if it resolves. DOIs whose
+        lookup failed on a network error are checked one by one.
+    """
+    dois = list(dois)
+    metadata = fetch_doi_metadata(dois)
+    valid = {}
+    for doi in dois:
+        key = normalize_doi(doi).lower()
+        if key in metadata:
+            valid[doi] = metadata[key] is not None
+        else:
+            valid[doi] = validate_doi(doi)
+    return valid
+
+
 def resolve_doi(doi: str) -> Dict:
     """
-    Resolve DOI to full metadata using doi.org API.
+    Resolve DOI to full metadata (metadata store, then Crossref, then doi.org).
 
     Args:
         doi: DOI string
@@ -54,31 +419,7 @@ def resolve_doi(doi: str) -> Dict:
     if not doi:
         return None
 
-    # Clean DOI
-    doi = doi.replace('https://doi.org/', '').replace('http://doi.org/', '')
-
-    try:
-        # Use content negotiation to get JSON metadata
-        headers = {'Accept': 'application/vnd.citationstyles.csl+json'}
-        response = requests.get(f'https://doi.org/{doi}', headers=headers, timeout=10)
-
-        if response.status_code == 200:
-            data = response.json()
-            # Extract relevant fields
-            return {
-                'title': data.get('title', ''),
-                'authors': [f"{a.get('given', '')} {a.get('family', '')}".strip()
-                           for a in data.get('author', [])],
-                'journal': data.get('container-title', ''),
-                'year': str(data.get('published-print', {}).get('date-parts', [['']])[0][0] or
-                          data.get('published-online', {}).get('date-parts', [['']])[0][0] or ''),
-                'doi': doi,
-                'abstract': data.get('abstract', '')
-            }
-    except:
-        pass
-
-    return None
+    return fetch_doi_metadata([doi]).get(normalize_doi(doi).lower())
 
 
 def find_missing_doi(article: Dict) -> str:
@@ -86,6 +427,9 @@ def find_missing_doi(article: Dict) -> str:
     Attempt to find DOI for article without one.
     Uses title + authors to search CrossRef.
 
+    The matching Crossref record is saved to the metadata store, so
+    resolving the DOI afterwards needs no further request.
+
     Args:
         article: Article dictionary
 
@@ -100,9 +444,11 @@ def find_missing_doi(article: Dict) -> str:
         # Search CrossRef by title
         params = {
             'query.title': title,
-            'rows': 1
+            'rows': 1,
+            'select': CROSSREF_SELECT
         }
-        response = requests.get('https://api.crossref.org/works', params=params, timeout=10)
+        _limit('crossref')
+        response = http_session.get('https://api.crossref.org/works', params=params, timeout=10)
 
         if response.status_code == 200:
             data = response.json()
@@ -110,8 +456,10 @@ def find_missing_doi(article: Dict) -> str:
             if items:
                 # Check if title matches closely
                 found_title = ' '.join(items[0].get('title', []))
-                if found_title.lower().strip() == title.lower().strip():
-                    return items[0].get('DOI', '')
+                if found_title.lower().strip() == title.lower().strip() and items[0].get('DOI'):
+                    doi = items[0]['DOI']
+                    metadata_store.put(_doi_key(doi), _work_metadata(items[0]))
+                    return doi
     except:
         pass
 
@@ -224,6 +572,14 @@ def enrich_from_arxiv(article: Dict) -> Dict:
     return enriched
 
 
+# Enrichment API name -> enrich function
+_ENRICHERS = {
+    'crossref': enrich_from_crossref,
+    'pubmed': enrich_from_pubmed,
+    'arxiv': enrich_from_arxiv,
+}
+
+
 def enrich_article(article: Dict, apis: List[str] = None) -> Dict:
     """
     Enrich single article using specified APIs.
@@ -235,22 +591,15 @@ def enrich_article(article: Dict, apis: List[str] = None) -> Dict:
     Returns:
         Enriched article dictionary
     """
-    if not apis or 'all' in apis:
-        apis = ['crossref', 'pubmed', 'arxiv']
-
     enriched = article.copy()
 
-    # Try each API in order
-    for api in apis:
-        if api == 'crossref':
-            enriched = enrich_from_crossref(enriched)
-        elif api == 'pubmed':
-            enriched = enrich_from_pubmed(enriched)
-        elif api == 'arxiv':
-            enriched = enrich_from_arxiv(enriched)
-
-        # Rate limiting
-        time.sleep(RATE_LIMIT_DELAY)
+    # Try each API in order, skipping those that can no longer fill a gap;
+    # rate limits are applied per request by the limiters
+    for api in _expand_apis(apis):
+        if not needs_lookup(enriched, api):
+            continue
+        with _api_slots[api]:
+            enriched = _ENRICHERS[api](enriched)
 
     return enriched
 
@@ -273,16 +622,37 @@ def enrich_results(results: List[Dict], apis: List[str] = None, show_progress: b
     if not apis:
         apis = ['all']
 
+    results, records = _with_stored(results)
+    plan = plan_enrichment(results, apis, records)
+    todo = [i for i, steps in enumerate(plan) if steps]
+
     if show_progress:
         print(f"Enriching {len(results)} article(s) using: {', '.join(apis)}")
+        print(f"  Planned: {sum(len(steps) for steps in plan)} lookup(s), "
+              f"about {planned_requests(results, plan)} request(s); "
+              f"{len(results) - len(todo)} article(s) need none")
+
+    # Resolve all known DOIs in a few batched requests before the per-article work
+    fetch_doi_metadata(_planned_dois(results, plan))
+
+    # Articles needing the most requests take longest, so start them first
+    costs = {i: sum(lookup_cost(results[i], api) for api in plan[i]) for i in todo}
+    order = sorted(todo, key=lambda i: (-costs[i], -len(missing_fields(results[i]))))
+
+    enriched_results = list(results)
+    with ThreadPoolExecutor(max_workers=ENRICH_WORKERS) as executor:
+        futures = {executor.submit(enrich_article, results[i], plan[i]): i for i in order}
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            try:
+                enriched_results[i] = future.result()
+            except Exception as e:
+                print(f"  [Enrichment Error] article #{i + 1}: {e}")
 
-    enriched_results = []
-    for i, article in enumerate(results, 1):
-        if show_progress and i % 5 == 0:
-            print(f"  Progress: {i}/{len(results)} articles enriched...")
+            if show_progress and done % 5 == 0:
+                print(f"  Progress: {done}/{len(todo)} articles enriched...")
 
-        enriched = enrich_article(article, apis)
-        enriched_results.append(enriched)
+    _remember([enriched_results[i] for i in todo], [plan[i] for i in todo])
 
     if show_progress:
         print(f"Enrichment complete: {len(enriched_results)} articles")
@@ -290,6 +660,58 @@ def enrich_results(results: List[Dict], apis: List[str] = None, show_progress: b
     return enriched_results
 
 
+def enrich_stream(articles: Iterable[Dict], apis: List[str] = None) -> Iterator[Dict]:
+    """
+    Enrich articles one at a time, for the streaming pipeline.
+
+    Args:
+        articles: Iterable of article dictionaries
+        apis: APIs to use for enrichment (default: all available)
+
+    Yields:
+        Enriched articles, in input order
+    """
+    if not apis:
+        apis = ['all']
+
+    # Work through chunks of DOI_BATCH_SIZE articles: resolve a chunk's DOIs
+    # in one batched request, then enrich it while the previous chunk drains
+    pending = deque()
+    chunk = []
+    with ThreadPoolExecutor(max_workers=ENRICH_WORKERS) as executor:
+        def _submit(chunk):
+            chunk, records = _with_stored(chunk)
+            plan = plan_enrichment(chunk, apis, records)
+            fetch_doi_metadata(_planned_dois(chunk, plan))
+            for article, steps in zip(chunk, plan):
+                pending.append((article, steps, executor.submit(enrich_article, article, steps) if steps else None))
+
+        for article in articles:
+            chunk.append(article)
+            if len(chunk) >= DOI_BATCH_SIZE:
+                _submit(chunk)
+                chunk = []
+                while len(pending) > DOI_BATCH_SIZE:
+                    yield _stream_result(*pending.popleft())
+
+        if chunk:
+            _submit(chunk)
+        while pending:
+            yield _stream_result(*pending.popleft())
+
+
+def _stream_result(article: Dict, steps: List[str], future) -> Dict:
+    if future is None:
+        return article
+    try:
+        enriched = future.result()
+    except Exception as e:
+        print(f"  [Enrichment Error] {e}")
+        return article
+    _remember([enriched], [steps])
+    return enriched
+
+
 def resolve_all_dois(results: List[Dict]) -> List[Dict]:
     """
     Validate existing DOIs and find missing ones.
@@ -302,35 +724,21 @@ def resolve_all_dois(results: List[Dict]) -> List[Dict]:
     """
     print(f"Resolving DOIs for {len(results)} article(s)...")
 
-    resolved_results = []
-    found_count = 0
-    validated_count = 0
+    resolved_results = [article.copy() for article in results]
 
-    for i, article in enumerate(results, 1):
-        result = article.copy()
-        doi = article.get('doi', '').strip()
+    # Existing DOIs are checked in batches; missing ones need a title search each
+    existing = [result['doi'] for result in resolved_results if has_value(result.get('doi'))]
+    valid = validate_dois(existing)
+    validated_count = sum(1 for doi in existing if valid.get(doi))
 
-        if doi:
-            # Validate existing DOI
-            if validate_doi(doi):
-                validated_count += 1
-            else:
-                # Try to resolve anyway
-                metadata = resolve_doi(doi)
-                if metadata:
-                    validated_count += 1
-        else:
-            # Try to find missing DOI
-            doi = find_missing_doi(article)
+    missing = [result for result in resolved_results if not has_value(result.get('doi'))]
+    found_count = 0
+    with ThreadPoolExecutor(max_workers=API_CONCURRENCY['crossref']) as executor:
+        for result, doi in zip(missing, executor.map(find_missing_doi, missing)):
             if doi:
                 result['doi'] = doi
                 found_count += 1
 
-        resolved_results.append(result)
-
-        # Rate limiting
-        time.sleep(RATE_LIMIT_DELAY)
-
     print(f"DOI resolution complete:")
     print(f"  - Validated: {validated_count} existing DOIs")
     print(f"  - Found: {found_count} missing DOIs")
@@ -13,22 +13,45 @@ from typing import List, Dict
 import xml.etree.ElementTree as ET
 from xml.dom import minidom
 
-try:
-    from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment
-    XLSX_AVAILABLE = True
-except ImportError:
-    XLSX_AVAILABLE = False
+
+def _load_openpyxl():
+    """Import openpyxl on first XLSX export; returns None if it isn't installed."""
+    try:
+        import openpyxl
+        import openpyxl.styles
+    except ImportError:
+        return None
+    return openpyxl
 
 
 # Default export directory within the project
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 DEFAULT_EXPORT_DIR = os.path.join(PROJECT_ROOT, "exports")
 
+# Article fields that can be exported (also the CSV column order)
+AVAILABLE_FIELDS = ['title', 'authors', 'abstract', 'journal', 'year', 'doi', 'url', 'source']
+
+# File extension per export format
+EXPORT_EXTENSIONS = {
+    'csv': 'csv',
+    'json': 'json',
+    'jsonl': 'jsonl',
+    'bibtex': 'bib',
+    'ris': 'ris',
+    'endnote': 'xml',
+    'enw': 'enw',
+    'xlsx': 'xlsx',
+    'xml': 'xml'
+}
+
+# Formats that can be written one article at a time (see StreamExporter)
+STREAM_FORMATS = ['csv', 'jsonl', 'ris', 'bibtex', 'enw']
+
 # Define all export format folders (one folder per format type)
 EXPORT_FOLDERS = {
     'csv': 'csv',
     'json': 'json',
+    'jsonl': 'jsonl',                 # JSON Lines (one article per line)
     'bibtex': 'bibtex',
     'ris': 'ris',
     'endnote': 'endnote_xml',        # EndNote XML format
@@ -67,6 +90,7 @@ def initialize_export_folders():
             f.write("- **endnote_xml/** - EndNote XML format (.xml) - EndNote XML import\n")
             f.write("- **excel/** - Microsoft Excel format (.xlsx)\n")
             f.write("- **json/** - JSON format (.json) - structured data\n")
+            f.write("- **jsonl/** - JSON Lines format (.jsonl) - one article per line\n")
             f.write("- **ris/** - RIS format (.ris) - reference managers (Zotero, Mendeley)\n")
             f.write("- **xml/** - Generic XML format (.xml)\n\n")
             f.write("## Usage:\n\n")
@@ -140,19 +164,8 @@ def filter_fields(results: List[Dict], fields: List[str] = None) -> List[Dict]:
     if not fields:
         return results
 
-    # Available fields in articles
-    available_fields = ['title', 'authors', 'abstract', 'journal', 'year', 'doi', 'url', 'source']
-
-    # Validate field names
-    invalid_fields = [f for f in fields if f not in available_fields]
-    if invalid_fields:
-        print(f"Warning: Invalid field names ignored: {', '.join(invalid_fields)}")
-
-    # Filter to valid fields only
-    valid_fields = [f for f in fields if f in available_fields]
-
+    valid_fields = _valid_fields(fields)
     if not valid_fields:
-        print("Warning: No valid fields specified, keeping all fields")
         return results
 
     # Filter each result
@@ -164,6 +177,154 @@ def filter_fields(results: List[Dict], fields: List[str] = None) -> List[Dict]:
     return filtered_results
 
 
+def _valid_fields(fields: List[str]) -> List[str]:
+    """Return the known field names from fields, warning about the rest."""
+    invalid_fields = [f for f in fields if f not in AVAILABLE_FIELDS]
+    if invalid_fields:
+        print(f"Warning: Invalid field names ignored: {', '.join(invalid_fields)}")
+
+    valid_fields = [f for f in fields if f in AVAILABLE_FIELDS]
+    if not valid_fields:
+        print("Warning: No valid fields specified, keeping all fields")
+    return valid_fields
+
+
+def _csv_row(result: Dict) -> Dict:
+    """Prepare one article for csv.DictWriter (authors joined with '; ')."""
+    row = result.copy()
+    if isinstance(row.get('authors'), list):
+        row['authors'] = "; ".join(row['authors'])
+    return row
+
+
+def _write_bibtex_entry(bibfile, result: Dict, i: int):
+    """Write one article as a BibTeX entry; i numbers the citation key."""
+    # Generate citation key
+    first_author = ""
+    if result.get('authors'):
+        first_author = result['authors'][0].split()[-1] if result['authors'] else ""
+    year = result.get('year', datetime.now().year)
+    citation_key = f"{first_author}{year}_{i}" if first_author else f"article{year}_{i}"
+
+    # Determine entry type
+    entry_type = "article"
+
+    # Start BibTeX entry
+    bibfile.write(f"@{entry_type}{{{citation_key},\n")
+
+    # Add fields
+    if result.get('title'):
+        title = result['title'].replace('{', '').replace('}', '')
+        bibfile.write(f"  title = {{{title}}},\n")
+
+    if result.get('authors'):
+        authors = " and ".join(result['authors'])
+        bibfile.write(f"  author = {{{authors}}},\n")
+
+    if result.get('journal'):
+        bibfile.write(f"  journal = {{{result['journal']}}},\n")
+
+    if result.get('year'):
+        bibfile.write(f"  year = {{{result['year']}}},\n")
+
+    if result.get('doi'):
+        bibfile.write(f"  doi = {{{result['doi']}}},\n")
+
+    if result.get('url'):
+        bibfile.write(f"  url = {{{result['url']}}},\n")
+
+    if result.get('abstract'):
+        abstract = result['abstract'].replace('{', '').replace('}', '')
+        bibfile.write(f"  abstract = {{{abstract}}},\n")
+
+    # Close entry
+    bibfile.write("}\n\n")
+
+
+def _write_ris_record(risfile, result: Dict):
+    """Write one article as an RIS record."""
+    # TY - Type of reference (JOUR = Journal Article)
+    risfile.write("TY  - JOUR\n")
+
+    # TI - Title
+    if result.get('title'):
+        risfile.write(f"TI  - {result['title']}\n")
+
+    # AU - Authors (one per line)
+    if result.get('authors'):
+        for author in result['authors']:
+            risfile.write(f"AU  - {author}\n")
+
+    # JO - Journal name
+    if result.get('journal'):
+        risfile.write(f"JO  - {result['journal']}\n")
+
+    # PY - Publication year
+    if result.get('year'):
+        risfile.write(f"PY  - {result['year']}\n")
+
+    # DO - DOI
+    if result.get('doi'):
+        risfile.write(f"DO  - {result['doi']}\n")
+
+    # UR - URL
+    if result.get('url'):
+        risfile.write(f"UR  - {result['url']}\n")
+
+    # AB - Abstract
+    if result.get('abstract'):
+        risfile.write(f"AB  - {result['abstract']}\n")
+
+    # DB - Database (source)
+    if result.get('source'):
+        risfile.write(f"DB  - {result['source']}\n")
+
+    # ER - End of reference
+    risfile.write("ER  - \n\n")
+
+
+def _write_enw_record(enwfile, result: Dict):
+    """Write one article in EndNote tagged format."""
+    # %0 - Type of reference (Journal Article)
+    enwfile.write("%0 Journal Article\n")
+
+    # %T - Title
+    if result.get('title'):
+        enwfile.write(f"%T {result['title']}\n")
+
+    # %A - Authors (one per line)
+    if result.get('authors'):
+        for author in result['authors']:
+            enwfile.write(f"%A {author}\n")
+
+    # %J - Journal name
+    if result.get('journal'):
+        enwfile.write(f"%J {result['journal']}\n")
+
+    # %D - Publication year
+    if result.get('year'):
+        enwfile.write(f"%D {result['year']}\n")
+
+    # %R - DOI
+    if result.get('doi'):
+        enwfile.write(f"%R {result['doi']}\n")
+
+    # %U - URL
+    if result.get('url'):
+        enwfile.write(f"%U {result['url']}\n")
+
+    # %X - Abstract
+    if result.get('abstract'):
+        enwfile.write(f"%X {result['abstract']}\n")
+
+    # %~ - Name of database (source)
+    if result.get('source'):
+        enwfile.write(f"%~ {result['source']}\n")
+
+    # End of record (blank line)
+    enwfile.write("\n")
+
+
 def export_to_csv(results: List[Dict], filename: str = None, fields: List[str] = None) -> str:
     """
     Export results to CSV format.
@@ -192,9 +353,9 @@ def export_to_csv(results: List[Dict], filename: str = None, fields: List[str] =
 
     # Define CSV columns (use filtered fields if specified, otherwise all)
     if fields:
-        fieldnames = [f for f in fields if f in ['title', 'authors', 'abstract', 'journal', 'year', 'doi', 'url', 'source']]
+        fieldnames = [f for f in fields if f in AVAILABLE_FIELDS]
     else:
-        fieldnames = ["title", "authors", "abstract", "journal", "year", "doi", "url", "source"]
+        fieldnames = list(AVAILABLE_FIELDS)
 
     with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction='ignore')
@@ -202,10 +363,7 @@ def export_to_csv(results: List[Dict], filename: str = None, fields: List[str] =
 
         for result in results:
             # Convert authors list to string
-            row = result.copy()
-            if isinstance(row.get('authors'), list):
-                row['authors'] = "; ".join(row['authors'])
-            writer.writerow(row)
+            writer.writerow(_csv_row(result))
 
     print(f"Exported {len(results)} results to: {filename}")
     return filename
@@ -244,6 +402,40 @@ def export_to_json(results: List[Dict], filename: str = None, fields: List[str]
     return filename
 
 
+def export_to_jsonl(results: List[Dict], filename: str = None, fields: List[str] = None) -> str:
+    """
+    Export results to JSON Lines format (one JSON object per line).
+
+    Args:
+        results: List of article dictionaries
+        filename: Output filename (optional)
+        fields: List of field names to export (None = all fields)
+
+    Returns:
+        Path to exported file
+    """
+    if not results:
+        print("No results to export.")
+        return None
+
+    # Apply field filtering if specified
+    if fields:
+        results = filter_fields(results, fields)
+
+    if not filename:
+        filename = generate_filename("lixplore_results", "jsonl", "jsonl")
+    elif not os.path.isabs(filename):
+        # If relative path provided, put it in jsonl subfolder
+        filename = os.path.join(get_export_directory("jsonl"), filename)
+
+    with open(filename, 'w', encoding='utf-8') as jsonlfile:
+        for result in results:
+            jsonlfile.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+    print(f"Exported {len(results)} results to: {filename}")
+    return filename
+
+
 def export_to_bibtex(results: List[Dict], filename: str = None, fields: List[str] = None) -> str:
     """
     Export results to BibTeX format.
@@ -272,47 +464,8 @@ def export_to_bibtex(results: List[Dict], filename: str = None, fields: List[str
     
     with open(filename, 'w', encoding='utf-8') as bibfile:
         for i, result in enumerate(results, start=1):
-            # Generate citation key
-            first_author = ""
-            if result.get('authors'):
-                first_author = result['authors'][0].split()[-1] if result['authors'] else ""
-            year = result.get('year', datetime.now().year)
-            citation_key = f"{first_author}{year}_{i}" if first_author else f"article{year}_{i}"
-            
-            # Determine entry type
-            entry_type = "article"
-            
-            # Start BibTeX entry
-            bibfile.write(f"@{entry_type}{{{citation_key},\n")
-            
-            # Add fields
-            if result.get('title'):
-                title = result['title'].replace('{', '').replace('}', '')
-                bibfile.write(f"  title = {{{title}}},\n")
-            
-            if result.get('authors'):
-                authors = " and ".join(result['authors'])
-                bibfile.write(f"  author = {{{authors}}},\n")
-            
-            if result.get('journal'):
-                bibfile.write(f"  journal = {{{result['journal']}}},\n")
-            
-            if result.get('year'):
-                bibfile.write(f"  year = {{{result['year']}}},\n")
-            
-            if result.get('doi'):
-                bibfile.write(f"  doi = {{{result['doi']}}},\n")
-            
-            if result.get('url'):
-                bibfile.write(f"  url = {{{result['url']}}},\n")
-            
-            if result.get('abstract'):
-                abstract = result['abstract'].replace('{', '').replace('}', '')
-                bibfile.write(f"  abstract = {{{abstract}}},\n")
-            
-            # Close entry
-            bibfile.write("}\n\n")
-    
+            _write_bibtex_entry(bibfile, result, i)
+
     print(f"Exported {len(results)} results to: {filename}")
     return filename
 
@@ -345,45 +498,8 @@ def export_to_ris(results: List[Dict], filename: str = None, fields: List[str] =
     
     with open(filename, 'w', encoding='utf-8') as risfile:
         for result in results:
-            # TY - Type of reference (JOUR = Journal Article)
-            risfile.write("TY  - JOUR\n")
-            
-            # TI - Title
-            if result.get('title'):
-                risfile.write(f"TI  - {result['title']}\n")
-            
-            # AU - Authors (one per line)
-            if result.get('authors'):
-                for author in result['authors']:
-                    risfile.write(f"AU  - {author}\n")
-            
-            # JO - Journal name
-            if result.get('journal'):
-                risfile.write(f"JO  - {result['journal']}\n")
-            
-            # PY - Publication year
-            if result.get('year'):
-                risfile.write(f"PY  - {result['year']}\n")
-            
-            # DO - DOI
-            if result.get('doi'):
-                risfile.write(f"DO  - {result['doi']}\n")
-            
-            # UR - URL
-            if result.get('url'):
-                risfile.write(f"UR  - {result['url']}\n")
-            
-            # AB - Abstract
-            if result.get('abstract'):
-                risfile.write(f"AB  - {result['abstract']}\n")
-            
-            # DB - Database (source)
-            if result.get('source'):
-                risfile.write(f"DB  - {result['source']}\n")
-            
-            # ER - End of reference
-            risfile.write("ER  - \n\n")
-    
+            _write_ris_record(risfile, result)
+
     print(f"Exported {len(results)} results to: {filename}")
     return filename
 
@@ -400,9 +516,13 @@ def export_to_xlsx(results: List[Dict], filename: str = None, fields: List[str]
     Returns:
         Path to exported file
     """
-    if not XLSX_AVAILABLE:
+    openpyxl = _load_openpyxl()
+    if openpyxl is None:
         print("Error: openpyxl is not installed. Install it with: pip install openpyxl")
         return None
+    Font = openpyxl.styles.Font
+    PatternFill = openpyxl.styles.PatternFill
+    Alignment = openpyxl.styles.Alignment
 
     if not results:
         print("No results to export.")
@@ -419,7 +539,7 @@ def export_to_xlsx(results: List[Dict], filename: str = None, fields: List[str]
         filename = os.path.join(get_export_directory("xlsx"), filename)
     
     # Create workbook and active sheet
-    wb = Workbook()
+    wb = openpyxl.Workbook()
     ws = wb.active
     ws.title = "Search Results"
     
@@ -611,45 +731,8 @@ def export_to_enw(results: List[Dict], filename: str = None, fields: List[str] =
     
     with open(filename, 'w', encoding='utf-8') as enwfile:
         for result in results:
-            # %0 - Type of reference (Journal Article)
-            enwfile.write("%0 Journal Article\n")
-            
-            # %T - Title
-            if result.get('title'):
-                enwfile.write(f"%T {result['title']}\n")
-            
-            # %A - Authors (one per line)
-            if result.get('authors'):
-                for author in result['authors']:
-                    enwfile.write(f"%A {author}\n")
-            
-            # %J - Journal name
-            if result.get('journal'):
-                enwfile.write(f"%J {result['journal']}\n")
-            
-            # %D - Publication year
-            if result.get('year'):
-                enwfile.write(f"%D {result['year']}\n")
-            
-            # %R - DOI
-            if result.get('doi'):
-                enwfile.write(f"%R {result['doi']}\n")
-            
-            # %U - URL
-            if result.get('url'):
-                enwfile.write(f"%U {result['url']}\n")
-            
-            # %X - Abstract
-            if result.get('abstract'):
-                enwfile.write(f"%X {result['abstract']}\n")
-            
-            # %~ - Name of database (source)
-            if result.get('source'):
-                enwfile.write(f"%~ {result['source']}\n")
-            
-            # End of record (blank line)
-            enwfile.write("\n")
-    
+            _write_enw_record(enwfile, result)
+
     print(f"Exported {len(results)} results to EndNote format: {filename}")
     return filename
 
@@ -803,7 +886,7 @@ def export_results(results: List[Dict], format: str, filename: str = None, field
 
     Args:
         results: List of article dictionaries
-        format: Export format ('csv', 'json', 'bibtex', 'ris', 'endnote', 'enw', 'xlsx', 'xml')
+        format: Export format ('csv', 'json', 'jsonl', 'bibtex', 'ris', 'endnote', 'enw', 'xlsx', 'xml')
         filename: Output filename (optional)
         fields: List of field names to export (None = all fields)
 
@@ -816,6 +899,8 @@ def export_results(results: List[Dict], format: str, filename: str = None, field
         return export_to_csv(results, filename, fields)
     elif format == 'json':
         return export_to_json(results, filename, fields)
+    elif format == 'jsonl':
+        return export_to_jsonl(results, filename, fields)
     elif format == 'bibtex':
         return export_to_bibtex(results, filename, fields)
     elif format == 'ris':
@@ -831,3 +916,83 @@ def export_results(results: List[Dict], format: str, filename: str = None, field
     else:
         print(f"Error: Unsupported export format '{format}'")
         return None
+
+
+class StreamExporter:
+    """
+    Incremental exporter: writes each article as soon as it arrives.
+
+    Only formats without a document-level wrapper can be streamed
+    (STREAM_FORMATS). Rows are flushed regularly so a long harvest is
+    readable on disk while it is still running.
+
+    Usage:
+        with StreamExporter('csv', 'harvest.csv') as exporter:
+            for article in articles:
+                exporter.write(article)
+    """
+
+    FLUSH_EVERY = 100  # articles
+
+    def __init__(self, format: str, filename: str = None, fields: List[str] = None):
+        """
+        Args:
+            format: One of STREAM_FORMATS
+            filename: Output filename (optional, relative names go to the format folder)
+            fields: List of field names to export (None = all fields)
+        """
+        format = format.lower()
+        if format not in STREAM_FORMATS:
+            raise ValueError(
+                f"Format '{format}' cannot be streamed. Streamable formats: {', '.join(STREAM_FORMATS)}"
+            )
+
+        self.format = format
+        self.fields = _valid_fields(fields) if fields else None
+        self.count = 0
+
+        if not filename:
+            filename = generate_filename("lixplore_results", EXPORT_EXTENSIONS[format], format)
+        elif not os.path.isabs(filename):
+            filename = os.path.join(get_export_directory(format), filename)
+        self.filename = filename
+
+        self._file = open(filename, 'w', newline='' if format == 'csv' else None, encoding='utf-8')
+        self._csv_writer = None
+        if format == 'csv':
+            fieldnames = self.fields or list(AVAILABLE_FIELDS)
+            self._csv_writer = csv.DictWriter(self._file, fieldnames=fieldnames, extrasaction='ignore')
+            self._csv_writer.writeheader()
+
+    def write(self, result: Dict):
+        """Append one article to the export file."""
+        if self.fields:
+            result = {field: result.get(field) for field in self.fields}
+
+        self.count += 1
+        if self.format == 'csv':
+            self._csv_writer.writerow(_csv_row(result))
+        elif self.format == 'jsonl':
+            self._file.write(json.dumps(result, ensure_ascii=False) + "\n")
+        elif self.format == 'bibtex':
+            _write_bibtex_entry(self._file, result, self.count)
+        elif self.format == 'ris':
+            _write_ris_record(self._file, result)
+        elif self.format == 'enw':
+            _write_enw_record(self._file, result)
+
+        if self.count % self.FLUSH_EVERY == 0:
+            self._file.flush()
+
+    def close(self) -> str:
+        """Close the file and return its path."""
+        if not self._file.closed:
+            self._file.close()
+        return self.filename
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Search history log.
+
+Searches are appended, one JSON line each, to ~/.lixplore_history.jsonl, so
+recording a search never rewrites the file. Each entry carries a sequence
+number ("n"); comparing the first and last numbers tells how many entries
+the log holds without reading it. Once the log holds twice the history
+limit it is compacted down to the most recent entries, which keeps the cost
+of each append constant on average. Listing the history reads only the end
+of the log.
+
+A sidecar index (~/.lixplore_history.idx) maps each normalized query, and
+each normalized query + sources, to the offset of its latest entry. Only
+lookups use it; it is brought up to date by reading just the lines appended
+since it was last written.
+
+The history limit defaults to MAX_HISTORY_ENTRIES and can be changed with
+the LIXPLORE_HISTORY_MAX environment variable. Histories written by older
+versions (~/.lixplore_history.json) are imported on first use.
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from lixplore.utils.cache import normalize_query
+
+HISTORY_LOG = os.path.expanduser("~/.lixplore_history.jsonl")
+HISTORY_INDEX = os.path.expanduser("~/.lixplore_history.idx")
+LEGACY_HISTORY_FILE = os.path.expanduser("~/.lixplore_history.json")
+
+MAX_HISTORY_ENTRIES = 100  # Default number of history entries to keep
+
+# Compact when the log holds this many times the history limit
+COMPACT_FACTOR = 2
+
+# Bytes read at a time when reading the log backwards
+TAIL_BLOCK = 64 * 1024
+
+
+def max_entries() -> int:
+    """History limit (LIXPLORE_HISTORY_MAX, default MAX_HISTORY_ENTRIES)."""
+    try:
+        return max(1, int(os.environ.get("LIXPLORE_HISTORY_MAX", MAX_HISTORY_ENTRIES)))
+    except ValueError:
+        return MAX_HISTORY_ENTRIES
+
+
+def entry_key(query: str, sources: List[str]) -> str:
+    """Index key of a search: normalized query and sorted sources."""
+    return f"{normalize_query(query)}|{','.join(sorted(sources or []))}"
+
+
+def _import_legacy():
+    """Convert ~/.lixplore_history.json (newest first) into the log once."""
+    if os.path.exists(HISTORY_LOG) or not os.path.exists(LEGACY_HISTORY_FILE):
+        return
+    try:
+        with open(LEGACY_HISTORY_FILE, "r", encoding="utf-8") as f:
+            legacy = json.load(f)
+    except (json.JSONDecodeError, IOError):
+        return
+    if not isinstance(legacy, list):
+        return
+    _write_log([entry for entry in reversed(legacy) if isinstance(entry, dict)])
+
+
+def _write_log(entries: List[Dict]):
+    """Replace the log with the given entries (oldest first) and reset the index."""
+    tmp = HISTORY_LOG + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        for number, entry in enumerate(entries, 1):
+            entry["n"] = number
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    os.replace(tmp, HISTORY_LOG)
+    try:
+        os.remove(HISTORY_INDEX)
+    except OSError:
+        pass
+
+
+def _tail_lines(count: int) -> List[bytes]:
+    """Last `count` complete lines of the log, oldest first, read from the end."""
+    try:
+        f = open(HISTORY_LOG, "rb")
+    except OSError:
+        return []
+    with f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b""
+        # One newline more than needed, so the first line kept is complete
+        while position > 0 and data.count(b"\n") <= count:
+            step = min(TAIL_BLOCK, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+
+    lines = data.split(b"\n")[:-1]  # drop a line still being written
+    if position > 0:
+        lines = lines[1:]
+    return lines[-count:] if count else []
+
+
+def _sequence(line: bytes) -> Optional[int]:
+    """Sequence number of a log line, if it has one."""
+    try:
+        number = json.loads(line).get("n")
+    except (ValueError, AttributeError):
+        return None
+    return number if isinstance(number, int) else None
+
+
+def _empty_index() -> Dict:
+    return {"log_size": 0, "entries": 0, "keys": {}, "queries": {}}
+
+
+def _load_index() -> Dict:
+    """Read the index sidecar, catching up with lines appended since it was written."""
+    index = _empty_index()
+    try:
+        with open(HISTORY_INDEX, "r", encoding="utf-8") as f:
+            stored = json.load(f)
+        if isinstance(stored, dict) and isinstance(stored.get("keys"), dict) and isinstance(stored.get("queries"), dict):
+            index.update(stored)
+    except (json.JSONDecodeError, IOError):
+        pass
+
+    try:
+        size = os.path.getsize(HISTORY_LOG)
+    except OSError:
+        return _empty_index()
+
+    if index["log_size"] > size:
+        # The log was replaced behind our back: rebuild
+        index = _empty_index()
+    if index["log_size"] == size:
+        return index
+
+    with open(HISTORY_LOG, "rb") as f:
+        f.seek(index["log_size"])
+        offset = index["log_size"]
+        for line in f:
+            if line.endswith(b"\n"):
+                try:
+                    entry = json.loads(line)
+                    index["keys"][entry_key(entry.get("query"), entry.get("sources"))] = offset
+                    index["queries"][normalize_query(entry.get("query"))] = offset
+                    index["entries"] += 1
+                except ValueError:
+                    pass
+                offset += len(line)
+        index["log_size"] = offset
+
+    try:
+        tmp = HISTORY_INDEX + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False)
+        os.replace(tmp, HISTORY_INDEX)
+    except IOError:
+        pass
+    return index
+
+
+def entries(limit: int = None) -> List[Dict]:
+    """
+    Return history entries, most recent first.
+
+    Args:
+        limit: Maximum number of entries (default: the history limit)
+
+    Returns:
+        List of entries (timestamp, query, sources, result_count, session)
+    """
+    _import_legacy()
+    limit = limit or max_entries()
+
+    result = []
+    for line in reversed(_tail_lines(limit)):
+        try:
+            result.append(json.loads(line))
+        except ValueError:
+            continue
+    return result
+
+
+def get_entry(number: int) -> Optional[Dict]:
+    """History entry by its number in the history listing (1 = most recent)."""
+    if number < 1:
+        return None
+    listed = entries()
+    return listed[number - 1] if number <= len(listed) else None
+
+
+def find(query: str, sources: List[str] = None) -> Optional[Dict]:
+    """
+    Latest history entry for a query, via the index.
+
+    Args:
+        query: Search query string (compared after normalizing whitespace)
+        sources: Only match searches of exactly these sources (optional)
+
+    Returns:
+        The entry, or None
+    """
+    _import_legacy()
+    index = _load_index()
+    if sources is None:
+        offset = index["queries"].get(normalize_query(query))
+    else:
+        offset = index["keys"].get(entry_key(query, sources))
+    if offset is None:
+        return None
+    try:
+        with open(HISTORY_LOG, "rb") as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+    except (IOError, ValueError):
+        return None
+
+
+def record(query: str, sources: List[str], result_count: int, session: str = None):
+    """
+    Append a search to the history.
+
+    Args:
+        query: Search query string
+        sources: List of sources searched
+        result_count: Number of results found
+        session: Result session holding the results (optional)
+    """
+    _import_legacy()
+    entry = {
+        "timestamp": datetime.now().isoformat(),
+        "query": query,
+        "sources": sources if sources else [],
+        "result_count": result_count,
+    }
+    if session:
+        entry["session"] = session
+
+    # Number the entry after the last one; a log written before entries were
+    # numbered is counted once, and numbered from there on
+    last = _tail_lines(1)
+    previous = _sequence(last[0]) if last else 0
+    if previous is None:
+        with open(HISTORY_LOG, "rb") as f:
+            previous = sum(1 for _ in f)
+    entry["n"] = previous + 1
+
+    with open(HISTORY_LOG, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    with open(HISTORY_LOG, "rb") as f:
+        first = _sequence(f.readline()) or 1
+
+    # The index is not touched here: readers catch up from its log_size
+    limit = max_entries()
+    if entry["n"] - first + 1 > limit * COMPACT_FACTOR:
+        _write_log(list(reversed(entries(limit))))
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP session for Lixplore.
+
+All outbound HTTP calls go through one connection-pooled requests.Session so
+that repeated requests to the same host (Crossref, doi.org, Unpaywall, ...)
+reuse keep-alive TCP/TLS connections instead of opening a new one each time.
+
+Retries and backoff can be tuned with configure() or the environment
+variables LIXPLORE_HTTP_RETRIES and LIXPLORE_HTTP_BACKOFF.
+
+requests is imported when the session is first built, so importing this
+module costs nothing for commands that never go online.
+"""
+
+import os
+import threading
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    import requests
+    from urllib3.util.retry import Retry
+
+
+# Connections kept open per host (pool_maxsize)
+DEFAULT_POOL_SIZE = 10
+
+# Hosts that receive bursts of requests (enrichment, PDF link checks) get larger pools
+HOST_POOL_SIZES = {
+    "api.crossref.org": 20,
+    "doi.org": 20,
+    "api.unpaywall.org": 20,
+    "www.ebi.ac.uk": 10,
+    "export.arxiv.org": 4,
+    "arxiv.org": 8,
+    "doaj.org": 10,
+    "www.ncbi.nlm.nih.gov": 10,
+}
+
+# Number of distinct host pools kept alive (pool_connections)
+MAX_HOST_POOLS = 32
+
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5  # sleeps 0.5s, 1s, 2s between retries
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+USER_AGENT = "lixplore-cli/1.0.1 (+https://github.com/pryndor/Lixplore_cli)"
+
+_session = None
+_session_lock = threading.Lock()
+_settings = {}
+
+
+def _make_retry(retries: int, backoff: float) -> "Retry":
+    """Build a urllib3 Retry policy for idempotent requests."""
+    from urllib3.util.retry import Retry
+
+    kwargs = {
+        "total": retries,
+        "connect": retries,
+        "read": retries,
+        "backoff_factor": backoff,
+        "status_forcelist": RETRY_STATUSES,
+        "respect_retry_after_header": True,
+        "raise_on_status": False,
+    }
+    try:
+        return Retry(allowed_methods=frozenset(["GET", "HEAD", "OPTIONS"]), **kwargs)
+    except TypeError:
+        # urllib3 < 1.26 uses the older keyword
+        return Retry(method_whitelist=frozenset(["GET", "HEAD", "OPTIONS"]), **kwargs)
+
+
+def _build_session() -> "requests.Session":
+    """Create a session with pooled adapters, retries and gzip negotiation."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    retries = _settings.get("retries")
+    if retries is None:
+        retries = int(os.environ.get("LIXPLORE_HTTP_RETRIES", MAX_RETRIES))
+
+    backoff = _settings.get("backoff")
+    if backoff is None:
+        backoff = float(os.environ.get("LIXPLORE_HTTP_BACKOFF", BACKOFF_FACTOR))
+
+    pool_size = _settings.get("pool_size") or DEFAULT_POOL_SIZE
+    host_pool_sizes = dict(HOST_POOL_SIZES)
+    host_pool_sizes.update(_settings.get("host_pool_sizes") or {})
+
+    session = requests.Session()
+    session.headers.update({
+        "User-Agent": USER_AGENT,
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    })
+
+    default_adapter = HTTPAdapter(
+        pool_connections=MAX_HOST_POOLS,
+        pool_maxsize=pool_size,
+        max_retries=_make_retry(retries, backoff),
+    )
+    session.mount("https://", default_adapter)
+    session.mount("http://", default_adapter)
+
+    # Longest prefix wins in requests, so per-host adapters override the default
+    for host, size in host_pool_sizes.items():
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=size,
+            max_retries=_make_retry(retries, backoff),
+        )
+        session.mount(f"https://{host}/", adapter)
+        session.mount(f"http://{host}/", adapter)
+
+    return session
+
+
+def get_session() -> "requests.Session":
+    """Return the process-wide shared session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def configure(retries: Optional[int] = None, backoff: Optional[float] = None,
+              pool_size: Optional[int] = None, host_pool_sizes: Optional[Dict[str, int]] = None):
+    """
+    Change retry/pool settings. The shared session is rebuilt on next use.
+
+    Args:
+        retries: Maximum retries for failed idempotent requests
+        backoff: Exponential backoff factor in seconds
+        pool_size: Default keep-alive connections per host
+        host_pool_sizes: Per-host overrides, e.g. {"api.crossref.org": 30}
+    """
+    if retries is not None:
+        _settings["retries"] = retries
+    if backoff is not None:
+        _settings["backoff"] = backoff
+    if pool_size is not None:
+        _settings["pool_size"] = pool_size
+    if host_pool_sizes is not None:
+        _settings["host_pool_sizes"] = host_pool_sizes
+    close()
+
+
+def close():
+    """Close all pooled connections."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def get(url: str, **kwargs) -> "requests.Response":
+    """GET through the shared session (same arguments as requests.get)."""
+    return get_session().get(url, **kwargs)
+
+
+def head(url: str, **kwargs) -> "requests.Response":
+    """HEAD through the shared session (same arguments as requests.head)."""
+    kwargs.setdefault("allow_redirects", False)
+    return get_session().head(url, **kwargs)
+
+
+def post(url: str, **kwargs) -> "requests.Response":
+    """POST through the shared session (same arguments as requests.post)."""
+    return get_session().post(url, **kwargs)
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+
+"""
+Article metadata helpers shared by the dispatcher and the enrichment module.
+"""
+
+
+# Metadata fields counted by get_completeness_score
+METADATA_FIELDS = ['title', 'authors', 'abstract', 'journal', 'year', 'doi', 'url', 'source']
+
+
+def has_value(value):
+    """True for a non-blank string or a non-empty list."""
+    if isinstance(value, str):
+        return bool(value.strip())
+    if isinstance(value, list):
+        return len(value) > 0
+    return False
+
+
+def missing_metadata(article, fields=None):
+    """
+    Return the metadata fields an article lacks.
+
+    Args:
+        article: Article dictionary
+        fields: Fields to check (default: METADATA_FIELDS)
+
+    Returns:
+        List of missing field names, in the order given
+    """
+    return [field for field in (fields or METADATA_FIELDS) if not has_value(article.get(field))]
@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+"""
+Persistent metadata store for Lixplore.
+
+A small SQLite database in the cache directory (~/.lixplore_cache/metadata.db)
+that remembers lookups across runs, so repeat work becomes a local lookup.
+
+Two kinds of data are kept:
+
+* Key/value lookups (get/put): keys are namespaced strings such as
+  "doi:10.1038/nature12373" and values are JSON. A stored value of None
+  records a negative lookup (e.g. a DOI that does not resolve).
+* Canonical article records (save_articles/find_article): one merged record
+  per article, reachable through any of its identifiers (DOI, PMID, PMCID,
+  arXiv ID), with the time each source or service last fetched it. A source
+  that rebuilds its own search results from the store also keeps its own
+  unmerged copy in the record (source_record).
+
+The store is shared by all threads; a single connection is guarded by a lock.
+If the database cannot be opened, every call degrades to a cache miss.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from lixplore.utils.cache import CACHE_DIR
+
+STORE_PATH = os.path.join(CACHE_DIR, "metadata.db")
+
+# SQLite limits the number of parameters per statement
+_QUERY_CHUNK = 500
+
+_MISSING = object()
+
+# Article fields kept in canonical records, besides the identifiers
+RECORD_FIELDS = ['title', 'authors', 'abstract', 'journal', 'year', 'doi', 'url']
+
+# Identifier kinds, in lookup order
+ID_KINDS = ['doi', 'pmid', 'pmcid', 'arxiv']
+
+_DOI_PREFIXES = ('https://doi.org/', 'http://doi.org/', 'https://dx.doi.org/',
+                 'http://dx.doi.org/', 'doi:')
+
+_PMID_URL = re.compile(r'(?:pubmed\.ncbi\.nlm\.nih\.gov/|europepmc\.org/article/MED/)(\d+)', re.IGNORECASE)
+_PMCID = re.compile(r'PMC(\d+)', re.IGNORECASE)
+_ARXIV_URL = re.compile(
+    r'arxiv\.org/(?:abs|pdf)/([a-z\-]+(?:\.[a-z]{2})?/\d{7}|\d{4}\.\d{4,5})(?:v\d+)?',
+    re.IGNORECASE
+)
+
+_conn = None
+_conn_failed = False
+_lock = threading.RLock()
+
+
+def _connect() -> Optional[sqlite3.Connection]:
+    """Open (and create) the store on first use."""
+    global _conn, _conn_failed
+    if _conn is not None or _conn_failed:
+        return _conn
+    try:
+        os.makedirs(os.path.dirname(STORE_PATH), exist_ok=True)
+        conn = sqlite3.connect(STORE_PATH, timeout=10, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS metadata ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT,"
+            " updated REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS articles ("
+            " id INTEGER PRIMARY KEY,"
+            " record TEXT NOT NULL,"
+            " updated REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS identifiers ("
+            " key TEXT PRIMARY KEY,"
+            " article_id INTEGER NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS identifiers_article ON identifiers (article_id)")
+        conn.commit()
+        _conn = conn
+    except (sqlite3.Error, OSError) as e:
+        print(f"[Metadata Store] Disabled: {e}")
+        _conn_failed = True
+    return _conn
+
+
+def get_many(keys: Iterable[str], max_age: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Look up several keys at once.
+
+    Args:
+        keys: Keys to look up
+        max_age: Ignore entries older than this many seconds (None = any age)
+
+    Returns:
+        Dictionary of the keys that were found (values may be None for
+        recorded negative lookups)
+    """
+    keys = list(dict.fromkeys(keys))
+    found = {}
+    if not keys:
+        return found
+
+    cutoff = time.time() - max_age if max_age is not None else None
+    with _lock:
+        conn = _connect()
+        if conn is None:
+            return found
+        try:
+            for start in range(0, len(keys), _QUERY_CHUNK):
+                chunk = keys[start:start + _QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT key, value, updated FROM metadata WHERE key IN ({placeholders})",
+                    chunk
+                ).fetchall()
+                for key, value, updated in rows:
+                    if cutoff is not None and updated < cutoff:
+                        continue
+                    found[key] = json.loads(value) if value is not None else None
+        except (sqlite3.Error, ValueError):
+            pass
+    return found
+
+
+def get(key: str, default: Any = None, max_age: Optional[float] = None) -> Any:
+    """
+    Look up one key.
+
+    Args:
+        key: Key to look up
+        default: Returned when the key is unknown or too old
+        max_age: Ignore an entry older than this many seconds
+
+    Returns:
+        Stored value (None for a recorded negative lookup) or default
+    """
+    value = get_many([key], max_age=max_age).get(key, _MISSING)
+    return default if value is _MISSING else value
+
+
+def put_many(items: Dict[str, Any]):
+    """
+    Store several values in one transaction.
+
+    Args:
+        items: Dictionary of key -> JSON-serialisable value (None = negative lookup)
+    """
+    if not items:
+        return
+    now = time.time()
+    rows = [(key, json.dumps(value) if value is not None else None, now)
+            for key, value in items.items()]
+    with _lock:
+        conn = _connect()
+        if conn is None:
+            return
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO metadata (key, value, updated) VALUES (?, ?, ?)", rows
+            )
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+
+def put(key: str, value: Any):
+    """Store one value (None records a negative lookup)."""
+    put_many({key: value})
+
+
+def delete(keys: Iterable[str]):
+    """Remove entries."""
+    keys = list(keys)
+    with _lock:
+        conn = _connect()
+        if conn is None:
+            return
+        try:
+            conn.executemany("DELETE FROM metadata WHERE key = ?", [(key,) for key in keys])
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+
+# ===== Canonical article records =====
+
+def normalize_doi(doi: str) -> str:
+    """Strip resolver prefixes and whitespace from a DOI."""
+    doi = (doi or '').strip()
+    for prefix in _DOI_PREFIXES:
+        if doi.lower().startswith(prefix):
+            return doi[len(prefix):].strip()
+    return doi
+
+
+def article_ids(article: Dict) -> Dict[str, str]:
+    """
+    Extract the identifiers of an article.
+
+    Explicit fields ('doi', 'pmid', 'pmcid', 'arxiv_id') are used first;
+    otherwise PMIDs, PMCIDs and arXiv IDs are read from the article URL.
+
+    Args:
+        article: Article dictionary
+
+    Returns:
+        Dictionary of identifier kind ('doi', 'pmid', 'pmcid', 'arxiv') -> value
+    """
+    ids = {}
+    url = article.get('url') or ''
+
+    doi = normalize_doi(article.get('doi') or '')
+    if doi.startswith('10.'):
+        ids['doi'] = doi.lower()
+
+    pmid = str(article.get('pmid') or '').strip()
+    if not pmid:
+        match = _PMID_URL.search(url)
+        pmid = match.group(1) if match else ''
+    if pmid.isdigit():
+        ids['pmid'] = pmid
+
+    pmcid = str(article.get('pmcid') or article.get('pmc') or '')
+    match = _PMCID.search(pmcid) or (_PMCID.search(url) if 'pmc' in url.lower() else None)
+    if match:
+        ids['pmcid'] = f"PMC{match.group(1)}"
+
+    arxiv_id = str(article.get('arxiv_id') or '').strip()
+    if arxiv_id:
+        arxiv_id = re.sub(r'v\d+$', '', arxiv_id)
+    else:
+        match = _ARXIV_URL.search(url)
+        arxiv_id = match.group(1) if match else ''
+    if arxiv_id:
+        ids['arxiv'] = arxiv_id
+
+    return ids
+
+
+def _id_keys(ids: Dict[str, str]) -> List[str]:
+    return [f"{kind}:{ids[kind]}" for kind in ID_KINDS if kind in ids]
+
+
+def _merge_record(record: Dict, article: Dict, ids: Dict[str, str]):
+    """Fill gaps in a stored record from an article (existing values win)."""
+    for field in RECORD_FIELDS:
+        value = article.get(field)
+        if value and not record.get(field):
+            record[field] = value
+    for kind, value in ids.items():
+        record.setdefault('ids', {}).setdefault(kind, value)
+
+
+def _save_one(conn: sqlite3.Connection, article: Dict, fetched: List[str], now: float,
+              extra: Optional[Dict[str, Any]] = None, source: Optional[str] = None):
+    ids = article_ids(article)
+    keys = _id_keys(ids)
+    if not keys:
+        return
+
+    placeholders = ",".join("?" * len(keys))
+    article_ids_found = sorted({row[0] for row in conn.execute(
+        f"SELECT article_id FROM identifiers WHERE key IN ({placeholders})", keys
+    )})
+
+    record = {}
+    if article_ids_found:
+        # Identifiers may point at several records that turn out to be one article
+        rows = dict(conn.execute(
+            f"SELECT id, record FROM articles WHERE id IN ({','.join('?' * len(article_ids_found))})",
+            article_ids_found
+        ).fetchall())
+        for other_id in article_ids_found:
+            if other_id in rows:
+                other = json.loads(rows[other_id])
+                if not record:
+                    record = other
+                else:
+                    _merge_record(record, other, other.get('ids', {}))
+                    for service, copy in other.get('sources', {}).items():
+                        # Keep the more recently fetched copy
+                        if service not in record.get('sources', {}) or \
+                                other.get('fetched', {}).get(service, 0) > record.get('fetched', {}).get(service, 0):
+                            record.setdefault('sources', {})[service] = copy
+                    for service, when in other.get('fetched', {}).items():
+                        record.setdefault('fetched', {})[service] = max(
+                            when, record.get('fetched', {}).get(service, 0))
+
+    _merge_record(record, article, ids)
+    for service in fetched:
+        record.setdefault('fetched', {})[service] = now
+    if source:
+        record.setdefault('sources', {})[source] = {
+            field: article[field] for field in RECORD_FIELDS if field in article
+        }
+    record.update(extra or {})
+
+    record_id = article_ids_found[0] if article_ids_found else None
+    if record_id is None:
+        record_id = conn.execute(
+            "INSERT INTO articles (record, updated) VALUES (?, ?)", (json.dumps(record), now)
+        ).lastrowid
+    else:
+        conn.execute("UPDATE articles SET record = ?, updated = ? WHERE id = ?",
+                     (json.dumps(record), now, record_id))
+        for other_id in article_ids_found[1:]:
+            conn.execute("DELETE FROM articles WHERE id = ?", (other_id,))
+            conn.execute("UPDATE identifiers SET article_id = ? WHERE article_id = ?",
+                         (record_id, other_id))
+
+    conn.executemany(
+        "INSERT OR REPLACE INTO identifiers (key, article_id) VALUES (?, ?)",
+        [(key, record_id) for key in _id_keys(record.get('ids', {}))]
+    )
+
+
+def save_articles(articles: Iterable[Dict], fetched: Optional[List[str]] = None,
+                  extra: Optional[Dict[str, Any]] = None, source: Optional[str] = None):
+    """
+    Merge articles into their canonical records.
+
+    Missing fields of a stored record are filled from the article; values
+    already stored are kept. Articles without any identifier are skipped.
+
+    Args:
+        articles: Article dictionaries
+        fetched: Services the articles were just fetched from or checked
+            against (e.g. ['pubmed'] or ['crossref']); their fetch time is
+            set to now
+        extra: Additional record fields to set, e.g. {'pdf_url': ...}
+            (only sensible for a single article)
+        source: Also keep the articles as this source returned them,
+            unmerged (see source_record)
+    """
+    now = time.time()
+    with _lock:
+        conn = _connect()
+        if conn is None:
+            return
+        try:
+            for article in articles:
+                _save_one(conn, article, fetched or [], now, extra, source)
+            conn.commit()
+        except (sqlite3.Error, ValueError, TypeError):
+            conn.rollback()
+
+
+def find_articles(keys: Iterable[str]) -> Dict[str, Dict]:
+    """
+    Look up canonical records by identifier key.
+
+    Args:
+        keys: Keys such as "pmid:12345" or "doi:10.1038/nature12373"
+
+    Returns:
+        Dictionary of key -> record for the keys that are known. A record
+        holds the article fields, 'ids' (kind -> value) and 'fetched'
+        (service -> Unix time of the last fetch).
+    """
+    keys = list(dict.fromkeys(keys))
+    found = {}
+    if not keys:
+        return found
+    with _lock:
+        conn = _connect()
+        if conn is None:
+            return found
+        try:
+            for start in range(0, len(keys), _QUERY_CHUNK):
+                chunk = keys[start:start + _QUERY_CHUNK]
+                rows = conn.execute(
+                    "SELECT identifiers.key, articles.record FROM identifiers"
+                    " JOIN articles ON articles.id = identifiers.article_id"
+                    f" WHERE identifiers.key IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                for key, record in rows:
+                    found[key] = json.loads(record)
+        except (sqlite3.Error, ValueError):
+            pass
+    return found
+
+
+def find_article(article: Dict) -> Optional[Dict]:
+    """
+    Return the canonical record for an article, found by any identifier.
+
+    Args:
+        article: Article dictionary
+
+    Returns:
+        Stored record or None
+    """
+    keys = _id_keys(article_ids(article))
+    found = find_articles(keys)
+    for key in keys:
+        if key in found:
+            return found[key]
+    return None
+
+
+def fetched_within(record: Optional[Dict], service: str, max_age: float) -> bool:
+    """True if a record was fetched from a service less than max_age seconds ago."""
+    if not record:
+        return False
+    return time.time() - record.get('fetched', {}).get(service, 0) < max_age
+
+
+def source_record(record: Optional[Dict], source: str) -> Optional[Dict]:
+    """
+    Return a source's own copy of an article from a canonical record.
+
+    Unlike the merged record, its fields are exactly what the source
+    returned, so search results rebuilt from it match a fresh fetch.
+
+    Args:
+        record: Canonical record (from find_article) or None
+        source: Source name passed to save_articles(source=...)
+
+    Returns:
+        Dictionary of article fields, or None if the source's copy is not stored
+    """
+    if not record:
+        return None
+    return record.get('sources', {}).get(source)
+
+
+def fill_from_record(article: Dict, record: Optional[Dict]) -> Dict:
+    """
+    Return a copy of an article with empty fields filled from its stored record.
+
+    Args:
+        article: Article dictionary
+        record: Canonical record (from find_article) or None
+
+    Returns:
+        Article dictionary
+    """
+    filled = dict(article)
+    if record:
+        for field in RECORD_FIELDS:
+            if record.get(field) and not filled.get(field):
+                filled[field] = record[field]
+    return filled
+
+
+def close():
+    """Close the database connection."""
+    global _conn
+    with _lock:
+        if _conn is not None:
+            _conn.close()
+            _conn = None
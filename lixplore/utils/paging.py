@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Paging helpers shared by the source connectors.
+
+Each connector exposes iter_pages(), a generator that yields one list of
+articles per API request (cursor, offset or retstart based, depending on the
+source). The helpers here turn those page generators into a result list, or
+fetch the next page in the background while the current one is processed.
+"""
+
+import queue
+import threading
+from typing import Dict, Iterator, List, Optional
+
+# How many pages the background fetcher may run ahead of the consumer
+DEFAULT_PREFETCH_DEPTH = 1
+
+_DONE = object()
+
+
+def page_size_for(max_results: int, limit: int) -> int:
+    """Request size for one page: never more than needed or than the API allows."""
+    return max(1, min(max_results, limit))
+
+
+def collect_pages(pages: Iterator[List[Dict]], max_results: int) -> List[Dict]:
+    """
+    Read pages until max_results articles are collected, then stop paging.
+
+    Args:
+        pages: Page generator (e.g. CrossrefSource().iter_pages(...))
+        max_results: Maximum number of articles to return
+
+    Returns:
+        List of at most max_results articles
+    """
+    results = []
+    try:
+        for page in pages:
+            results.extend(page)
+            if len(results) >= max_results:
+                break
+    finally:
+        close = getattr(pages, "close", None)
+        if close:
+            close()
+    return results[:max_results]
+
+
+def prefetch_pages(pages: Iterator[List[Dict]], depth: int = DEFAULT_PREFETCH_DEPTH,
+                   stop_event: Optional[threading.Event] = None) -> Iterator[List[Dict]]:
+    """
+    Yield pages from a page generator while the next ones are fetched in parallel.
+
+    The request for page N+1 is sent while the caller is still handling page N.
+    Paging stops after the current request when the caller stops iterating
+    (or closes this generator), or when stop_event is set.
+
+    Args:
+        pages: Page generator to read from in a background thread
+        depth: Number of pages that may be fetched ahead
+        stop_event: Optional event that cancels paging from another thread
+
+    Yields:
+        Lists of articles, in page order
+    """
+    stop = stop_event or threading.Event()
+    buffer = queue.Queue(maxsize=max(1, depth))
+
+    def _put(item):
+        # Give up if the consumer went away instead of blocking forever
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.2)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _worker():
+        try:
+            for page in pages:
+                if not _put(page):
+                    break
+        except Exception as e:
+            _put(e)
+        finally:
+            close = getattr(pages, "close", None)
+            if close:
+                try:
+                    close()
+                except Exception:
+                    pass
+            _put(_DONE)
+
+    thread = threading.Thread(target=_worker, daemon=True)
+    thread.start()
+
+    try:
+        while not stop.is_set():
+            try:
+                item = buffer.get(timeout=0.2)
+            except queue.Empty:
+                if not thread.is_alive() and buffer.empty():
+                    return
+                continue
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
@@ -12,15 +12,43 @@ Respects copyright and prioritizes legal open-access sources.
 """
 
 import os
-import requests
+from lixplore.utils import http_session, pdf_library
+from lixplore.utils.ratelimit import TokenBucket, get_limiter
+import itertools
+import queue
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Tuple
-from urllib.parse import quote
+from urllib.parse import quote, urlparse
 
 
 # PDF download directory
 PDF_DIR = os.path.expanduser("~/Lixplore_PDFs")
 
+# Concurrent PDF transfers, and transfers to any single host
+PDF_WORKERS = 4
+PER_HOST_LIMIT = 2
+
+# Unfinished downloads are kept as <name>.pdf.part and resumed next time
+PART_SUFFIX = ".part"
+
+# Bytes read from the network per chunk, and the file write buffer size
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# PDF files start with this signature (the spec allows up to 1 KB of junk before it)
+PDF_MAGIC = b'%PDF'
+PDF_MAGIC_WINDOW = 1024
+
+# How long an Unpaywall answer (PDF link or none) is reused
+UNPAYWALL_TTL = 7 * 24 * 3600
+
+# Unpaywall requests per second, and PDF links resolved at once
+UNPAYWALL_RATE = 10
+PDF_LINK_WORKERS = 8
+
 # SciHub mirrors (user can configure)
 SCIHUB_CONFIG = os.path.expanduser("~/.lixplore/scihub_mirror.txt")
 
@@ -81,10 +109,85 @@ def sanitize_filename(filename: str) -> str:
     return filename if filename else "article"
 
 
+# ===== Transfer limits =====
+# Downloads may run in several threads (see download_multiple_pdfs). Each
+# transfer holds a slot for its host, and all transfers share one optional
+# bandwidth budget.
+
+_per_host_limit = PER_HOST_LIMIT
+_host_slots = {}
+_path_locks = {}
+_bandwidth = None
+_limits_lock = threading.Lock()
+
+# Bytes and files transferred, for the throughput report
+_transferred = {'bytes': 0, 'files': 0}
+
+
+def configure_downloads(per_host: int = None, max_rate: float = None):
+    """
+    Set the per-host concurrency cap and the overall bandwidth cap.
+
+    Args:
+        per_host: Transfers allowed at once to any single host
+        max_rate: Overall download rate in bytes per second (None or 0 = unlimited)
+    """
+    global _per_host_limit, _bandwidth
+    with _limits_lock:
+        if per_host is not None and per_host != _per_host_limit:
+            _per_host_limit = max(1, per_host)
+            _host_slots.clear()
+        # Allow short bursts: a quarter second's worth, and at least one chunk
+        _bandwidth = TokenBucket(max_rate, max(max_rate / 4, DOWNLOAD_CHUNK_SIZE)) if max_rate else None
+
+
+def parse_rate(text: str) -> Optional[float]:
+    """
+    Parse a bandwidth such as '500K', '2M' or '1.5MB' (bytes per second).
+
+    Args:
+        text: Rate with an optional K/M/G suffix
+
+    Returns:
+        Bytes per second, or None if the text is not a valid rate
+    """
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([kmg]?)(?:i?b)?(?:/s)?\s*', text or '', re.IGNORECASE)
+    if not match:
+        return None
+    factor = {'': 1, 'k': 1024, 'm': 1024 ** 2, 'g': 1024 ** 3}[match.group(2).lower()]
+    rate = float(match.group(1)) * factor
+    return rate if rate > 0 else None
+
+
+def _host_slot(url: str) -> threading.BoundedSemaphore:
+    host = urlparse(url).netloc.lower()
+    with _limits_lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = _host_slots[host] = threading.BoundedSemaphore(_per_host_limit)
+        return slot
+
+
+def _path_lock(path: str) -> threading.Lock:
+    # Two articles with the same title must not write the same file at once
+    with _limits_lock:
+        return _path_locks.setdefault(os.path.abspath(path), threading.Lock())
+
+
+def _throttle(nbytes: int):
+    bandwidth = _bandwidth
+    if bandwidth is not None:
+        bandwidth.acquire(min(nbytes, bandwidth.capacity))
+
+
 def download_pdf_from_url(url: str, output_path: str, timeout: int = 30) -> bool:
     """
     Download PDF from URL.
 
+    The file is written to output_path + '.part' and renamed into place
+    once complete. An existing .part file from an interrupted download is
+    resumed with an HTTP Range request when the server supports it.
+
     Args:
         url: PDF URL
         output_path: Output file path
@@ -93,33 +196,90 @@ def download_pdf_from_url(url: str, output_path: str, timeout: int = 30) -> bool
     Returns:
         True if successful, False otherwise
     """
+    with _path_lock(output_path):
+        if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+            return True
+
+        part_path = output_path + PART_SUFFIX
+        try:
+            with _host_slot(url):
+                return _transfer(url, output_path, part_path, timeout)
+        except Exception as e:
+            # The .part file is kept so the next attempt can resume
+            return False
+
+
+def _transfer(url: str, output_path: str, part_path: str, timeout: int) -> bool:
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
+    }
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    if offset:
+        headers['Range'] = f'bytes={offset}-'
+
+    response = http_session.get(url, headers=headers, timeout=timeout, stream=True)
+    received = 0
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=timeout, stream=True)
+        if offset and response.status_code == 416:
+            # The partial file does not match what the server has; start over
+            os.remove(part_path)
+            response.close()
+            return _transfer(url, output_path, part_path, timeout)
         response.raise_for_status()
 
-        # Check if response is actually a PDF
+        # 200 instead of 206 means the server ignored the Range header
+        resumed = bool(offset) and response.status_code == 206
+        if not resumed:
+            offset = 0
+
+        # Only check the signature if the server doesn't say it is a PDF
         content_type = response.headers.get('content-type', '').lower()
-        if 'pdf' not in content_type and 'application/octet-stream' not in content_type:
-            # Check first few bytes for PDF signature
-            first_bytes = response.content[:4]
-            if first_bytes != b'%PDF':
-                return False
-
-        # Download file
-        with open(output_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-
-        return True
-
-    except Exception as e:
-        # Clean up partial download
-        if os.path.exists(output_path):
-            os.remove(output_path)
+        sniff = not resumed and 'pdf' not in content_type and 'application/octet-stream' not in content_type
+
+        # Content-Length is only the file size when the body is not re-encoded
+        expected = None
+        if response.headers.get('content-length', '').isdigit() and \
+                response.headers.get('content-encoding', 'identity').lower() == 'identity':
+            expected = offset + int(response.headers['content-length'])
+
+        chunks = response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE)
+        first = next((chunk for chunk in chunks if chunk), b'')
+        if sniff and PDF_MAGIC not in first[:PDF_MAGIC_WINDOW]:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            return False
+
+        # Stream to the .part file; the body is never held in memory
+        with open(part_path, 'ab' if resumed else 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            for chunk in itertools.chain([first], chunks):
+                if chunk:
+                    _throttle(len(chunk))
+                    f.write(chunk)
+                    received += len(chunk)
+    finally:
+        response.close()
+        _count_transfer(received, 0)
+
+    size = os.path.getsize(part_path)
+    if size == 0:
+        # An empty body is never a usable PDF, whatever the headers said
+        os.remove(part_path)
         return False
+    if expected is not None and size != expected:
+        # Truncated transfer: keep the .part file so the next attempt resumes it
+        if size > expected:
+            os.remove(part_path)
+        raise IOError(f"incomplete download: {size} of {expected} bytes")
+
+    os.replace(part_path, output_path)
+    _count_transfer(0, 1)
+    return True
+
+
+def _count_transfer(nbytes: int, files: int):
+    with _limits_lock:
+        _transferred['bytes'] += nbytes
+        _transferred['files'] += files
 
 
 def try_pmc_download(article: Dict, output_dir: str) -> Optional[str]:
@@ -213,11 +373,49 @@ def try_doi_resolution(article: Dict, output_dir: str) -> Optional[str]:
 
     # Try common open-access patterns
     # Unpaywall API (open access)
+    pdf_url = unpaywall_pdf_url(article, doi, timeout=10)
+    if pdf_url:
+        title = article.get('title', 'article')
+        filename = sanitize_filename(f"{title[:100]}.pdf")
+        output_path = os.path.join(output_dir, filename)
+
+        if download_pdf_from_url(pdf_url, output_path):
+            return output_path
+
+    return None
+
+
+def unpaywall_pdf_url(article: Dict, doi: str, record: Optional[Dict] = None,
+                      timeout: int = 5) -> Optional[str]:
+    """
+    Ask Unpaywall for an open access PDF of a DOI.
+
+    Answers, including "no open access copy", are kept in the metadata
+    store for UNPAYWALL_TTL, so each DOI costs at most one request per week.
+
+    Args:
+        article: Article dictionary (used to file the answer in the store)
+        doi: DOI to look up
+        record: The article's metadata store record, if already loaded
+        timeout: Request timeout in seconds
+
+    Returns:
+        PDF URL or None
+    """
+    from lixplore.utils import metadata_store
+
+    if record is None:
+        record = metadata_store.find_article(dict(article, doi=doi))
+    if metadata_store.fetched_within(record, 'unpaywall', UNPAYWALL_TTL):
+        return record.get('pdf_url')
+
     try:
-        email = "lixplore@example.com"  # Replace with actual email for API
+        email = "lixplore@example.com"
         unpaywall_url = f"https://api.unpaywall.org/v2/{doi}?email={email}"
 
-        response = requests.get(unpaywall_url, timeout=10)
+        get_limiter('unpaywall', UNPAYWALL_RATE).acquire()
+        response = http_session.get(unpaywall_url, timeout=timeout)
+        pdf_url = None
         if response.status_code == 200:
             data = response.json()
 
@@ -226,17 +424,12 @@ def try_doi_resolution(article: Dict, output_dir: str) -> Optional[str]:
                 best_oa_location = data.get('best_oa_location')
                 if best_oa_location:
                     pdf_url = best_oa_location.get('url_for_pdf')
-                    if pdf_url:
-                        title = article.get('title', 'article')
-                        filename = sanitize_filename(f"{title[:100]}.pdf")
-                        output_path = os.path.join(output_dir, filename)
 
-                        if download_pdf_from_url(pdf_url, output_path):
-                            return output_path
+        if response.status_code in (200, 404):
+            metadata_store.save_articles([dict(article, doi=doi)], ['unpaywall'], extra={'pdf_url': pdf_url})
+        return pdf_url
     except:
-        pass
-
-    return None
+        return None
 
 
 def try_scihub_download(article: Dict, output_dir: str) -> Optional[str]:
@@ -268,7 +461,7 @@ def try_scihub_download(article: Dict, output_dir: str) -> Optional[str]:
         headers = {
             'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
         }
-        response = requests.get(scihub_url, headers=headers, timeout=15)
+        response = http_session.get(scihub_url, headers=headers, timeout=15)
         response.raise_for_status()
 
         # Find PDF link in page
@@ -300,6 +493,9 @@ def download_article_pdf(article: Dict, use_scihub: bool = False) -> Tuple[bool,
     3. DOI resolution (Unpaywall)
     4. SciHub (if enabled and configured)
 
+    PDFs already in the library (see pdf_library) are linked into place
+    without any network request; new downloads are added to it.
+
     Args:
         article: Article dictionary
         use_scihub: Whether to try SciHub as fallback
@@ -316,40 +512,65 @@ def download_article_pdf(article: Dict, use_scihub: bool = False) -> Tuple[bool,
     source_dir = os.path.join(PDF_DIR, sanitize_filename(source))
     os.makedirs(source_dir, exist_ok=True)
 
+    # Already in the library (by DOI, PMID, PMCID or arXiv ID): no request needed
+    stored = pdf_library.find(article)
+    if stored:
+        path = os.path.join(source_dir, sanitize_filename(f"{article.get('title', 'article')[:100]}.pdf"))
+        pdf_library.link(stored, path)
+        return True, f"Already in library: {path}"
+
+    attempts = []
     # Try PMC first (for PubMed articles)
     if source.lower() == 'pubmed':
-        result = try_pmc_download(article, source_dir)
-        if result:
-            return True, f"Downloaded from PMC: {result}"
-
-    # Try arXiv
-    result = try_arxiv_download(article, source_dir)
-    if result:
-        return True, f"Downloaded from arXiv: {result}"
-
-    # Try DOI resolution / Unpaywall
-    result = try_doi_resolution(article, source_dir)
-    if result:
-        return True, f"Downloaded (open access): {result}"
-
+        attempts.append((try_pmc_download, "Downloaded from PMC"))
+    # Then arXiv and DOI resolution / Unpaywall
+    attempts.append((try_arxiv_download, "Downloaded from arXiv"))
+    attempts.append((try_doi_resolution, "Downloaded (open access)"))
     # Try SciHub as last resort (if enabled)
     if use_scihub:
-        result = try_scihub_download(article, source_dir)
-        if result:
-            return True, f"Downloaded via SciHub: {result}"
+        attempts.append((try_scihub_download, "Downloaded via SciHub"))
+
+    for attempt, label in attempts:
+        result = attempt(article, source_dir)
+        if not result:
+            continue
+        try:
+            pdf_library.add(result, article)
+        except ValueError as e:
+            # Not indexed, so a later run tries to download it again
+            print(f"[PDF Library] Discarded {result}: {e}")
+            try:
+                os.remove(result)
+            except OSError:
+                pass
+            continue
+        except OSError as e:
+            print(f"[PDF Library] Could not store {result}: {e}")
+        return True, f"{label}: {result}"
 
     return False, f"✗ PDF not available: {title[:60]}..."
 
 
+def _format_rate(rate: float) -> str:
+    for unit, size in (('MB/s', 1024 ** 2), ('KB/s', 1024)):
+        if rate >= size:
+            return f"{rate / size:.1f} {unit}"
+    return f"{rate:.0f} B/s"
+
+
 def download_multiple_pdfs(articles: List[Dict], article_numbers: List[int] = None,
-                          use_scihub: bool = False) -> Dict[str, any]:
+                          use_scihub: bool = False, workers: int = PDF_WORKERS,
+                          per_host: int = PER_HOST_LIMIT, max_rate: float = None) -> Dict[str, any]:
     """
-    Download PDFs for multiple articles.
+    Download PDFs for multiple articles in parallel.
 
     Args:
         articles: List of article dictionaries
         article_numbers: Optional list of specific article numbers to download (1-indexed)
         use_scihub: Whether to try SciHub as fallback
+        workers: Articles downloaded at once
+        per_host: Transfers allowed at once to any single host
+        max_rate: Overall bandwidth cap in bytes per second (None = unlimited)
 
     Returns:
         Dictionary with download statistics
@@ -377,29 +598,53 @@ def download_multiple_pdfs(articles: List[Dict], article_numbers: List[int] = No
             print(f"   SciHub not configured, will skip SciHub downloads")
             print(f"   Configure with: lixplore --set-scihub-mirror <url>")
 
+    workers = max(1, workers or 1)
+    configure_downloads(per_host=per_host, max_rate=max_rate)
+    if workers > 1:
+        limits = f"   {workers} parallel downloads, at most {per_host} per host"
+        if max_rate:
+            limits += f", capped at {_format_rate(max_rate)}"
+        print(limits)
+
     print("")
 
     success_count = 0
     failed_count = 0
+    started = time.monotonic()
+    with _limits_lock:
+        bytes_before = _transferred['bytes']
+
+    # Results are reported as they finish
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(download_article_pdf, article, use_scihub) for article in to_download]
+        for i, future in enumerate(as_completed(futures), 1):
+            try:
+                success, message = future.result()
+            except Exception as e:
+                success, message = False, f"✗ Download failed: {e}"
+
+            print(f"[{i}/{len(to_download)}] {message}", flush=True)
+            if success:
+                success_count += 1
+            else:
+                failed_count += 1
 
-    for i, article in enumerate(to_download, 1):
-        print(f"[{i}/{len(to_download)}] ", end="", flush=True)
-        success, message = download_article_pdf(article, use_scihub)
-
-        if success:
-            print(message)
-            success_count += 1
-        else:
-            print(message)
-            failed_count += 1
+    elapsed = time.monotonic() - started
+    with _limits_lock:
+        transferred = _transferred['bytes'] - bytes_before
 
     print(f"\nDownload Summary: {success_count} successful, {failed_count} failed")
+    if transferred:
+        print(f"Transferred {transferred / 1024 ** 2:.1f} MB in {elapsed:.1f}s "
+              f"({_format_rate(transferred / max(elapsed, 0.001))})")
     print(f"PDFs saved to: {PDF_DIR}")
 
     return {
         'success': success_count,
         'failed': failed_count,
-        'total': len(to_download)
+        'total': len(to_download),
+        'bytes': transferred,
+        'seconds': elapsed
     }
 
 
@@ -411,78 +656,113 @@ def get_pdf_link(article: Dict) -> Optional[str]:
     2. arXiv
     3. Unpaywall (open access)
 
+    Identifiers recorded in the metadata store by other sources (e.g. the
+    PMCID of an article found through Crossref) are used as well.
+
     Args:
         article: Article dictionary with metadata
 
     Returns:
         PDF URL if available, None otherwise
     """
+    from lixplore.utils import metadata_store
+
+    # Identifiers seen for this article by any source or earlier lookup
+    record = metadata_store.find_article(article)
+    ids = dict(record.get('ids', {})) if record else {}
+    ids.update(metadata_store.article_ids(article))
+
     # Try PMC first
-    pmcid = article.get('pmcid') or article.get('pmc')
+    pmcid = ids.get('pmcid')
     if pmcid:
-        pmcid = pmcid.replace('PMC', '')
-        pmc_url = f"https://www.ncbi.nlm.nih.gov/pmc/articles/PMC{pmcid}/pdf/"
+        pmc_url = f"https://www.ncbi.nlm.nih.gov/pmc/articles/{pmcid}/pdf/"
         return pmc_url
 
-    # Try arXiv
-    arxiv_id = article.get('arxiv_id')
-    if not arxiv_id:
-        # Try to extract from URL (e.g., http://arxiv.org/abs/2306.04338v1)
-        url = article.get('url', '')
-        if 'arxiv.org' in url:
-            match = re.search(r'arxiv\.org/abs/([0-9]+\.[0-9]+(?:v[0-9]+)?)', url)
-            if match:
-                arxiv_id = match.group(1)
-
+    # Try arXiv (version suffix already removed, e.g. 2306.04338v1 -> 2306.04338)
+    arxiv_id = ids.get('arxiv')
     if arxiv_id:
-        # Remove version suffix for PDF URL (e.g., 2306.04338v1 -> 2306.04338)
-        arxiv_id_clean = re.sub(r'v\d+$', '', arxiv_id)
-        return f"https://arxiv.org/pdf/{arxiv_id_clean}.pdf"
+        return f"https://arxiv.org/pdf/{arxiv_id}.pdf"
 
     # Try Unpaywall (DOI-based)
-    doi = article.get('doi')
+    doi = ids.get('doi')
     if doi:
-        try:
-            email = "lixplore@example.com"
-            unpaywall_url = f"https://api.unpaywall.org/v2/{doi}?email={email}"
-
-            response = requests.get(unpaywall_url, timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-
-                # Check for open access PDF
-                if data.get('is_oa'):
-                    best_oa_location = data.get('best_oa_location')
-                    if best_oa_location:
-                        pdf_url = best_oa_location.get('url_for_pdf')
-                        if pdf_url:
-                            return pdf_url
-        except:
-            pass
+        return unpaywall_pdf_url(article, doi, record or {})
 
     return None
 
 
-def get_pdf_links_batch(articles: List[Dict]) -> Dict[int, str]:
+def get_pdf_links_batch(articles: List[Dict], indices: List[int] = None) -> Dict[int, str]:
     """
     Get PDF links for multiple articles efficiently.
 
+    Links are resolved concurrently (PDF_LINK_WORKERS at a time); Unpaywall
+    answers come from the metadata store when known.
+
     Args:
         articles: List of article dictionaries
+        indices: Only resolve these article indices (default: all)
 
     Returns:
         Dictionary mapping article index to PDF URL
     """
+    if indices is None:
+        indices = range(len(articles))
+    indices = [i for i in indices if 0 <= i < len(articles)]
+
     pdf_links = {}
+    if not indices:
+        return pdf_links
 
-    for i, article in enumerate(articles):
-        pdf_url = get_pdf_link(article)
-        if pdf_url:
-            pdf_links[i] = pdf_url
+    with ThreadPoolExecutor(max_workers=min(PDF_LINK_WORKERS, len(indices))) as executor:
+        for i, pdf_url in zip(indices, executor.map(_safe_pdf_link, (articles[i] for i in indices))):
+            if pdf_url:
+                pdf_links[i] = pdf_url
 
     return pdf_links
 
 
+def _safe_pdf_link(article: Dict) -> Optional[str]:
+    try:
+        return get_pdf_link(article)
+    except Exception:
+        return None
+
+
+def prefetch_pdf_links(articles: List[Dict], indices: List[int]) -> List[threading.Thread]:
+    """
+    Resolve PDF links in background threads.
+
+    Results land in the metadata store, so showing another page of the same
+    results later finds them without waiting. The threads are daemons: they
+    do not keep the program alive once everything else is done.
+
+    Args:
+        articles: List of article dictionaries
+        indices: Article indices to resolve
+
+    Returns:
+        The started threads
+    """
+    work = queue.Queue()
+    for i in indices:
+        if 0 <= i < len(articles):
+            work.put(articles[i])
+
+    def _worker():
+        while True:
+            try:
+                article = work.get_nowait()
+            except queue.Empty:
+                return
+            _safe_pdf_link(article)
+
+    threads = [threading.Thread(target=_worker, daemon=True)
+               for _ in range(min(PDF_LINK_WORKERS, work.qsize()))]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
 if __name__ == "__main__":
     # Test PDF downloader
     test_article = {
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Content-addressed PDF library.
+
+Every downloaded PDF is stored once, under its SHA-256 hash, in
+~/Lixplore_PDFs/.library/ab/abcdef....pdf. A small SQLite index maps the
+article identifiers (DOI, PMID, PMCID, arXiv ID) to those hashes. The
+human-readable files in ~/Lixplore_PDFs/<source>/ are hard links (or
+symlinks, or copies where links are not possible) onto the stored files.
+
+Before downloading, pdf_downloader asks find() whether the article is
+already in the library; if so, no network request is made.
+"""
+
+import hashlib
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from lixplore.utils import metadata_store
+
+LIBRARY_DIRNAME = ".library"
+INDEX_FILENAME = "index.db"
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+_conn = None
+_conn_dir = None
+_lock = threading.RLock()
+
+
+def library_dir() -> str:
+    """Directory holding the stored PDFs and the index."""
+    from lixplore.utils import pdf_downloader
+    return os.path.join(pdf_downloader.PDF_DIR, LIBRARY_DIRNAME)
+
+
+def _connect() -> Optional[sqlite3.Connection]:
+    """Open (and create) the index for the current library directory."""
+    global _conn, _conn_dir
+    directory = library_dir()
+    if _conn is not None and _conn_dir == directory:
+        return _conn
+    try:
+        os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(os.path.join(directory, INDEX_FILENAME), timeout=10, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS blobs ("
+            " sha256 TEXT PRIMARY KEY,"
+            " size INTEGER NOT NULL,"
+            " added REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS ids ("
+            " key TEXT PRIMARY KEY,"
+            " sha256 TEXT NOT NULL)"
+        )
+        conn.commit()
+    except (sqlite3.Error, OSError) as e:
+        print(f"[PDF Library] Index unavailable: {e}")
+        return None
+    if _conn is not None:
+        _conn.close()
+    _conn, _conn_dir = conn, directory
+    return _conn
+
+
+def blob_path(sha256: str) -> str:
+    """Path of the stored file for a hash."""
+    return os.path.join(library_dir(), sha256[:2], f"{sha256}.pdf")
+
+
+def file_hash(path: str) -> str:
+    """SHA-256 of a file, read in large chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _id_keys(article: Dict) -> list:
+    """Identifier keys of an article, including those known to the metadata store."""
+    record = metadata_store.find_article(article)
+    ids = dict(record.get('ids', {})) if record else {}
+    ids.update(metadata_store.article_ids(article))
+    return [f"{kind}:{ids[kind]}" for kind in metadata_store.ID_KINDS if kind in ids]
+
+
+def find(article: Dict) -> Optional[str]:
+    """
+    Return the stored PDF for an article, if the library has it.
+
+    Args:
+        article: Article dictionary
+
+    Returns:
+        Path of the stored file, or None
+    """
+    keys = _id_keys(article)
+    if not keys:
+        return None
+
+    with _lock:
+        conn = _connect()
+        if conn is None:
+            return None
+        try:
+            rows = conn.execute(
+                f"SELECT key, sha256 FROM ids WHERE key IN ({','.join('?' * len(keys))})", keys
+            ).fetchall()
+        except sqlite3.Error:
+            return None
+
+    hashes = dict(rows)
+    for key in keys:
+        sha256 = hashes.get(key)
+        if sha256 and os.path.exists(blob_path(sha256)):
+            return blob_path(sha256)
+    return None
+
+
+def link(blob: str, path: str):
+    """
+    Make a human-readable name for a stored file.
+
+    Uses a hard link, then a symlink, and copies the file as a last resort
+    (e.g. on file systems without link support).
+    """
+    if os.path.lexists(path):
+        try:
+            if os.path.samefile(blob, path):
+                return
+        except OSError:
+            pass
+        os.remove(path)
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    try:
+        os.link(blob, path)
+        return
+    except OSError:
+        pass
+    try:
+        os.symlink(blob, path)
+        return
+    except OSError:
+        pass
+    shutil.copy2(blob, path)
+
+
+def is_pdf(path: str) -> bool:
+    """True if a file is non-empty and starts like a PDF."""
+    from lixplore.utils import pdf_downloader
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(pdf_downloader.PDF_MAGIC_WINDOW)
+    except OSError:
+        return False
+    return pdf_downloader.PDF_MAGIC in head
+
+
+def add(path: str, article: Dict) -> str:
+    """
+    Move a downloaded PDF into the library and link its name back to it.
+
+    If the same content is already stored (e.g. a preprint and its DOI
+    record), the new file is dropped in favour of the stored one.
+
+    Args:
+        path: Downloaded file
+        article: Article the file belongs to
+
+    Returns:
+        The same path, now a link onto the stored file
+
+    Raises:
+        ValueError: If the file is empty or not a PDF; it is not stored
+    """
+    if not is_pdf(path):
+        raise ValueError("empty file or not a PDF")
+
+    sha256 = file_hash(path)
+    blob = blob_path(sha256)
+
+    with _lock:
+        os.makedirs(os.path.dirname(blob), exist_ok=True)
+        if not os.path.exists(blob):
+            if os.path.islink(path):
+                shutil.copy2(path, blob)
+            else:
+                os.replace(path, blob)
+        link(blob, path)
+
+        conn = _connect()
+        if conn is not None:
+            try:
+                conn.execute(
+                    "INSERT OR IGNORE INTO blobs (sha256, size, added) VALUES (?, ?, ?)",
+                    (sha256, os.path.getsize(blob), time.time())
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO ids (key, sha256) VALUES (?, ?)",
+                    [(key, sha256) for key in _id_keys(article)]
+                )
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+    return path
+
+
+def stats() -> Tuple[int, int]:
+    """
+    Return the number of stored PDFs and their total size in bytes.
+    """
+    with _lock:
+        conn = _connect()
+        if conn is None:
+            return 0, 0
+        try:
+            count, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs").fetchone()
+            return count, size
+        except sqlite3.Error:
+            return 0, 0
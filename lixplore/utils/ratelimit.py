@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Token-bucket rate limiters shared across threads.
+
+Concurrent workers that talk to the same API (e.g. NCBI E-utilities, which
+allow 3 requests/second, or 10 with an API key) take a token before every
+request. Limiters are looked up by name so that all callers in the process
+share one budget per API.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at `rate` per second up to `capacity`;
+    acquire() blocks until a token is available.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Tokens added per second (requests per second)
+            capacity: Maximum burst size (default: one second's worth, at least 1)
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """
+        Take tokens, waiting for them if necessary.
+
+        Args:
+            tokens: Number of tokens to take
+            timeout: Maximum seconds to wait (None = wait as long as needed)
+
+        Returns:
+            True if the tokens were taken, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+                wait = (tokens - self._tokens) / self.rate
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+    def set_rate(self, rate: float, capacity: Optional[float] = None):
+        """Change the refill rate (e.g. once an API key is known)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = float(rate)
+            self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+            self._tokens = min(self._tokens, self.capacity)
+
+
+_limiters: Dict[str, TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(name: str, rate: float, capacity: Optional[float] = None) -> TokenBucket:
+    """
+    Return the process-wide limiter for an API, creating it on first use.
+
+    Args:
+        name: API name, e.g. 'ncbi' or 'crossref'
+        rate: Requests per second (used when the limiter is created)
+        capacity: Maximum burst size
+
+    Returns:
+        Shared TokenBucket
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = _limiters[name] = TokenBucket(rate, capacity)
+        return limiter
@@ -11,7 +11,7 @@ Provides one-click adding of articles to reference libraries.
 """
 
 import os
-import requests
+from lixplore.utils import http_session
 import json
 from typing import List, Dict, Optional
 
@@ -171,7 +171,7 @@ def add_to_zotero(articles: List[Dict], collection_key: Optional[str] = None) ->
                 zotero_item['collections'] = [collection_key]
 
             # Send to Zotero API
-            response = requests.post(
+            response = http_session.post(
                 base_url,
                 headers=headers,
                 json=[zotero_item],
@@ -259,7 +259,7 @@ def show_zotero_collections() -> List[Dict]:
     }
 
     try:
-        response = requests.get(url, headers=headers, timeout=15)
+        response = http_session.get(url, headers=headers, timeout=15)
         response.raise_for_status()
 
         collections = response.json()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+On-disk store for search result sets.
+
+A result set is written as two files in ~/.lixplore_cache/results/:
+
+* <name>.jsonl - a header line (timestamp, query, sources, count) followed
+  by one JSON article per line
+* <name>.idx   - the byte offset of every article line, as little-endian
+  unsigned 64-bit integers, plus the end offset of the last line
+
+Reading memory-maps both files and decodes only the articles that are
+asked for, so `lixplore -R 5` costs the same whether the last search
+returned ten results or ten thousand.
+"""
+
+import json
+import mmap
+import os
+import struct
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from lixplore.utils.cache import CACHE_DIR
+
+RESULTS_DIR = os.path.join(CACHE_DIR, "results")
+LAST_RESULTS = "last"
+
+DATA_SUFFIX = ".jsonl"
+INDEX_SUFFIX = ".idx"
+
+_OFFSET = struct.Struct("<Q")
+
+
+def result_paths(name: str = LAST_RESULTS):
+    """Data and index file paths of a result set."""
+    base = os.path.join(RESULTS_DIR, name)
+    return base + DATA_SUFFIX, base + INDEX_SUFFIX
+
+
+def save(results: Iterable[Dict], name: str = LAST_RESULTS, query: str = None,
+         sources: List[str] = None) -> Dict:
+    """
+    Write a result set, replacing any previous set with the same name.
+
+    Args:
+        results: Article dictionaries
+        name: Result set name
+        query: Search query string (optional)
+        sources: List of sources searched (optional)
+
+    Returns:
+        The header stored with the results
+    """
+    results = list(results)
+    header = {
+        "timestamp": datetime.now().isoformat(),
+        "query": query,
+        "sources": sources,
+        "count": len(results),
+    }
+
+    data_path, index_path = result_paths(name)
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    data_tmp, index_tmp = data_path + ".tmp", index_path + ".tmp"
+
+    offsets = []
+    with open(data_tmp, "wb") as f:
+        f.write(json.dumps(header, ensure_ascii=False).encode("utf-8") + b"\n")
+        for article in results:
+            offsets.append(f.tell())
+            f.write(json.dumps(article, ensure_ascii=False).encode("utf-8") + b"\n")
+        offsets.append(f.tell())
+
+    with open(index_tmp, "wb") as f:
+        f.write(b"".join(_OFFSET.pack(offset) for offset in offsets))
+
+    # The index is checked against the data file on open, so a reader that
+    # catches the pair halfway through the swap rebuilds it instead of
+    # reading wrong offsets.
+    os.replace(data_tmp, data_path)
+    os.replace(index_tmp, index_path)
+    return header
+
+
+class ResultSet(Sequence):
+    """
+    Read-only, lazily decoded view of a stored result set.
+
+    Supports len(), indexing, slicing and iteration like a list of article
+    dictionaries; only the records that are accessed are parsed.
+    """
+
+    def __init__(self, data_path: str, index_path: str):
+        self._data_file = open(data_path, "rb")
+        self._data = mmap.mmap(self._data_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header_end = self._data.find(b"\n")
+        self.header = json.loads(self._data[:header_end if header_end >= 0 else None])
+        self._offsets = self._load_index(index_path, header_end + 1)
+
+    def _load_index(self, index_path: str, first: int):
+        """Map the offset index, rebuilding it if it does not match the data."""
+        count = self.header.get("count", 0)
+        try:
+            with open(index_path, "rb") as f:
+                index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if (len(index) == (count + 1) * _OFFSET.size
+                    and _OFFSET.unpack_from(index, 0)[0] == first
+                    and _OFFSET.unpack_from(index, count * _OFFSET.size)[0] == len(self._data)):
+                return index
+            index.close()
+        except (OSError, ValueError):
+            pass
+
+        offsets = []
+        position = first
+        while position < len(self._data):
+            offsets.append(position)
+            end = self._data.find(b"\n", position)
+            position = len(self._data) if end < 0 else end + 1
+        offsets.append(len(self._data))
+        return b"".join(_OFFSET.pack(offset) for offset in offsets)
+
+    def _offset(self, index: int) -> int:
+        """Byte offset of an article line (index == len gives the end of the data)."""
+        return _OFFSET.unpack_from(self._offsets, index * _OFFSET.size)[0]
+
+    @property
+    def meta(self) -> Dict:
+        """Header of the result set (timestamp, query, sources, count)."""
+        return self.header
+
+    def __len__(self) -> int:
+        return len(self._offsets) // _OFFSET.size - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("result index out of range")
+        return json.loads(self._data[self._offset(index):self._offset(index + 1)])
+
+    def close(self):
+        """Release the memory map and file."""
+        if isinstance(self._offsets, mmap.mmap):
+            self._offsets.close()
+        self._data.close()
+        self._data_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load(name: str = LAST_RESULTS) -> Optional[ResultSet]:
+    """
+    Open a stored result set.
+
+    Args:
+        name: Result set name
+
+    Returns:
+        ResultSet, or None if there is no such set or it cannot be read
+    """
+    data_path, index_path = result_paths(name)
+    if not os.path.exists(data_path):
+        return None
+    try:
+        return ResultSet(data_path, index_path)
+    except (OSError, ValueError) as e:
+        print(f"Error loading cached results: {e}")
+        return None
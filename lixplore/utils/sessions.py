@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Named result sessions.
+
+Every search is kept as a session: a result set in the result store
+(lixplore/utils/result_store.py) plus a small entry in
+~/.lixplore_cache/results/sessions.json with its query, sources, timestamp,
+size and when it was last used. Searches get a number (1, 2, 3, ...) unless
+--session NAME gives them a name; the most recent search is the current
+session, which is what `lixplore -R 1` and friends read by default.
+
+When there are more than MAX_SESSIONS sessions or they take more than
+MAX_SESSIONS_BYTES on disk, the least recently used ones are evicted,
+numbered sessions before named ones.
+
+Changes to the index are made under a lock file, so concurrent lixplore
+processes (e.g. a shell and a CLI run) never claim the same session number
+or lose each other's entries.
+"""
+
+import json
+import os
+import re
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from lixplore.utils import result_store
+
+try:
+    import fcntl
+except ImportError:  # Windows: only threads of this process are serialized
+    fcntl = None
+
+SESSIONS_FILE = os.path.join(result_store.RESULTS_DIR, "sessions.json")
+SESSIONS_LOCK = SESSIONS_FILE + ".lock"
+
+MAX_SESSIONS = 20
+MAX_SESSIONS_BYTES = 256 * 1024 * 1024
+
+_VALID_NAME = re.compile(r'^[A-Za-z0-9][A-Za-z0-9._-]{0,63}$')
+
+
+def valid_name(name: str) -> bool:
+    """Session names are used in file names: letters, digits, '.', '_' and '-'."""
+    return bool(_VALID_NAME.match(name or ""))
+
+
+def _store_name(name: str) -> str:
+    return f"session-{name}"
+
+
+_thread_lock = threading.Lock()
+
+
+@contextmanager
+def _locked():
+    """Hold the session index lock (across threads and processes)."""
+    with _thread_lock:
+        os.makedirs(result_store.RESULTS_DIR, exist_ok=True)
+        with open(SESSIONS_LOCK, "a") as f:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _newest(index: Dict) -> Optional[str]:
+    """Most recently created session, or None."""
+    sessions = index["sessions"]
+    if not sessions:
+        return None
+    return max(sessions, key=lambda name: sessions[name].get("timestamp", ""))
+
+
+def _load_index() -> Dict:
+    """Read the session index."""
+    try:
+        with open(SESSIONS_FILE, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if isinstance(index, dict):
+            index.setdefault("sessions", {})
+            index.setdefault("next_id", 1)
+            return index
+    except (json.JSONDecodeError, IOError):
+        pass
+    return {"current": None, "next_id": 1, "sessions": {}}
+
+
+def _save_index(index: Dict):
+    """Write the session index (a small file, replaced atomically)."""
+    os.makedirs(result_store.RESULTS_DIR, exist_ok=True)
+    tmp = SESSIONS_FILE + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, SESSIONS_FILE)
+
+
+def _remove_files(name: str):
+    for path in result_store.result_paths(_store_name(name)):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _evict(index: Dict, keep: str) -> List[str]:
+    """Drop least recently used sessions until the limits are met."""
+    sessions = index["sessions"]
+
+    def over_limits():
+        total = sum(entry.get("bytes", 0) for entry in sessions.values())
+        return len(sessions) > MAX_SESSIONS or total > MAX_SESSIONS_BYTES
+
+    # Numbered sessions go first, then named ones; oldest use first
+    candidates = sorted(
+        (name for name in sessions if name != keep),
+        key=lambda name: (not sessions[name].get("numbered"), sessions[name].get("last_used", ""))
+    )
+    evicted = []
+    for name in candidates:
+        if not over_limits():
+            break
+        sessions.pop(name)
+        _remove_files(name)
+        evicted.append(name)
+    return evicted
+
+
+def save(results, query: str = None, sources: List[str] = None, name: str = None) -> Optional[str]:
+    """
+    Store a result set as a session and make it the current one.
+
+    Args:
+        results: List of article dictionaries
+        query: Search query string (optional)
+        sources: List of sources searched (optional)
+        name: Session name (default: the next free number)
+
+    Returns:
+        The session name, or None if the name is invalid
+    """
+    numbered = not name
+    if not numbered and not valid_name(name):
+        print(f"Error: Invalid session name '{name}' (use letters, digits, '.', '_' and '-')")
+        return None
+
+    with _locked():
+        index = _load_index()
+        if numbered:
+            while str(index["next_id"]) in index["sessions"]:
+                index["next_id"] += 1
+            name = str(index["next_id"])
+            index["next_id"] += 1
+
+        header = result_store.save(results, name=_store_name(name), query=query, sources=sources)
+        data_path, index_path = result_store.result_paths(_store_name(name))
+        index["sessions"][name] = {
+            "query": query,
+            "sources": sources,
+            "timestamp": header["timestamp"],
+            "count": header["count"],
+            "bytes": os.path.getsize(data_path) + os.path.getsize(index_path),
+            "numbered": numbered,
+            "last_used": header["timestamp"],
+        }
+        index["current"] = name
+        _evict(index, keep=name)
+        _save_index(index)
+    return name
+
+
+def load(name: str = None, touch: bool = True) -> Tuple[Optional[str], Optional[result_store.ResultSet]]:
+    """
+    Open a session's results.
+
+    Args:
+        name: Session name or number (default: the current session)
+        touch: Record the access for LRU eviction
+
+    Returns:
+        Tuple of (session name, ResultSet); (None, None) if not found
+    """
+    index = _load_index()
+    if name is None:
+        name = index.get("current") or _newest(index)
+        if name is None:
+            if os.path.exists(SESSIONS_FILE):
+                return None, None
+            # Results cached before sessions existed
+            return None, result_store.load(result_store.LAST_RESULTS)
+
+    if name not in index["sessions"]:
+        return None, None
+    results = result_store.load(_store_name(name))
+    if results is None:
+        with _locked():
+            index = _load_index()
+            index["sessions"].pop(name, None)
+            _save_index(index)
+        return None, None
+
+    if touch:
+        with _locked():
+            index = _load_index()
+            if name in index["sessions"]:
+                index["sessions"][name]["last_used"] = datetime.now().isoformat()
+                _save_index(index)
+    return name, results
+
+
+def list_sessions() -> Tuple[Optional[str], List[Tuple[str, Dict]]]:
+    """
+    Return the current session name and all sessions, most recent first.
+    """
+    index = _load_index()
+    sessions = sorted(index["sessions"].items(), key=lambda item: item[1].get("timestamp", ""), reverse=True)
+    return index.get("current"), sessions
+
+
+def delete(name: str) -> bool:
+    """Delete a session and its results."""
+    with _locked():
+        index = _load_index()
+        if name not in index["sessions"]:
+            return False
+        index["sessions"].pop(name)
+        _remove_files(name)
+        if index.get("current") == name:
+            index["current"] = _newest(index)
+        _save_index(index)
+    return True
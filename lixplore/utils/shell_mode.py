@@ -65,11 +65,13 @@ class LixploreShell(cmd.Cmd):
             -P, --pubmed        Search PubMed
             -A, --all           Search all sources
             -C, --crossref      Search Crossref
+            -J, --doaj          Search DOAJ
             -E, --europepmc     Search EuropePMC
             -x, --arxiv         Search arXiv
             -m, --max N         Maximum results (default: 10)
             -a, --abstract      Show abstracts
             -D, --dedup         Remove duplicates
+            -n, --new           Only show articles not found by earlier searches in this shell
 
         Examples:
             search cancer treatment -P -m 20
@@ -85,12 +87,7 @@ class LixploreShell(cmd.Cmd):
             # Parse arguments
             args = shlex.split(arg)
 
-            # Build command for dispatcher
-            from lixplore import dispatcher
-
-            # Create a namespace object to mimic argparse
-            import argparse
-            ns = argparse.Namespace()
+            from lixplore.service import get_service
 
             # Extract query (everything before first -)
             query_parts = []
@@ -107,67 +104,52 @@ class LixploreShell(cmd.Cmd):
 
             query = ' '.join(query_parts)
 
-            # Set defaults
-            ns.query = query
-            ns.pubmed = '-P' in options or '--pubmed' in options
-            ns.all = '-A' in options or '--all' in options
-            ns.crossref = '-C' in options or '--crossref' in options
-            ns.europepmc = '-E' in options or '--europepmc' in options
-            ns.arxiv = '-x' in options or '--arxiv' in options
-            ns.abstract = '-a' in options or '--abstract' in options
-            ns.dedup = '-D' in options or '--dedup' in options
-            ns.dedup_threshold = None
-            ns.dedup_keep = None
-            ns.dedup_merge = False
-            ns.interactive = False
-            ns.author = None
-            ns.doi = None
-            ns.date = None
-            ns.sort = None
-            ns.enrich = None
-            ns.stat = False
-            ns.stat_top = None
-            ns.page = None
-            ns.page_size = None
-            ns.show_pdf_links = False
-            ns.export = None
-            ns.output = None
-            ns.selection = None
-            ns.export_fields = None
-            ns.zip = False
-            ns.color = None
-            ns.custom_api = None
-            ns.sources = None
+            # Selected sources
+            source_flags = {
+                'pubmed': ('-P', '--pubmed'),
+                'crossref': ('-C', '--crossref'),
+                'doaj': ('-J', '--doaj'),
+                'europepmc': ('-E', '--europepmc'),
+                'arxiv': ('-x', '--arxiv'),
+                'all': ('-A', '--all'),
+            }
+            sources = [source for source, flags in source_flags.items()
+                       if any(flag in options for flag in flags)]
+            dedup = '-D' in options or '--dedup' in options
+            show_abstracts = '-a' in options or '--abstract' in options
+            only_new = '-n' in options or '--new' in options
 
             # Parse max results
-            if '-m' in options:
-                idx = options.index('-m')
-                if idx + 1 < len(options):
-                    ns.max_results = int(options[idx + 1])
-                else:
-                    ns.max_results = 10
-            elif '--max' in options:
-                idx = options.index('--max')
-                if idx + 1 < len(options):
-                    ns.max_results = int(options[idx + 1])
-                else:
-                    ns.max_results = 10
-            else:
-                ns.max_results = 10
+            max_results = 10
+            for flag in ('-m', '--max'):
+                if flag in options:
+                    idx = options.index(flag)
+                    if idx + 1 < len(options):
+                        max_results = int(options[idx + 1])
 
             # Check if any source selected
-            if not any([ns.pubmed, ns.all, ns.crossref, ns.europepmc, ns.arxiv]):
-                ns.pubmed = True  # Default to PubMed
+            if not sources:
+                sources = ['pubmed']  # Default to PubMed
 
             print(f"\nSearching for: '{query}'")
-            print(f"Max results: {ns.max_results}")
+            print(f"Max results: {max_results}")
             print()
 
-            # Execute search
-            results = dispatcher.execute_search(ns)
+            # Execute search (the shared service keeps connections and caches warm)
+            results = get_service().search(
+                query,
+                sources=sources,
+                limit=max_results,
+                dedup='auto' if dedup else None,
+                only_new=only_new
+            )
 
             if results:
                 self.last_results = results
+                for i, article in enumerate(results, 1):
+                    print(f"[{i}] {article.get('title', 'No title')} ({article.get('year', 'N/A')})")
+                    if show_abstracts and article.get('abstract'):
+                        print(f"    {article['abstract']}\n")
                 print(f"\nFound {len(results)} articles (stored for annotation)")
                 print("Use 'annotate <N>' to annotate an article")
                 print("Use 'list' to see all results")
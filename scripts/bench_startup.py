@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark for the lixplore CLI.
+
+Runs commands that never touch the network (--help, --history,
+--list-profiles) in fresh interpreters and fails if
+
+  * the median wall-clock time of any command exceeds the budget, or
+  * importing the CLI and building its parser loads a heavy module
+    (Biopython, requests, openpyxl, ...).
+
+Usage:
+    python scripts/bench_startup.py                # default budget
+    python scripts/bench_startup.py --budget 0.8   # seconds per command
+    python scripts/bench_startup.py --runs 10
+
+The budget can also be set with LIXPLORE_STARTUP_BUDGET.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# Median seconds per command; generous enough for slow CI runners
+DEFAULT_BUDGET = 1.5
+DEFAULT_RUNS = 5
+
+COMMANDS = [
+    ["--help"],
+    ["--history"],
+    ["--list-profiles"],
+]
+
+# Modules that must only be imported once a search or export needs them
+HEAVY_MODULES = [
+    "Bio",
+    "requests",
+    "urllib3",
+    "openpyxl",
+    "lixplore.sources.pubmed",
+    "lixplore.utils.export",
+]
+
+IMPORT_CHECK = """
+import argparse, sys
+from lixplore import cli, commands
+parser = argparse.ArgumentParser()
+commands.add_commands(parser)
+heavy = {heavy!r}
+print(",".join(m for m in heavy if m in sys.modules))
+"""
+
+
+def _run(argv, env):
+    start = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-m", "lixplore.cli"] + argv,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, env=env, check=False
+    )
+    elapsed = time.perf_counter() - start
+    # A command that crashes early would otherwise look fast
+    if out.returncode != 0:
+        raise RuntimeError(
+            f"lixplore {' '.join(argv)} exited with status {out.returncode}:\n{out.stderr.strip()}"
+        )
+    return elapsed
+
+
+def check_imports(env):
+    """Return the heavy modules loaded just by importing the CLI."""
+    code = IMPORT_CHECK.format(heavy=HEAVY_MODULES)
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=False
+    )
+    if out.returncode != 0:
+        raise RuntimeError(f"importing the CLI failed:\n{out.stderr.strip()}")
+    loaded = out.stdout.strip()
+    return loaded.split(",") if loaded else []
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark lixplore CLI startup time")
+    parser.add_argument(
+        "--budget", type=float,
+        default=float(os.environ.get("LIXPLORE_STARTUP_BUDGET", DEFAULT_BUDGET)),
+        help="Maximum median seconds per command"
+    )
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="Runs per command")
+    args = parser.parse_args()
+
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    failed = False
+
+    # Isolated HOME so the benchmark neither reads nor writes real user data
+    with tempfile.TemporaryDirectory() as home:
+        env = dict(os.environ)
+        env["HOME"] = home
+        env["USERPROFILE"] = home
+        env["PYTHONPATH"] = repo_root + os.pathsep + env.get("PYTHONPATH", "")
+
+        try:
+            loaded = check_imports(env)
+        except RuntimeError as e:
+            print(f"FAIL  {e}")
+            return 1
+
+        if loaded:
+            print(f"FAIL  heavy modules imported at startup: {', '.join(loaded)}")
+            failed = True
+        else:
+            print("ok    no heavy modules imported at startup")
+
+        # Warm-up run so bytecode compilation isn't measured
+        try:
+            _run(["--help"], env)
+        except RuntimeError as e:
+            print(f"FAIL  {e}")
+            return 1
+
+        for argv in COMMANDS:
+            try:
+                times = [_run(argv, env) for _ in range(args.runs)]
+            except RuntimeError as e:
+                print(f"FAIL  {e}")
+                failed = True
+                continue
+            median = statistics.median(times)
+            status = "ok  " if median <= args.budget else "FAIL"
+            if median > args.budget:
+                failed = True
+            print(f"{status}  lixplore {' '.join(argv):<16} median {median * 1000:7.1f} ms "
+                  f"(min {min(times) * 1000:.1f} ms, budget {args.budget * 1000:.0f} ms)")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())